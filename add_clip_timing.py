@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Build audio/timing.json for clips that are already generated
+
+generate_audio.py writes the timing table as it goes; this backfills it for
+an existing audio directory (e.g. the committed ElevenLabs mp3s). Durations
+come from the files themselves. Word starts are aligned from the audio when
+it can be decoded (WAV, or anything with ffmpeg installed) and otherwise
+spread over the clip by word length.
+"""
+import argparse
+from pathlib import Path
+
+from audio_clips import clip_timing, write_timing_table
+from audio_manifest import load
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure clip durations and word starts into audio/timing.json')
+    parser.add_argument('--audio-dir', default='audio')
+    args = parser.parse_args()
+
+    audio_dir = Path(args.audio_dir)
+    manifest_path = audio_dir / 'manifest.json'
+    if not manifest_path.exists():
+        print(f"❌ {manifest_path} not found. Run generate_audio.py first.")
+        return
+
+    manifest = load(manifest_path)
+
+    timings = {}
+    missing = 0
+    for entry in manifest.files:
+        file_path = audio_dir / entry.filename
+        if not file_path.exists():
+            missing += 1
+            continue
+        if entry.filename not in timings:
+            timings[entry.filename] = clip_timing(file_path, entry.clean_text)
+
+    write_timing_table(timings, audio_dir / 'timing.json')
+
+    total_seconds = sum(timing['duration_ms'] for timing in timings.values()) / 1000
+    print(f"⏱️  Measured {len(timings)} clips ({total_seconds:.1f}s of speech)")
+    if missing:
+        print(f"⚠️  {missing} manifest entries have no audio file")
+    print(f"📋 Clip timing saved to: {audio_dir / 'timing.json'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,16 +1,137 @@
 // ElevenLabs Audio System for Game Speech
 // Uses pre-generated ElevenLabs audio files on all platforms
 
+// Least-recently-used clip cache with a budget on decoded bytes and on total
+// clip duration. Pinned clips are skipped by eviction.
+class ClipCache {
+    constructor({ maxBytes, maxDurationMs }) {
+        this.maxBytes = maxBytes;
+        this.maxDurationMs = maxDurationMs;
+        this.entries = new Map(); // key -> { value, bytes, durationMs }, least recently used first
+        this.pinned = new Set();
+        this.bytes = 0;
+        this.durationMs = 0;
+        this.stats = { hits: 0, misses: 0, evictions: 0 };
+        this.onEvict = null; // (key, value) => void
+    }
+    
+    has(key) {
+        return this.entries.has(key);
+    }
+    
+    // Counts a hit or a miss and marks the entry as most recently used
+    get(key) {
+        const entry = this.entries.get(key);
+        if (!entry) {
+            this.stats.misses++;
+            return undefined;
+        }
+        this.stats.hits++;
+        this.entries.delete(key);
+        this.entries.set(key, entry);
+        return entry.value;
+    }
+    
+    set(key, value, bytes = 0, durationMs = 0) {
+        this.delete(key);
+        this.entries.set(key, { value, bytes, durationMs });
+        this.bytes += bytes;
+        this.durationMs += durationMs;
+        this.evict();
+    }
+    
+    // Record an entry's size once it's known (e.g. after decoding)
+    resize(key, bytes, durationMs) {
+        const entry = this.entries.get(key);
+        if (!entry) return;
+        this.bytes += bytes - entry.bytes;
+        this.durationMs += durationMs - entry.durationMs;
+        entry.bytes = bytes;
+        entry.durationMs = durationMs;
+        this.evict();
+    }
+    
+    delete(key) {
+        const entry = this.entries.get(key);
+        if (!entry) return;
+        this.entries.delete(key);
+        this.bytes -= entry.bytes;
+        this.durationMs -= entry.durationMs;
+    }
+    
+    // Replace the pinned set
+    pin(keys) {
+        this.pinned = new Set(keys);
+        this.evict();
+    }
+    
+    evict() {
+        for (const [key, entry] of this.entries) {
+            if (this.bytes <= this.maxBytes && this.durationMs <= this.maxDurationMs) break;
+            if (this.pinned.has(key)) continue;
+            this.delete(key);
+            this.stats.evictions++;
+            if (this.onEvict) this.onEvict(key, entry.value);
+        }
+    }
+}
+
 class MobileAudioSystem {
     constructor() {
-        this.audioCache = new Map();
+        // Decoded clips are large (about 11 MB per minute at 48 kHz),
+        // so both caches are bounded; see enterScene() for what's kept
+        this.cacheBudget = { maxBytes: 32 * 1024 * 1024, maxDurationMs: 3 * 60 * 1000 };
+        this.audioCache = new ClipCache(this.cacheBudget); // audio path -> loaded <audio> element (element engine)
+        this.audioCache.onEvict = (path, audio) => {
+            // Drop the element's media data, not just our reference to it
+            audio.removeAttribute('src');
+            audio.load();
+        };
+        this.bufferCache = new ClipCache(this.cacheBudget); // audio path -> Promise of a decoded AudioBuffer (webaudio engine)
+        this.sceneClips = []; // audio paths of each scene's lines, in scene order (audio/scenes.json)
+        this.clipScenes = new Map(); // audio path -> index into sceneClips
+        this.currentScene = null;
+        this.prefetchDepth = 3; // upcoming lines loaded while the current one plays
+        this.prefetching = new Map(); // audio path -> AbortController of a lookahead load
         this.currentAudio = null;
+        this.currentSource = null;
+        this.audioContext = null; // shared by all playback, created on first use
+        this.outputGain = null;
+        this.playbackEngine = this.choosePlaybackEngine(); // 'webaudio' or 'element'
+        this.startLatencies = { preloaded: [], cold: [] };
+        this.firstSpeechMarked = false;
         this.audioManifest = null;
+        this.embeddedJson = null; // path -> data embedded in index.html by build_bundle.py
+        this.clipTimings = new Map(); // audio path -> { durationMs, wordStarts } from audio/timing.json
+        this.clipVariants = new Map(); // audio path -> codec variants from the manifest, smallest first
+        this.clipsById = new Map(); // clip ID -> manifest entry, for call sites resolved at build time
+        this.playableTypes = new Map(); // MIME type -> whether this browser can play it
+        this.tierHeadroom = 8; // a tier's bitrate must fit this many times into measured throughput
+        this.slowLoadMs = 4000; // give up on a tier after this long and try a lower one
+        this.throughputKbps = this.initialThroughputEstimate(); // smoothed clip download speed
+        this.audioTierKbps = null;
+        this.onWord = null; // (wordIndex, text, character) => void, fired as each word starts
         this.isMobile = this.detectMobile();
         this.audioEnabled = true;
         this.audioUnlocked = false;
         this.useElevenLabsEverywhere = true; // Force ElevenLabs audio on all platforms
         this.loadAudioManifest();
+        
+        if (navigator.connection) {
+            navigator.connection.addEventListener('change', () => {
+                this.throughputKbps = this.initialThroughputEstimate();
+            });
+        }
+    }
+    
+    // Decoded AudioBuffers start faster than <audio> elements, especially on
+    // iOS; ?audio=element forces the element path (used by the benchmark)
+    choosePlaybackEngine() {
+        const requested = new URLSearchParams(window.location.search).get('audio');
+        if (requested === 'element' || !(window.AudioContext || window.webkitAudioContext)) {
+            return 'element';
+        }
+        return 'webaudio';
     }
     
     detectMobile() {
@@ -18,25 +139,199 @@ class MobileAudioSystem {
                window.innerWidth <= 768;
     }
     
+    // build_bundle.py embeds the manifest, timing table and scene index in
+    // index.html so the first line doesn't wait on them; otherwise fetch them
+    async fetchJson(path) {
+        const embedded = document.getElementById('audio-index');
+        if (embedded) {
+            this.embeddedJson = this.embeddedJson || JSON.parse(embedded.textContent);
+            if (path in this.embeddedJson) return this.embeddedJson[path];
+        }
+        const response = await fetch(path);
+        return response.ok ? response.json() : null;
+    }
+    
     async loadAudioManifest() {
         try {
-            const response = await fetch('./audio/manifest.json');
-            if (response.ok) {
-                this.audioManifest = await response.json();
-                console.log(`🎵 Loaded audio manifest with ${this.audioManifest.total_files} files`);
+            this.audioManifest = await this.fetchJson('./audio/manifest.json');
+            if (this.audioManifest) {
+                log.info(`🎵 Loaded audio manifest with ${this.audioManifest.total_files} files`);
+                
+                for (const file of this.audioManifest.files) {
+                    this.clipsById.set(file.id, file);
+                    if (file.variants && file.variants.length > 0) {
+                        this.clipVariants.set(`./audio/${file.filename}`, file.variants);
+                    }
+                }
+                
+                // Real clip durations and word starts, used to pace dialogue
+                this.loadClipTimings();
+                this.loadSceneIndex();
                 
                 // Start preloading critical audio files immediately
                 this.preloadCriticalAudio();
             } else {
-                console.warn('⚠️  Audio manifest not found, falling back to text-to-speech');
-                this.audioManifest = null;
+                log.warn('⚠️  Audio manifest not found, falling back to text-to-speech');
             }
         } catch (error) {
-            console.warn('⚠️  Failed to load audio manifest:', error);
+            log.warn('⚠️  Failed to load audio manifest:', error);
             this.audioManifest = null;
         }
     }
     
+    async loadClipTimings() {
+        try {
+            const table = await this.fetchJson('./audio/timing.json');
+            if (!table) return;
+            
+            for (const [filename, row] of Object.entries(table.clips)) {
+                // Each row is [duration_ms, word_start_ms, ...]
+                this.clipTimings.set(`./audio/${filename}`, { durationMs: row[0], wordStarts: row.slice(1) });
+            }
+            log.info(`⏱️ Loaded timing for ${this.clipTimings.size} clips`);
+        } catch (error) {
+            log.warn('⚠️ Failed to load clip timing, using estimates:', error);
+        }
+    }
+    
+    // Which clips belong to which scene, written by build_bundle.py. Without
+    // it (running the sources directly) the caches are plain LRUs.
+    async loadSceneIndex() {
+        try {
+            const index = await this.fetchJson('./audio/scenes.json');
+            if (!index) return;
+            
+            this.sceneClips = index.scenes.map(scene => scene.clips.map(id => this.getClipPath(id)).filter(Boolean));
+            this.sceneClips.forEach((paths, sceneIndex) => {
+                paths.forEach(path => {
+                    if (!this.clipScenes.has(path)) this.clipScenes.set(path, sceneIndex);
+                });
+            });
+            log.info(`🎬 Loaded ${this.sceneClips.length} scenes`);
+            
+            // index.html has preload hints for these, so this picks up
+            // responses already on their way
+            for (const path of this.sceneClips[0] || []) {
+                this.loadClip(path).catch(error => log.warn(`⚠️ Failed to preload ${path}`, error));
+            }
+        } catch (error) {
+            log.warn('⚠️ Failed to load scene index:', error);
+        }
+    }
+    
+    // Called before a clip plays. Pins it, the rest of its scene and the next
+    // scene, so eviction only ever drops clips from scenes already finished or
+    // far ahead. Moving to another scene cancels lookahead loads it won't use.
+    enterScene(audioPath) {
+        const nearby = this.nearbyClips(audioPath);
+        this.activeCache().pin([audioPath, ...nearby]);
+        
+        const scene = this.clipScenes.get(audioPath);
+        if (scene !== undefined && scene !== this.currentScene) {
+            this.currentScene = scene;
+            this.cancelPrefetch(new Set(nearby));
+        }
+    }
+    
+    // Clips of this clip's scene and the next one, in order
+    nearbyClips(audioPath) {
+        const scene = this.clipScenes.get(audioPath);
+        if (scene === undefined) return [];
+        return [...this.sceneClips[scene], ...(this.sceneClips[scene + 1] || [])];
+    }
+    
+    // Start loading the clips that follow this one in scene order
+    prefetchAfter(audioPath) {
+        const upcoming = this.nearbyClips(audioPath);
+        const position = upcoming.indexOf(audioPath);
+        if (position === -1) return;
+        this.prefetchPaths(upcoming.slice(position + 1, position + 1 + this.prefetchDepth));
+    }
+    
+    // Lines the game is about to speak (e.g. the rest of a dialogue array);
+    // resolving and loading them overlaps the current line's playback
+    async prefetchLines(lines) {
+        const paths = [];
+        for (const line of lines.slice(0, this.prefetchDepth)) {
+            const path = this.getClipPath(line.clip) || await this.getAudioFile(line.text, line.character);
+            if (path) paths.push(path);
+        }
+        this.prefetchPaths(paths);
+    }
+    
+    prefetchPaths(paths) {
+        for (const path of paths) {
+            if (this.isClipLoaded(path) || this.prefetching.has(path)) continue;
+            
+            const controller = new AbortController();
+            this.prefetching.set(path, controller);
+            const loading = this.playbackEngine === 'webaudio'
+                ? this.loadBuffer(path, controller.signal)
+                : this.preloadAudio(path);
+            loading.catch(() => {}).then(() => {
+                if (this.prefetching.get(path) === controller) this.prefetching.delete(path);
+            });
+        }
+    }
+    
+    // Abort lookahead loads (all of them, or all but the paths in keep).
+    // Element loads can't be aborted and just finish into the cache.
+    cancelPrefetch(keep = new Set()) {
+        for (const [path, controller] of this.prefetching) {
+            if (keep.has(path)) continue;
+            controller.abort();
+            this.prefetching.delete(path);
+        }
+    }
+    
+    activeCache() {
+        return this.playbackEngine === 'webaudio' ? this.bufferCache : this.audioCache;
+    }
+    
+    // Hit/miss/eviction counters and current usage of the active cache
+    getCacheStats() {
+        const cache = this.activeCache();
+        return {
+            ...cache.stats,
+            entries: cache.entries.size,
+            bytes: cache.bytes,
+            durationMs: cache.durationMs,
+            pinned: cache.pinned.size
+        };
+    }
+    
+    // Path of a clip resolved at build time (build_bundle.py), or null
+    getClipPath(clipId) {
+        const audioFile = clipId && this.clipsById.get(clipId);
+        return audioFile ? `./audio/${audioFile.filename}` : null;
+    }
+    
+    // Real duration of the clip for this line, or null if unknown
+    getClipDuration(text, character, clipId = null) {
+        if (!this.audioManifest) return null;
+        
+        let audioPath = this.getClipPath(clipId);
+        if (!audioPath) {
+            const cleanText = this.cleanTextForMatching(text);
+            const audioFile = this.audioManifest.files.find(file => 
+                file.character === character && (file.text === text || file.clean_text === cleanText)
+            );
+            audioPath = audioFile && `./audio/${audioFile.filename}`;
+        }
+        const timing = audioPath && this.clipTimings.get(audioPath);
+        return timing ? timing.durationMs : null;
+    }
+    
+    cleanTextForMatching(text) {
+        return text.replace(/[🚀👨‍🚀👩‍🚀🐕‍🦺🧊😢💖👨‍🍳👩‍🍳🥕🥬🌽🍅🥒🥔🌙🏠🚪😋🎉🎆✨🎈❤️🌉🏙️🗽🏢🏬🏘️🏡🚋🤵👰🌅]/g, '')
+                   .trim()
+                   .replace(/^George:\s*/i, '')
+                   .replace(/^Matilda:\s*/i, '') 
+                   .replace(/^Moon\s*Dog:\s*/i, '')
+                   .replace(/^Narrator:\s*/i, '')
+                   .trim();
+    }
+    
     async preloadCriticalAudio() {
         if (!this.audioManifest) return;
         
@@ -48,19 +343,19 @@ class MobileAudioSystem {
             { text: "👨‍🚀 George: Great idea! Let's help our friend Moon Dog!", character: "george" }
         ];
         
-        console.log('🎵 Preloading critical audio files...');
+        log.info('🎵 Preloading critical audio files...');
         
         for (const item of criticalTexts) {
             try {
-                const audioPath = await this.getAudioFile(item.text, item.character);
+                const audioPath = this.getClipPath(item.clip) || await this.getAudioFile(item.text, item.character);
                 if (audioPath) {
                     // Start preloading but don't wait for completion
-                    this.preloadAudio(audioPath).catch(error => {
-                        console.warn(`⚠️ Failed to preload critical audio: ${audioPath}`, error);
+                    this.loadClip(audioPath).catch(error => {
+                        log.warn(`⚠️ Failed to preload critical audio: ${audioPath}`, error);
                     });
                 }
             } catch (error) {
-                console.warn(`⚠️ Error preloading critical audio for ${item.character}:`, error);
+                log.warn(`⚠️ Error preloading critical audio for ${item.character}:`, error);
             }
         }
     }
@@ -85,16 +380,10 @@ class MobileAudioSystem {
         if (!this.audioManifest) return null;
         
         // Clean text the same way as in the extraction script
-        const cleanText = text.replace(/[🚀👨‍🚀👩‍🚀🐕‍🦺🧊😢💖👨‍🍳👩‍🍳🥕🥬🌽🍅🥒🥔🌙🏠🚪😋🎉🎆✨🎈❤️🌉🏙️🗽🏢🏬🏘️🏡🚋🤵👰🌅]/g, '')
-                          .trim()
-                          .replace(/^George:\s*/i, '')
-                          .replace(/^Matilda:\s*/i, '') 
-                          .replace(/^Moon\s*Dog:\s*/i, '')
-                          .replace(/^Narrator:\s*/i, '')
-                          .trim();
+        const cleanText = this.cleanTextForMatching(text);
         
-        console.log(`🔍 Looking for audio: character="${character}", text="${text}"`);
-        console.log(`🔍 Clean text: "${cleanText}"`);
+        log.debug(`🔍 Looking for audio: character="${character}", text="${text}"`);
+        log.debug(`🔍 Clean text: "${cleanText}"`);
         
         // Try multiple matching strategies
         let audioFile = null;
@@ -105,7 +394,7 @@ class MobileAudioSystem {
         );
         
         if (audioFile) {
-            console.log(`✅ Found exact match: ${audioFile.filename}`);
+            log.debug(`✅ Found exact match: ${audioFile.filename}`);
             return `./audio/${audioFile.filename}`;
         }
         
@@ -115,7 +404,7 @@ class MobileAudioSystem {
         );
         
         if (audioFile) {
-            console.log(`✅ Found clean text match: ${audioFile.filename}`);
+            log.debug(`✅ Found clean text match: ${audioFile.filename}`);
             return `./audio/${audioFile.filename}`;
         }
         
@@ -133,7 +422,7 @@ class MobileAudioSystem {
         });
         
         if (audioFile) {
-            console.log(`✅ Found fuzzy match: ${audioFile.filename}`);
+            log.debug(`✅ Found fuzzy match: ${audioFile.filename}`);
             return `./audio/${audioFile.filename}`;
         }
         
@@ -146,7 +435,7 @@ class MobileAudioSystem {
             );
             
             if (audioFile) {
-                console.log(`✅ Found template match: ${audioFile.filename}`);
+                log.debug(`✅ Found template match: ${audioFile.filename}`);
                 return `./audio/${audioFile.filename}`;
             }
         }
@@ -159,95 +448,287 @@ class MobileAudioSystem {
         );
         
         if (partialMatches.length > 0) {
-            console.log(`🔍 Found ${partialMatches.length} partial matches:`);
+            log.debug(`🔍 Found ${partialMatches.length} partial matches:`);
             partialMatches.forEach(file => {
-                console.log(`  - ${file.filename}: "${file.clean_text}"`);
+                log.debug(`  - ${file.filename}: "${file.clean_text}"`);
             });
         }
         
-        console.log(`❌ No audio file found for: "${cleanText}"`);
+        log.debug(`❌ No audio file found for: "${cleanText}"`);
         return null;
     }
     
+    canPlayType(type) {
+        if (!this.playableTypes.has(type)) {
+            const probe = document.createElement('audio');
+            this.playableTypes.set(type, probe.canPlayType(type) !== '');
+        }
+        return this.playableTypes.get(type);
+    }
+    
+    // Starting guess from the Network Information API, until clips are measured
+    initialThroughputEstimate() {
+        const connection = navigator.connection;
+        if (!connection) return null;
+        if (connection.saveData) return 0;
+        if (connection.downlink) return connection.downlink * 1000;
+        
+        const typicalKbps = { 'slow-2g': 40, '2g': 150, '3g': 700, '4g': 4000 };
+        return typicalKbps[connection.effectiveType] || null;
+    }
+    
+    recordThroughput(bytes, elapsedMs) {
+        const sampleKbps = bytes * 8 / Math.max(1, elapsedMs);
+        this.throughputKbps = this.throughputKbps === null
+            ? sampleKbps
+            : 0.7 * this.throughputKbps + 0.3 * sampleKbps;
+    }
+    
+    // The bitrate ladder for a clip: every tier of the codec with the smallest
+    // files this browser can play (variants are sorted by size), lowest first
+    playableTiers(audioPath) {
+        const variants = this.clipVariants.get(audioPath);
+        if (!variants) return [];
+        
+        const smallest = variants.find(v => this.canPlayType(v.type));
+        if (!smallest) return [];
+        return variants.filter(v => v.type === smallest.type).sort((a, b) => a.kbps - b.kbps);
+    }
+    
+    // Highest tier the measured throughput can comfortably keep ahead of
+    pickTier(tiers) {
+        let tier = tiers[tiers.length - 1];
+        if (this.throughputKbps !== null) {
+            const affordable = tiers.filter(v => v.kbps * this.tierHeadroom <= this.throughputKbps);
+            tier = affordable.length > 0 ? affordable[affordable.length - 1] : tiers[0];
+        }
+        
+        if (tier.kbps !== this.audioTierKbps) {
+            const measured = this.throughputKbps === null ? 'unknown' : `${Math.round(this.throughputKbps)} kbps`;
+            log.info(`📶 Audio tier: ${tier.kbps} kbps (network: ${measured})`);
+            this.audioTierKbps = tier.kbps;
+        }
+        return tier;
+    }
+    
+    // Sources to try in order: the chosen tier, the lowest tier, the original
+    loadAttempts(audioPath) {
+        const attempts = [];
+        const tiers = this.playableTiers(audioPath);
+        if (tiers.length > 0) {
+            const chosen = this.pickTier(tiers);
+            attempts.push({ path: `./audio/${chosen.filename}`, bytes: chosen.bytes });
+            if (chosen !== tiers[0]) {
+                attempts.push({ path: `./audio/${tiers[0].filename}`, bytes: tiers[0].bytes });
+            }
+        }
+        if (!attempts.some(attempt => attempt.path === audioPath)) {
+            attempts.push({ path: audioPath, bytes: null });
+        }
+        return attempts;
+    }
+    
     async preloadAudio(audioPath) {
-        if (this.audioCache.has(audioPath)) {
-            return this.audioCache.get(audioPath);
+        const cached = this.audioCache.get(audioPath);
+        if (cached) {
+            return cached;
         }
         
+        const attempts = this.loadAttempts(audioPath);
+        
         return new Promise((resolve, reject) => {
             const audio = new Audio();
             let hasResolved = false;
+            let attemptIndex = -1;
+            let startedAt = 0;
+            let timeout = null;
             
-            // Add timeout to prevent infinite hanging
-            const timeout = setTimeout(() => {
-                if (!hasResolved) {
+            // Load the next source; a slow or failing tier steps down the
+            // ladder instead of dropping the line
+            const tryNext = (reason) => {
+                clearTimeout(timeout);
+                attemptIndex++;
+                if (attemptIndex >= attempts.length) {
                     hasResolved = true;
-                    console.warn(`⏰ Audio loading timeout: ${audioPath}`);
-                    reject(new Error(`Audio loading timeout: ${audioPath}`));
+                    reject(reason);
+                    return;
                 }
-            }, 10000); // 10 second timeout
+                
+                const attempt = attempts[attemptIndex];
+                const isLast = attemptIndex === attempts.length - 1;
+                startedAt = performance.now();
+                
+                // Add timeout to prevent infinite hanging
+                timeout = setTimeout(() => {
+                    if (!hasResolved) {
+                        log.warn(`⏰ Audio loading timeout: ${attempt.path}`);
+                        if (attempt.bytes) {
+                            // Not even done yet, so the network is at most this fast
+                            this.recordThroughput(attempt.bytes, performance.now() - startedAt);
+                        }
+                        tryNext(new Error(`Audio loading timeout: ${audioPath}`));
+                    }
+                }, isLast ? 10000 : this.slowLoadMs); // 10 second timeout for the last resort
+                
+                audio.src = attempt.path;
+            };
             
             audio.addEventListener('canplaythrough', () => {
                 if (!hasResolved) {
                     hasResolved = true;
                     clearTimeout(timeout);
-                    this.audioCache.set(audioPath, audio);
-                    console.log(`✅ Audio preloaded successfully: ${audioPath}`);
+                    const attempt = attempts[attemptIndex];
+                    if (attempt.bytes) {
+                        this.recordThroughput(attempt.bytes, performance.now() - startedAt);
+                    }
+                    // Elements don't expose their decoded size; estimate 16-bit 44.1 kHz mono
+                    const durationMs = (audio.duration || 0) * 1000;
+                    this.audioCache.set(audioPath, audio, durationMs * 88.2, durationMs);
+                    log.debug(`✅ Audio preloaded successfully: ${attempt.path}`);
                     resolve(audio);
                 }
             });
             
             audio.addEventListener('error', (error) => {
                 if (!hasResolved) {
-                    hasResolved = true;
-                    clearTimeout(timeout);
-                    console.warn(`⚠️ Failed to load audio: ${audioPath}`, error);
-                    reject(error);
+                    log.warn(`⚠️ Failed to load audio: ${attempts[attemptIndex].path}`, error);
+                    tryNext(error);
                 }
             });
             
             // Add loadstart event to detect loading begins
             audio.addEventListener('loadstart', () => {
-                console.log(`📥 Started loading audio: ${audioPath}`);
+                log.debug(`📥 Started loading audio: ${audio.src}`);
             });
             
-            audio.src = audioPath;
             audio.preload = 'auto';
+            tryNext(new Error(`No audio source for: ${audioPath}`));
+        });
+    }
+    
+    // Clip decoded once into an AudioBuffer on the shared context. Loading
+    // steps down the bitrate ladder like preloadAudio(); concurrent requests
+    // for the same clip share one fetch. signal cancels a lookahead load.
+    loadBuffer(audioPath, signal = null) {
+        const cached = this.bufferCache.get(audioPath);
+        if (cached) return cached;
+        
+        const loading = this.fetchBuffer(audioPath, signal);
+        this.bufferCache.set(audioPath, loading);
+        loading.then(
+            buffer => this.bufferCache.resize(audioPath, buffer.length * buffer.numberOfChannels * 4,
+                                              buffer.duration * 1000),
+            () => this.bufferCache.delete(audioPath)
+        );
+        return loading;
+    }
+    
+    async fetchBuffer(audioPath, signal = null) {
+        const attempts = this.loadAttempts(audioPath);
+        let lastError = new Error(`No audio source for: ${audioPath}`);
+        
+        for (let attemptIndex = 0; attemptIndex < attempts.length; attemptIndex++) {
+            if (signal && signal.aborted) {
+                throw new Error(`Prefetch cancelled: ${audioPath}`);
+            }
+            
+            const attempt = attempts[attemptIndex];
+            const isLast = attemptIndex === attempts.length - 1;
+            const controller = new AbortController();
+            const startedAt = performance.now();
+            const timeout = setTimeout(() => controller.abort(), isLast ? 10000 : this.slowLoadMs);
+            const cancel = () => controller.abort();
+            if (signal) signal.addEventListener('abort', cancel);
+            
+            try {
+                const response = await fetch(attempt.path, { signal: controller.signal });
+                if (!response.ok) throw new Error(`HTTP ${response.status} for ${attempt.path}`);
+                const data = await response.arrayBuffer();
+                clearTimeout(timeout);
+                this.recordThroughput(data.byteLength, performance.now() - startedAt);
+                
+                const buffer = await this.decodeAudio(data);
+                log.debug(`✅ Audio decoded: ${attempt.path} (${buffer.duration.toFixed(2)}s)`);
+                return buffer;
+            } catch (error) {
+                clearTimeout(timeout);
+                if (signal && signal.aborted) {
+                    log.debug(`🚫 Prefetch cancelled: ${attempt.path}`);
+                    throw error;
+                }
+                if (controller.signal.aborted) {
+                    log.warn(`⏰ Audio loading timeout: ${attempt.path}`);
+                    if (attempt.bytes) {
+                        // Not even done yet, so the network is at most this fast
+                        this.recordThroughput(attempt.bytes, performance.now() - startedAt);
+                    }
+                } else {
+                    log.warn(`⚠️ Failed to load audio: ${attempt.path}`, error);
+                }
+                lastError = error;
+            } finally {
+                if (signal) signal.removeEventListener('abort', cancel);
+            }
+        }
+        throw lastError;
+    }
+    
+    decodeAudio(data) {
+        const context = this.getAudioContext();
+        // Older Safari only supports the callback form
+        return new Promise((resolve, reject) => {
+            const decoding = context.decodeAudioData(data, resolve, reject);
+            if (decoding && decoding.then) decoding.then(resolve, reject);
         });
     }
     
+    // The one AudioContext for all playback; every clip plays through outputGain
+    getAudioContext() {
+        if (!this.audioContext) {
+            const AudioContextClass = window.AudioContext || window.webkitAudioContext;
+            this.audioContext = new AudioContextClass();
+            this.outputGain = this.audioContext.createGain();
+            this.outputGain.connect(this.audioContext.destination);
+        }
+        return this.audioContext;
+    }
+    
+    // Start loading a clip with whichever engine will play it
+    loadClip(audioPath) {
+        return this.playbackEngine === 'webaudio' ? this.loadBuffer(audioPath) : this.preloadAudio(audioPath);
+    }
+    
+    isClipLoaded(audioPath) {
+        return this.playbackEngine === 'webaudio' ? this.bufferCache.has(audioPath) : this.audioCache.has(audioPath);
+    }
+    
     async unlockAudio() {
         if (this.audioUnlocked) return;
         
         try {
-            console.log('🔓 Attempting to unlock audio context...');
+            log.debug('🔓 Attempting to unlock audio context...');
             
-            // Method 1: Try Web Audio API unlock
+            // Method 1: Resume the shared Web Audio context and play one silent sample
             if (window.AudioContext || window.webkitAudioContext) {
-                const AudioContextClass = window.AudioContext || window.webkitAudioContext;
-                const audioContext = new AudioContextClass();
+                const audioContext = this.getAudioContext();
                 
                 if (audioContext.state === 'suspended') {
                     await audioContext.resume();
-                    console.log('🔓 AudioContext resumed');
+                    log.debug('🔓 AudioContext resumed');
                 }
                 
-                // Play a silent tone to unlock
-                const oscillator = audioContext.createOscillator();
-                const gainNode = audioContext.createGain();
-                oscillator.connect(gainNode);
-                gainNode.connect(audioContext.destination);
-                gainNode.gain.value = 0;
-                oscillator.frequency.value = 440;
-                oscillator.start();
-                oscillator.stop(audioContext.currentTime + 0.1);
+                const silence = audioContext.createBufferSource();
+                silence.buffer = audioContext.createBuffer(1, 1, 22050);
+                silence.connect(audioContext.destination);
+                silence.start();
             }
             
-            // Method 2: Try HTML5 Audio unlock with multiple formats
-            const formats = [
+            // Method 2: Try HTML5 Audio unlock with multiple formats (only
+            // needed when clips play through audio elements)
+            const formats = this.playbackEngine === 'element' ? [
                 'data:audio/wav;base64,UklGRnoGAABXQVZFZm10IBAAAAABAAEAQB8AAEAfAAABAAgAZGF0YQoGAACBhYqFbF1fdJivrJBhNjVgodDbq2EcBj+a2/LDciUFLIHO8tiJNwgZaLvt559NEAxQp+PwtmMcBjiR1/LMeSwFJHfH8N2QQAoUXrTp66hVFApGn+DyvmwhBSRxx+/e',
                 'data:audio/mpeg;base64,SUQzBAAAAAABEVRYWFgAAAAtAAADY29tbWVudABCaWdTb3VuZEJhbmsuY29tIC8gTGFTb25vdGhlcXVlLm9yZwBURU5DAAAAHQAASTR4WC4yLjcuMQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAid8='
-            ];
+            ] : [];
             
             for (const src of formats) {
                 try {
@@ -263,137 +744,251 @@ class MobileAudioSystem {
                     });
                     
                     await silentAudio.play();
-                    console.log(`🔓 Audio unlocked with format: ${src.substring(0, 20)}...`);
+                    log.debug(`🔓 Audio unlocked with format: ${src.substring(0, 20)}...`);
                     break;
                 } catch (formatError) {
-                    console.warn(`⚠️ Format failed: ${src.substring(0, 20)}...`, formatError);
+                    log.warn(`⚠️ Format failed: ${src.substring(0, 20)}...`, formatError);
                 }
             }
             
             this.audioUnlocked = true;
-            console.log('🔓 Audio context unlocked for mobile');
+            log.info('🔓 Audio context unlocked for mobile');
         } catch (error) {
-            console.warn('⚠️ Failed to unlock audio context:', error);
+            log.warn('⚠️ Failed to unlock audio context:', error);
             // Still mark as unlocked to prevent infinite retry
             this.audioUnlocked = true;
         }
     }
 
-    async playAudio(audioPath) {
+    async playAudio(audioPath, text = '', character = 'narrator') {
+        const requestedAt = performance.now();
+        const preloaded = this.isClipLoaded(audioPath);
+        
         try {
-            console.log(`🎵 Attempting to play audio: ${audioPath}`);
+            log.debug(`🎵 Attempting to play audio: ${audioPath} (${this.playbackEngine})`);
             
             // Ensure audio is unlocked
             if (!this.audioUnlocked) {
-                console.log('🔓 Audio not unlocked, attempting unlock...');
+                log.debug('🔓 Audio not unlocked, attempting unlock...');
                 await this.unlockAudio();
             }
             
-            console.log(`🎵 Preloading audio: ${audioPath}`);
-            let audio;
-            try {
-                audio = await this.preloadAudio(audioPath);
-            } catch (preloadError) {
-                console.warn(`⚠️ Audio preload failed for ${audioPath}, continuing without audio:`, preloadError);
-                return Promise.resolve(); // Continue game even if audio fails
+            // A lookahead load of this clip is now needed; don't let a scene change cancel it
+            this.prefetching.delete(audioPath);
+            this.enterScene(audioPath);
+            if (this.playbackEngine === 'webaudio') {
+                return await this.playBuffer(audioPath, text, character, requestedAt, preloaded);
             }
+            return await this.playElement(audioPath, text, character, requestedAt, preloaded);
+        } catch (error) {
+            log.warn('⚠️ Audio system error:', error);
+            return Promise.resolve(); // Continue even if audio system fails
+        }
+    }
+    
+    async playBuffer(audioPath, text, character, requestedAt, preloaded) {
+        let buffer;
+        try {
+            buffer = await this.loadBuffer(audioPath);
+        } catch (loadError) {
+            log.warn(`⚠️ Audio load failed for ${audioPath}, continuing without audio:`, loadError);
+            return;
+        }
+        
+        const context = this.getAudioContext();
+        if (context.state === 'suspended') {
+            await context.resume();
+        }
+        
+        this.stop();
+        
+        // Source nodes are single-use and cheap; the decoded buffer and the
+        // output gain are what's reused
+        const source = context.createBufferSource();
+        source.buffer = buffer;
+        source.connect(this.outputGain);
+        this.currentSource = source;
+        
+        return new Promise((resolve) => {
+            const timers = [];
             
-            // Stop current audio
-            if (this.currentAudio && !this.currentAudio.paused) {
-                console.log('⏹️ Stopping current audio');
-                this.currentAudio.pause();
-                this.currentAudio.currentTime = 0;
-            }
+            const handleEnd = () => {
+                source.onended = null;
+                timers.forEach(timer => clearTimeout(timer));
+                if (this.currentSource === source) this.currentSource = null;
+                log.debug('✅ Audio playback completed');
+                resolve();
+            };
             
-            this.currentAudio = audio;
-            audio.currentTime = 0;
+            source.onended = handleEnd;
+            source.start();
+            this.prefetchAfter(audioPath);
+            this.recordStartLatency(performance.now() - requestedAt + (context.baseLatency || 0) * 1000, preloaded);
+            this.scheduleClipTimers(audioPath, text, character, timers, handleEnd);
+        });
+    }
+    
+    async playElement(audioPath, text, character, requestedAt, preloaded) {
+        log.debug(`🎵 Preloading audio: ${audioPath}`);
+        let audio;
+        try {
+            audio = await this.preloadAudio(audioPath);
+        } catch (preloadError) {
+            log.warn(`⚠️ Audio preload failed for ${audioPath}, continuing without audio:`, preloadError);
+            return Promise.resolve(); // Continue game even if audio fails
+        }
+        
+        // Stop current audio
+        this.stop();
+        
+        this.currentAudio = audio;
+        audio.currentTime = 0;
+        
+        // Set volume to ensure it's audible
+        audio.volume = 1.0;
+        
+        log.debug(`🎵 Audio ready to play. Volume: ${audio.volume}, Duration: ${audio.duration}`);
+        
+        return new Promise((resolve) => {
+            const timers = [];
             
-            // Set volume to ensure it's audible
-            audio.volume = 1.0;
+            const cleanup = () => {
+                audio.removeEventListener('ended', handleEnd);
+                audio.removeEventListener('error', handleError);
+                timers.forEach(timer => clearTimeout(timer));
+            };
             
-            console.log(`🎵 Audio ready to play. Volume: ${audio.volume}, Duration: ${audio.duration}`);
+            const handleEnd = () => {
+                cleanup();
+                log.debug('✅ Audio playback completed');
+                resolve();
+            };
             
-            return new Promise((resolve) => {
-                const handleEnd = () => {
-                    audio.removeEventListener('ended', handleEnd);
-                    audio.removeEventListener('error', handleError);
-                    console.log('✅ Audio playback completed');
-                    resolve();
-                };
-                
-                const handleError = (error) => {
-                    audio.removeEventListener('ended', handleEnd);
-                    audio.removeEventListener('error', handleError);
-                    console.warn('⚠️ Audio playback error:', error);
-                    resolve(); // Continue even if audio fails
-                };
-                
-                audio.addEventListener('ended', handleEnd);
-                audio.addEventListener('error', handleError);
-                
-                console.log('▶️ Starting audio playback...');
-                audio.play().then(() => {
-                    console.log('✅ Audio play() succeeded');
-                }).catch(error => {
-                    console.warn('⚠️ Audio play() failed:', error);
-                    resolve(); // Continue even if play fails
-                });
+            const handleError = (error) => {
+                cleanup();
+                log.warn('⚠️ Audio playback error:', error);
+                resolve(); // Continue even if audio fails
+            };
+            
+            audio.addEventListener('ended', handleEnd);
+            audio.addEventListener('error', handleError);
+            
+            log.debug('▶️ Starting audio playback...');
+            audio.play().then(() => {
+                log.debug('✅ Audio play() succeeded');
+                this.recordStartLatency(performance.now() - requestedAt, preloaded);
+                this.prefetchAfter(audioPath);
+                this.scheduleClipTimers(audioPath, text, character, timers, handleEnd);
+            }).catch(error => {
+                log.warn('⚠️ Audio play() failed:', error);
+                resolve(); // Continue even if play fails
             });
-        } catch (error) {
-            console.warn('⚠️ Audio system error:', error);
-            return Promise.resolve(); // Continue even if audio system fails
+        });
+    }
+    
+    // Word highlight timers and an end guard for clips with known timing
+    scheduleClipTimers(audioPath, text, character, timers, handleEnd) {
+        const timing = this.clipTimings.get(audioPath);
+        if (!timing) return;
+        
+        // Known clip length: finish on time even if 'ended' never fires
+        timers.push(setTimeout(handleEnd, timing.durationMs + 250));
+        timing.wordStarts.forEach((start, index) => {
+            timers.push(setTimeout(() => {
+                if (this.onWord) this.onWord(index, text, character);
+            }, start));
+        });
+    }
+    
+    // Milliseconds from playAudio() to the clip starting, kept separately for
+    // clips that were already loaded and ones that had to load first
+    recordStartLatency(ms, preloaded) {
+        if (!this.firstSpeechMarked) {
+            // Time to first speech, read by benchmark_startup.py
+            performance.mark('first-speech');
+            this.firstSpeechMarked = true;
         }
+        const samples = this.startLatencies[preloaded ? 'preloaded' : 'cold'];
+        samples.push(ms);
+        if (samples.length > 100) samples.shift();
+    }
+    
+    getPlaybackMetrics() {
+        const summarize = (samples) => {
+            const sorted = [...samples].sort((a, b) => a - b);
+            const count = sorted.length;
+            return {
+                count,
+                meanMs: count ? sorted.reduce((sum, ms) => sum + ms, 0) / count : null,
+                p95Ms: count ? sorted[Math.min(count - 1, Math.floor(count * 0.95))] : null,
+                maxMs: count ? sorted[count - 1] : null
+            };
+        };
+        return {
+            engine: this.playbackEngine,
+            preloaded: summarize(this.startLatencies.preloaded),
+            cold: summarize(this.startLatencies.cold)
+        };
     }
     
-    async speak(text, character) {
-        console.log(`🗣️ speak() called - enabled: ${this.audioEnabled}, platform: ${this.isMobile ? 'mobile' : 'desktop'}, character: ${character}`);
-        console.log(`🗣️ Text: "${text.substring(0, 50)}..."`);
+    // clipId is added to call sites by build_bundle.py; without it the clip
+    // is found by matching the text
+    async speak(text, character, clipId = null) {
+        log.debug(`🗣️ speak() called - enabled: ${this.audioEnabled}, platform: ${this.isMobile ? 'mobile' : 'desktop'}, character: ${character}`);
+        log.debug(`🗣️ Text: "${text.substring(0, 50)}..."`);
         
         if (!this.audioEnabled) {
-            console.log('⚠️ Audio disabled, skipping speech');
+            log.debug('⚠️ Audio disabled, skipping speech');
             return Promise.resolve();
         }
         
-        // Add timeout to prevent hanging - critical for game flow
+        // Add timeout to prevent hanging - critical for game flow.
+        // With a known clip length the limit is that plus loading slack.
+        const clipDuration = this.getClipDuration(text, character, clipId);
         const timeout = new Promise((resolve) => {
             setTimeout(() => {
-                console.warn(`⏰ Speech timeout for: ${text.substring(0, 30)}...`);
+                log.warn(`⏰ Speech timeout for: ${text.substring(0, 30)}...`);
                 resolve();
-            }, 15000); // 15 second maximum per dialogue
+            }, clipDuration ? clipDuration + 5000 : 15000); // 15 second maximum per unknown dialogue
         });
         
-        const speechPromise = this.speakInternal(text, character);
+        const speechPromise = this.speakInternal(text, character, clipId);
         
         // Race between actual speech and timeout
         return Promise.race([speechPromise, timeout]);
     }
     
-    async speakInternal(text, character) {
+    async speakInternal(text, character, clipId = null) {
         // Use ElevenLabs audio files on ALL platforms when available
         if (this.audioManifest && this.useElevenLabsEverywhere) {
-            console.log('🎵 Looking for ElevenLabs audio file...');
-            const audioPath = await this.getAudioFile(text, character);
+            log.debug('🎵 Looking for ElevenLabs audio file...');
+            const audioPath = this.getClipPath(clipId) || await this.getAudioFile(text, character);
             if (audioPath) {
-                console.log(`🎵 Found audio file: ${audioPath}`);
-                console.log(`🎵 Playing ElevenLabs audio: ${character} - ${text.substring(0, 30)}...`);
-                return this.playAudio(audioPath);
+                log.debug(`🎵 Found audio file: ${audioPath}`);
+                log.debug(`🎵 Playing ElevenLabs audio: ${character} - ${text.substring(0, 30)}...`);
+                return this.playAudio(audioPath, text, character);
             } else {
-                console.log('⚠️ No ElevenLabs audio file found for this text');
+                log.debug('⚠️ No ElevenLabs audio file found for this text');
             }
         }
         
         // Fallback to text-to-speech only if no audio file found
-        console.log('🗣️ Falling back to text-to-speech');
+        log.debug('🗣️ Falling back to text-to-speech');
         return this.fallbackToTextToSpeech(text, character);
     }
     
     fallbackToTextToSpeech(text, character) {
         // This will be handled by the existing game text-to-speech system
-        console.log(`🗣️ Using text-to-speech: ${character} - ${text.substring(0, 30)}...`);
+        log.debug(`🗣️ Using text-to-speech: ${character} - ${text.substring(0, 30)}...`);
         return Promise.resolve();
     }
     
     stop() {
+        if (this.currentSource) {
+            const source = this.currentSource;
+            this.currentSource = null;
+            source.stop(); // fires onended, which resolves its playAudio()
+        }
         if (this.currentAudio && !this.currentAudio.paused) {
             this.currentAudio.pause();
             this.currentAudio.currentTime = 0;
@@ -411,8 +1006,12 @@ class MobileAudioSystem {
         return this.audioEnabled;
     }
     
-    // Estimate duration for timing (used by game for dialogue pacing)
-    estimateDuration(text) {
+    // Duration for timing (used by game for dialogue pacing) - the real clip
+    // length when timing data is loaded, otherwise a words-per-minute estimate
+    estimateDuration(text, character = 'narrator') {
+        const clipDuration = this.getClipDuration(text, character);
+        if (clipDuration) return clipDuration;
+        
         const wordsPerMinute = 180; // Average speaking rate
         const words = text.split(' ').length;
         const durationMs = (words / wordsPerMinute) * 60 * 1000;
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+PCM helpers for the audio pipeline (standard library only)
+
+16-bit mono PCM is the common currency: backends can return it, batch
+synthesis splits it at silences, and encode_clip() writes it back out as
+WAV directly or as anything else through ffmpeg when it's installed.
+
+clip_timing() measures a finished clip - its real duration and when each
+word starts - for the compact timing table (audio/timing.json) the game
+uses to pace dialogue and highlight words.
+"""
+import array
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+from tts_backends import pcm_to_wav, wav_to_pcm
+
+WINDOW_MS = 10
+SILENCE_THRESHOLD = 500      # peak amplitude (of 32767) below which a window is silent
+EDGE_PADDING_MS = 50         # silence kept around each split clip
+WORD_GAP_MS = 40             # shortest silence treated as a gap between words
+
+# MPEG audio layer III frame header tables, indexed by the header's bit fields
+MP3_BITRATES_KBPS = {
+    1: [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],   # MPEG-1
+    2: [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],       # MPEG-2 / 2.5
+}
+MP3_SAMPLE_RATES = {3: [44100, 48000, 32000], 2: [22050, 24000, 16000], 0: [11025, 12000, 8000]}
+
+
+def duration_ms(pcm, sample_rate):
+    """Length of 16-bit mono PCM in milliseconds"""
+    return len(pcm) // 2 * 1000 // sample_rate
+
+
+def silent_windows(pcm, sample_rate, threshold=SILENCE_THRESHOLD):
+    """One bool per WINDOW_MS window: True where the window is silent"""
+    samples = array.array('h', pcm)
+    window = max(1, sample_rate * WINDOW_MS // 1000)
+    flags = []
+    for start in range(0, len(samples), window):
+        chunk = samples[start:start + window]
+        flags.append(max(chunk, key=abs, default=0) in range(-threshold, threshold + 1))
+    return flags
+
+
+def find_silences(pcm, sample_rate, min_ms, threshold=SILENCE_THRESHOLD):
+    """Return (start_ms, end_ms) of every silent run of at least min_ms"""
+    silences = []
+    run_start = None
+    flags = silent_windows(pcm, sample_rate, threshold)
+    for index, silent in enumerate(flags + [False]):
+        if silent and run_start is None:
+            run_start = index
+        elif not silent and run_start is not None:
+            if (index - run_start) * WINDOW_MS >= min_ms:
+                silences.append((run_start * WINDOW_MS, index * WINDOW_MS))
+            run_start = None
+    return silences
+
+
+def slice_ms(pcm, sample_rate, start_ms, end_ms):
+    """Cut [start_ms, end_ms) out of 16-bit mono PCM"""
+    start = start_ms * sample_rate // 1000 * 2
+    end = end_ms * sample_rate // 1000 * 2
+    return pcm[start:end]
+
+
+def trim_silence(pcm, sample_rate, padding_ms=EDGE_PADDING_MS, threshold=SILENCE_THRESHOLD):
+    """Drop leading/trailing silence, keeping padding_ms on each side"""
+    flags = silent_windows(pcm, sample_rate, threshold)
+    voiced = [index for index, silent in enumerate(flags) if not silent]
+    if not voiced:
+        return pcm
+    start_ms = max(0, voiced[0] * WINDOW_MS - padding_ms)
+    end_ms = (voiced[-1] + 1) * WINDOW_MS + padding_ms
+    return slice_ms(pcm, sample_rate, start_ms, end_ms)
+
+
+def split_at_silences(pcm, sample_rate, count, min_gap_ms):
+    """Split audio of `count` joined lines back into `count` clips.
+
+    The cut points are the count - 1 longest interior silences that are at
+    least min_gap_ms long. Returns None when the audio doesn't have enough
+    such gaps, so the caller can fall back to one request per line.
+    """
+    if count == 1:
+        return [trim_silence(pcm, sample_rate)]
+
+    total_ms = duration_ms(pcm, sample_rate)
+    gaps = [(start, end) for start, end in find_silences(pcm, sample_rate, min_gap_ms)
+            if start > 0 and end < total_ms]
+    if len(gaps) < count - 1:
+        return None
+
+    cuts = sorted(sorted(gaps, key=lambda gap: gap[1] - gap[0], reverse=True)[:count - 1])
+    bounds = [0] + [(start + end) // 2 for start, end in cuts] + [total_ms]
+    return [trim_silence(slice_ms(pcm, sample_rate, bounds[i], bounds[i + 1]), sample_rate)
+            for i in range(count)]
+
+
+def split_lines(pcm, sample_rate, texts, min_gap_ms, max_skew=3.0):
+    """Split one recording of the joined texts into one clip per text.
+
+    Besides needing enough silent gaps, every clip's duration per character
+    has to be within max_skew of the recording's average - a cut inside a
+    line (a long dramatic pause) shows up as one clip far too short and the
+    next far too long.
+    """
+    clips = split_at_silences(pcm, sample_rate, len(texts), min_gap_ms)
+    if clips is None:
+        return None
+
+    total_chars = sum(max(1, len(text)) for text in texts)
+    average = sum(duration_ms(clip, sample_rate) for clip in clips) / total_chars
+    for clip, text in zip(clips, texts):
+        per_char = duration_ms(clip, sample_rate) / max(1, len(text))
+        if not average / max_skew <= per_char <= average * max_skew:
+            return None
+    return clips
+
+
+def can_encode(extension):
+    """True if encode_clip() can write this format here"""
+    return extension == 'wav' or shutil.which('ffmpeg') is not None
+
+
+def encode_clip(pcm, sample_rate, path):
+    """Write 16-bit mono PCM to path; the extension picks the format"""
+    path = str(path)
+    if path.endswith('.wav'):
+        with open(path, 'wb') as f:
+            f.write(pcm_to_wav(pcm, sample_rate))
+        return
+
+    if not shutil.which('ffmpeg'):
+        raise RuntimeError(f"ffmpeg is required to write {path}")
+
+    subprocess.run(['ffmpeg', '-loglevel', 'error', '-y', '-f', 's16le', '-ar', str(sample_rate),
+                    '-ac', '1', '-i', 'pipe:0', path], input=pcm, check=True)
+
+
+def mp3_duration_ms(data):
+    """Duration of an MP3 (layer III) by walking its frame headers"""
+    offset = 0
+    if data[:3] == b'ID3':
+        size = data[6] << 21 | data[7] << 14 | data[8] << 7 | data[9]
+        offset = 10 + size
+
+    samples = 0
+    sample_rate = None
+    while offset + 4 <= len(data):
+        header = int.from_bytes(data[offset:offset + 4], 'big')
+        version = header >> 19 & 0x3
+        layer = header >> 17 & 0x3
+        bitrate_index = header >> 12 & 0xF
+        rate_index = header >> 10 & 0x3
+        if (header >> 21 != 0x7FF or version == 1 or layer != 1
+                or bitrate_index in (0, 15) or rate_index == 3):
+            break  # not a layer III frame (trailing ID3v1 tag or garbage)
+
+        mpeg1 = version == 3
+        bitrate = MP3_BITRATES_KBPS[1 if mpeg1 else 2][bitrate_index] * 1000
+        sample_rate = MP3_SAMPLE_RATES[version][rate_index]
+        frame_samples = 1152 if mpeg1 else 576
+        padding = header >> 9 & 0x1
+        offset += frame_samples // 8 * bitrate // sample_rate + padding
+        samples += frame_samples
+
+    return samples * 1000 // sample_rate if sample_rate else 0
+
+
+def voiced_runs(pcm, sample_rate, min_gap_ms=WORD_GAP_MS, threshold=SILENCE_THRESHOLD):
+    """(start_ms, end_ms) of each stretch of sound, ignoring gaps under min_gap_ms"""
+    runs = []
+    run_start = None
+    silent_since = None
+    flags = silent_windows(pcm, sample_rate, threshold)
+    for index, silent in enumerate(flags + [True] * (min_gap_ms // WINDOW_MS + 1)):
+        if not silent:
+            if run_start is None:
+                run_start = index
+            silent_since = None
+        elif run_start is not None:
+            if silent_since is None:
+                silent_since = index
+            if (index + 1 - silent_since) * WINDOW_MS >= min_gap_ms:
+                runs.append((run_start * WINDOW_MS, silent_since * WINDOW_MS))
+                run_start = silent_since = None
+    return runs
+
+
+def proportional_word_starts(words, start_ms, end_ms):
+    """Spread words over [start_ms, end_ms) by length - the fallback alignment"""
+    weights = [len(word) + 1 for word in words]
+    total = sum(weights) or 1
+    starts = []
+    elapsed = 0
+    for weight in weights:
+        starts.append(start_ms + (end_ms - start_ms) * elapsed // total)
+        elapsed += weight
+    return starts
+
+
+def word_starts_from_pcm(pcm, sample_rate, words):
+    """Start (ms) of each word: one voiced run per word when the audio has
+    clear gaps between words, otherwise proportional over the voiced span"""
+    runs = voiced_runs(pcm, sample_rate)
+    if len(runs) == len(words):
+        return [start for start, _ in runs]
+    if runs:
+        return proportional_word_starts(words, runs[0][0], runs[-1][1])
+    return proportional_word_starts(words, 0, duration_ms(pcm, sample_rate))
+
+
+def decode_to_pcm(path):
+    """(pcm, sample_rate) for a WAV file, or any format when ffmpeg is installed"""
+    path = Path(path)
+    if path.suffix == '.wav':
+        return wav_to_pcm(path.read_bytes())
+    if not shutil.which('ffmpeg'):
+        return None
+    result = subprocess.run(['ffmpeg', '-loglevel', 'error', '-i', str(path), '-f', 's16le',
+                             '-ac', '1', '-ar', '22050', 'pipe:1'], capture_output=True, check=False)
+    if result.returncode != 0 or not result.stdout:
+        return None
+    return result.stdout, 22050
+
+
+def clip_timing(path, text, word_starts=None):
+    """Timing table entry for a clip: {'duration_ms', 'word_starts'}.
+
+    word_starts (ms, one per word of text) can come straight from the TTS
+    service; otherwise they're aligned from the audio's silences, or spread
+    proportionally when the clip can't be decoded here (MP3 without ffmpeg).
+    """
+    path = Path(path)
+    words = text.split()
+    decoded = decode_to_pcm(path)
+
+    if decoded:
+        pcm, sample_rate = decoded
+        total_ms = duration_ms(pcm, sample_rate)
+        if word_starts is None:
+            word_starts = word_starts_from_pcm(pcm, sample_rate, words)
+    else:
+        total_ms = mp3_duration_ms(path.read_bytes()) if path.suffix == '.mp3' else 0
+        if word_starts is None:
+            word_starts = proportional_word_starts(words, 0, total_ms)
+
+    return {'duration_ms': total_ms, 'word_starts': [int(start) for start in word_starts]}
+
+
+def read_timing_table(path):
+    """{filename: clip_timing()} from audio/timing.json (empty if there's none yet)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            clips = json.load(f)['clips']
+    except FileNotFoundError:
+        return {}
+    return {filename: {'duration_ms': row[0], 'word_starts': row[1:]} for filename, row in clips.items()}
+
+
+def write_timing_table(timings, path):
+    """Write {filename: clip_timing()} as audio/timing.json.
+
+    Each clip is one row, [duration_ms, word_start_ms, ...], with word starts
+    matching clean_text.split(); one row per line keeps diffs readable.
+    """
+    rows = [f"    {json.dumps(filename)}: {json.dumps([timing['duration_ms']] + timing['word_starts'])}"
+            for filename, timing in sorted(timings.items())]
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{\n  "version": 1,\n  "clips": {\n' + ',\n'.join(rows) + '\n  }\n}\n')
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Audio manifest schema, validation and migration
+
+audio/manifest.json is read by the game (audio-system.js) and written by the
+generator scripts. This module is the one definition of its shape:
+
+    version 1.0  (legacy) local "YYYY-MM-DD HH:MM:SS" timestamps, total_files
+                 stored by hand, voice_mappings optional, clean_text sometimes
+                 still carrying emoji or "Name:" prefixes
+    version 2    ISO 8601 UTC timestamps, voice_mappings required, clean_text
+                 always cleaned, total_files derived from files on write
+    version 3    each entry lists its codec `variants` (transcode_audio.py),
+                 smallest first; empty when none have been built
+
+Usage:
+    python3 audio_manifest.py validate [audio/manifest.json]
+    python3 audio_manifest.py migrate [audio/manifest.json] [--output path]
+
+validate exits non-zero on any problem, so it can gate every build.
+"""
+import argparse
+import json
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+from dialogue_catalog import clean_text_for_speech
+from tts_backends import VOICE_IDS
+
+SCHEMA_VERSION = 3
+LEGACY_VERSION = '1.0'
+
+ISO_TIMESTAMP = re.compile(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$')
+LEGACY_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+CLIP_ID = re.compile(r'^[0-9a-f]{8}$')
+AUDIO_EXTENSIONS = ('mp3', 'wav', 'ogg', 'webm', 'm4a')
+
+
+@dataclass(slots=True)
+class ClipVariant:
+    """One encoding of a clip; `type` is the MIME type given to canPlayType()"""
+    filename: str
+    type: str
+    kbps: int
+    bytes: int
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['filename'], data['type'], data['kbps'], data['bytes'])
+
+    def to_dict(self):
+        return {'filename': self.filename, 'type': self.type, 'kbps': self.kbps, 'bytes': self.bytes}
+
+
+@dataclass(slots=True)
+class ClipEntry:
+    """One spoken line and the clip that voices it"""
+    id: str
+    character: str
+    filename: str
+    text: str
+    clean_text: str
+    variants: list = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['id'], data['character'], data['filename'], data['text'], data['clean_text'],
+                   [ClipVariant.from_dict(variant) for variant in data.get('variants', [])])
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'character': self.character,
+            'filename': self.filename,
+            'text': self.text,
+            'clean_text': self.clean_text,
+            'variants': [variant.to_dict() for variant in self.variants],
+        }
+
+
+@dataclass(slots=True)
+class Manifest:
+    """The whole manifest; total_files is always len(files)"""
+    generated_at: str
+    voice_mappings: dict
+    files: list = field(default_factory=list)
+    version: int = SCHEMA_VERSION
+
+    @classmethod
+    def new(cls, voice_mappings, files=()):
+        return cls(generated_at=utc_timestamp(), voice_mappings=dict(voice_mappings), files=list(files))
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build from a current-version dict (see load() for older versions)"""
+        return cls(
+            generated_at=data['generated_at'],
+            voice_mappings=dict(data['voice_mappings']),
+            files=[ClipEntry.from_dict(entry) for entry in data['files']],
+            version=data['version'],
+        )
+
+    def to_dict(self):
+        return {
+            'version': self.version,
+            'generated_at': self.generated_at,
+            'total_files': len(self.files),
+            'voice_mappings': self.voice_mappings,
+            'files': [entry.to_dict() for entry in self.files],
+        }
+
+
+def utc_timestamp(moment=None):
+    """ISO 8601 UTC timestamp, the version 2 generated_at format"""
+    moment = moment or datetime.now(timezone.utc)
+    return moment.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+# Migrations -----------------------------------------------------------------
+#
+# Each version step is split into a header step and a per-entry step. migrate()
+# chains the steps, so every file entry is read once and upgraded straight to
+# the current version, however old the manifest is.
+
+def migrate_header_1_0(header):
+    generated_at = header.get('generated_at')
+    try:
+        # Legacy timestamps were local time on the machine that ran the script
+        moment = datetime.strptime(generated_at, LEGACY_TIMESTAMP_FORMAT).astimezone()
+    except (TypeError, ValueError):
+        moment = None
+    return {
+        'version': 2,
+        'generated_at': utc_timestamp(moment),
+        'voice_mappings': header.get('voice_mappings') or dict(VOICE_IDS),
+    }
+
+
+def migrate_entry_1_0(entry):
+    return dict(entry, clean_text=clean_text_for_speech(entry.get('clean_text') or entry['text']))
+
+
+def migrate_header_2(header):
+    return {'version': 3}
+
+
+def migrate_entry_2(entry):
+    return dict(entry, variants=[])
+
+
+MIGRATIONS = {
+    # from version: (to version, header step, entry step)
+    LEGACY_VERSION: (2, migrate_header_1_0, migrate_entry_1_0),
+    2: (3, migrate_header_2, migrate_entry_2),
+}
+
+
+def migration_steps(version):
+    """The chain of (header, entry) steps from version up to SCHEMA_VERSION"""
+    steps = []
+    while version != SCHEMA_VERSION:
+        if version not in MIGRATIONS:
+            raise ValueError(f"Unknown manifest version: {version!r}")
+        version, header_step, entry_step = MIGRATIONS[version]
+        steps.append((header_step, entry_step))
+    return steps
+
+
+def migrate(data):
+    """Upgrade a manifest dict of any known version to a Manifest, in one pass
+    over its entries. Exact duplicate entries (left behind by the old fix_*
+    scripts once clean_text is normalised) are dropped."""
+    steps = migration_steps(data.get('version', LEGACY_VERSION))
+
+    header = {key: value for key, value in data.items() if key != 'files'}
+    for header_step, _ in steps:
+        header = dict(header, **header_step(header))
+
+    files = []
+    seen = set()
+    for entry in data.get('files', []):
+        for _, entry_step in steps:
+            entry = entry_step(entry)
+        clip = ClipEntry.from_dict(entry)
+        key = (clip.character, clip.filename, clip.text, clip.clean_text)
+        if key not in seen:
+            seen.add(key)
+            files.append(clip)
+
+    return Manifest(generated_at=header['generated_at'], voice_mappings=dict(header['voice_mappings']),
+                    files=files, version=header['version'])
+
+
+# Validation -----------------------------------------------------------------
+
+def validate(data, audio_dir=None):
+    """Return a list of problems with a manifest dict (empty if it's valid).
+
+    Checks structure and types only unless audio_dir is given, in which case
+    every referenced clip must also exist on disk.
+    """
+    errors = []
+    if data.get('version') != SCHEMA_VERSION:
+        return [f"version is {data.get('version')!r}, expected {SCHEMA_VERSION} (run: audio_manifest.py migrate)"]
+
+    if not isinstance(data.get('generated_at'), str) or not ISO_TIMESTAMP.match(data['generated_at']):
+        errors.append(f"generated_at {data.get('generated_at')!r} is not an ISO 8601 UTC timestamp")
+
+    voices = data.get('voice_mappings')
+    if not isinstance(voices, dict) or not voices:
+        errors.append("voice_mappings is missing")
+        voices = {}
+
+    files = data.get('files')
+    if not isinstance(files, list):
+        return errors + ["files is not a list"]
+    if data.get('total_files') != len(files):
+        errors.append(f"total_files is {data.get('total_files')}, but there are {len(files)} files")
+
+    existing = set(path.name for path in Path(audio_dir).iterdir()) if audio_dir else None
+    seen_text = {}
+    for index, entry in enumerate(files):
+        where = f"files[{index}]"
+        if not isinstance(entry, dict):
+            errors.append(f"{where} is not an object")
+            continue
+
+        fields = [entry.get(name) for name in ('id', 'character', 'filename', 'text', 'clean_text')]
+        if not all(isinstance(value, str) for value in fields):
+            errors.append(f"{where} is missing a field or has a non-string value")
+            continue
+        clip_id, character, filename, text, clean_text = fields
+
+        if character not in voices:
+            errors.append(f"{where} character {character!r} has no voice mapping")
+        if not CLIP_ID.match(clip_id):
+            errors.append(f"{where} id {clip_id!r} is not 8 hex digits")
+
+        stem, _, extension = filename.rpartition('.')
+        if stem != f"{character}_{clip_id}" or extension not in AUDIO_EXTENSIONS:
+            errors.append(f"{where} filename {filename!r} should be {character}_{clip_id}.<audio extension>")
+        if existing is not None and filename not in existing:
+            errors.append(f"{where} {filename} does not exist")
+
+        if clean_text != clean_text_for_speech(clean_text) or not clean_text:
+            errors.append(f"{where} clean_text {clean_text!r} is not cleaned")
+
+        key = (character, text)
+        if seen_text.setdefault(key, filename) != filename:
+            errors.append(f"{where} text for {character} is also voiced by {seen_text[key]}")
+
+        errors.extend(validate_variants(entry.get('variants'), stem, where, existing))
+
+    return errors
+
+
+def validate_variants(variants, stem, where, existing):
+    """Problems with one entry's variants list"""
+    if not isinstance(variants, list):
+        return [f"{where} variants is not a list"]
+
+    errors = []
+    previous_bytes = 0
+    for index, variant in enumerate(variants):
+        label = f"{where}.variants[{index}]"
+        if not isinstance(variant, dict) or not isinstance(variant.get('filename'), str) \
+                or not isinstance(variant.get('type'), str) or not isinstance(variant.get('kbps'), int) \
+                or not isinstance(variant.get('bytes'), int):
+            errors.append(f"{label} needs filename, type, kbps and bytes")
+            continue
+        if not variant['filename'].startswith(f"{stem}."):
+            errors.append(f"{label} {variant['filename']!r} is not a variant of {stem}")
+        if not variant['type'].startswith('audio/'):
+            errors.append(f"{label} type {variant['type']!r} is not an audio MIME type")
+        if variant['bytes'] < previous_bytes:
+            errors.append(f"{label} is out of order (variants are smallest first)")
+        if existing is not None and variant['filename'] not in existing:
+            errors.append(f"{label} {variant['filename']} does not exist")
+        previous_bytes = variant['bytes']
+    return errors
+
+
+# Lookup -----------------------------------------------------------------------
+
+def normalize_text(text):
+    """Whitespace/quote-insensitive form, the same as the runtime fuzzy match"""
+    return re.sub(r'\s+', ' ', text).replace('"', "'").strip()
+
+
+def clip_index(manifest):
+    """(character, normalized text or clean_text) -> clip id"""
+    index = {}
+    for entry in manifest.files:
+        index.setdefault((entry.character, normalize_text(entry.text)), entry.id)
+        index.setdefault((entry.character, normalize_text(entry.clean_text)), entry.id)
+    return index
+
+
+def resolve_clip(index, character, text, clean_text=None):
+    """Clip id for a spoken line, or None"""
+    return index.get((character, normalize_text(text))) or index.get(
+        (character, normalize_text(clean_text or clean_text_for_speech(text))))
+
+
+def load(path):
+    """Read a manifest file of any known version as a current Manifest"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return migrate(json.load(f))
+
+
+def save(manifest, path):
+    """Write a Manifest (generated_at is refreshed by the caller if wanted)"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(manifest.to_dict(), f, indent=2, ensure_ascii=False)
+        f.write('\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Validate or migrate audio/manifest.json')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    validate_parser = subparsers.add_parser('validate', help='check the manifest against the current schema')
+    validate_parser.add_argument('path', nargs='?', default='audio/manifest.json')
+    validate_parser.add_argument('--skip-files', action='store_true', help="don't check that clips exist on disk")
+
+    migrate_parser = subparsers.add_parser('migrate', help='upgrade the manifest to the current schema')
+    migrate_parser.add_argument('path', nargs='?', default='audio/manifest.json')
+    migrate_parser.add_argument('--output', help='write here instead of in place')
+
+    args = parser.parse_args()
+    path = Path(args.path)
+
+    started = time.perf_counter()
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    if args.command == 'validate':
+        errors = validate(data, None if args.skip_files else path.parent)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if errors:
+            print(f"❌ {path}: {len(errors)} problem(s)")
+            for error in errors:
+                print(f"   - {error}")
+            sys.exit(1)
+        print(f"✅ {path}: {len(data['files'])} files, schema version {SCHEMA_VERSION} ({elapsed_ms:.1f}ms)")
+        return
+
+    old_version = data.get('version')
+    manifest = migrate(data)
+    output = Path(args.output) if args.output else path
+    save(manifest, output)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    dropped = len(data.get('files', [])) - len(manifest.files)
+    print(f"🔄 Migrated {path} from version {old_version} to {SCHEMA_VERSION} ({elapsed_ms:.1f}ms)")
+    if dropped:
+        print(f"🧹 Dropped {dropped} duplicate entries")
+    print(f"📋 Saved to: {output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark clip start latency: Web Audio buffers vs <audio> elements
+
+Serves the game locally, opens it in a real browser once per playback engine
+(?audio=webaudio and ?audio=element) and plays the same clips with each:
+first cold (fetched on demand), then again once loaded. Each clip is stopped
+as soon as it starts, so only the start latency is measured, as reported by
+MobileAudioSystem.getPlaybackMetrics().
+
+Needs the Python Playwright package:
+    pip install playwright && playwright install chromium webkit
+"""
+import argparse
+import functools
+import http.server
+import threading
+
+try:
+    from playwright.sync_api import sync_playwright
+except ImportError:
+    sync_playwright = None
+
+ENGINES = ('webaudio', 'element')
+
+# Plays each clip cold and then preloaded, stopping it as soon as it starts
+BENCHMARK_SCRIPT = '''
+async ([clipCount, rounds]) => {
+    const audio = new window.MobileAudioSystem();
+    while (!audio.audioManifest) {
+        await new Promise(resolve => setTimeout(resolve, 50));
+    }
+    await audio.unlockAudio();
+
+    const paths = [...new Set(audio.audioManifest.files.map(file => `./audio/${file.filename}`))]
+        .filter(path => !audio.isClipLoaded(path))
+        .slice(0, clipCount);
+
+    const started = () => audio.startLatencies.preloaded.length + audio.startLatencies.cold.length;
+    for (let round = 0; round < rounds; round++) {
+        for (const path of paths) {
+            const before = started();
+            audio.playAudio(path);
+            while (started() === before) {
+                await new Promise(resolve => setTimeout(resolve, 5));
+            }
+            audio.stop();
+        }
+    }
+    return audio.getPlaybackMetrics();
+}
+'''
+
+
+class QuietHandler(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(directory):
+    """Serve directory on a free localhost port in a background thread"""
+    handler = functools.partial(QuietHandler, directory=directory)
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def format_ms(value):
+    return f"{value:7.1f}" if value is not None else "      -"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare clip start latency of the two playback engines')
+    parser.add_argument('--browser', choices=['chromium', 'webkit', 'firefox'], default='chromium')
+    parser.add_argument('--device', help="Playwright device to emulate, e.g. 'iPhone 13'")
+    parser.add_argument('--clips', type=int, default=20, help='distinct clips to play')
+    parser.add_argument('--rounds', type=int, default=3, help='times each clip is played (the first is cold)')
+    parser.add_argument('--dir', default='.', help='site to serve (. for the sources, dist for the bundle)')
+    args = parser.parse_args()
+
+    if sync_playwright is None:
+        print("❌ Playwright for Python is not installed:")
+        print("   pip install playwright && playwright install chromium webkit")
+        return
+
+    server = serve(args.dir)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/"
+    print(f"⏱️ Benchmarking clip start latency in {args.browser} ({args.clips} clips x {args.rounds} rounds)...")
+
+    results = {}
+    with sync_playwright() as p:
+        launch_args = ['--autoplay-policy=no-user-gesture-required'] if args.browser == 'chromium' else []
+        browser = getattr(p, args.browser).launch(args=launch_args)
+        context_options = dict(p.devices[args.device]) if args.device else {}
+        for engine in ENGINES:
+            context = browser.new_context(**context_options)
+            page = context.new_page()
+            page.goto(f"{base_url}?audio={engine}")
+            results[engine] = page.evaluate(BENCHMARK_SCRIPT, [args.clips, args.rounds])
+            context.close()
+        browser.close()
+    server.shutdown()
+
+    print(f"\n{'engine':<20} {'plays':>6} {'mean ms':>8} {'p95 ms':>8} {'max ms':>8}")
+    for engine, metrics in results.items():
+        if metrics['engine'] != engine:
+            print(f"⚠️  {engine} is not available in this browser (ran {metrics['engine']})")
+        for kind in ('cold', 'preloaded'):
+            stats = metrics[kind]
+            print(f"{engine + ' ' + kind:<20} {stats['count']:>6} {format_ms(stats['meanMs'])} "
+                  f"{format_ms(stats['p95Ms'])} {format_ms(stats['maxMs'])}")
+
+    webaudio, element = (results[engine]['preloaded']['meanMs'] for engine in ENGINES)
+    if webaudio and element:
+        print(f"\n🏁 Preloaded clip start: {webaudio:.1f}ms with Web Audio buffers, {element:.1f}ms with elements")
+
+
+if __name__ == '__main__':
+    main()
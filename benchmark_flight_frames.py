@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Benchmark space flight frame times: canvas renderer vs the DOM version
+
+Serves the game locally and flies to the moon in a real browser twice: once
+with the current code, and once with the page's HTML, CSS and scripts as
+they were at a baseline revision (by default the last one before
+space-renderer.js, when every star and asteroid was a div). Audio and
+everything else comes from the working tree.
+
+For each flight it records the time between animation frames, and from
+Chrome's own counters how often and how long the browser recalculated
+styles and ran layout. The CPU is throttled so the difference shows the
+way it would on a phone.
+
+Needs the Python Playwright package:
+    pip install playwright && playwright install chromium
+"""
+import argparse
+import mimetypes
+import statistics
+import subprocess
+
+from benchmark_audio_playback import serve
+
+try:
+    from playwright.sync_api import sync_playwright
+except ImportError:
+    sync_playwright = None
+
+# Served from the baseline revision; everything else comes from the working tree
+BASELINE_TYPES = ('.html', '.css', '.js')
+
+# Chrome Performance.getMetrics counters compared before and after the flight
+METRICS = ['RecalcStyleCount', 'RecalcStyleDuration', 'LayoutCount', 'LayoutDuration', 'ScriptDuration']
+
+# Starts the flight and records frame intervals until it lands
+FLIGHT_SCRIPT = '''
+async () => {
+    const game = window.game;
+    document.getElementById('startBtn').click();
+    const intervals = [];
+    let last = await new Promise(requestAnimationFrame);
+    while (game.gameState === 'spaceFlight') {
+        const now = await new Promise(requestAnimationFrame);
+        intervals.push(now - last);
+        last = now;
+    }
+    return intervals;
+}
+'''
+
+
+def default_baseline():
+    """The revision before space-renderer.js was added, or HEAD if it isn't committed yet"""
+    added = subprocess.run(['git', 'log', '--diff-filter=A', '--format=%H', '--', 'space-renderer.js'],
+                           capture_output=True, text=True, check=True).stdout.split()
+    return f"{added[-1]}^" if added else 'HEAD'
+
+
+def route_to_revision(page, revision):
+    """Answer requests for the page's HTML, CSS and scripts from a git revision"""
+    def handle(route):
+        path = route.request.url.split('://', 1)[1].split('/', 1)[1].split('?')[0] or 'index.html'
+        if not path.endswith(BASELINE_TYPES):
+            return route.continue_()
+        shown = subprocess.run(['git', 'show', f"{revision}:{path}"], capture_output=True)
+        if shown.returncode != 0:
+            return route.fulfill(status=404)
+        route.fulfill(status=200, body=shown.stdout, content_type=mimetypes.guess_type(path)[0])
+    page.route('**/*', handle)
+
+
+def fly(browser, url, args, revision=None):
+    page = browser.new_page()
+    if revision:
+        route_to_revision(page, revision)
+    session = page.context.new_cdp_session(page)
+    session.send('Performance.enable')
+    session.send('Emulation.setCPUThrottlingRate', {'rate': args.cpu})
+    page.goto(url)
+    page.wait_for_function('window.game !== undefined')
+
+    def metrics():
+        return {metric['name']: metric['value'] for metric in session.send('Performance.getMetrics')['metrics']}
+
+    before = metrics()
+    intervals = page.evaluate(FLIGHT_SCRIPT)
+    after = metrics()
+    page.close()
+    return intervals, {name: after.get(name, 0) - before.get(name, 0) for name in METRICS}
+
+
+def summarize(intervals, counters):
+    ordered = sorted(intervals)
+    return {
+        'frames': len(intervals),
+        'median': statistics.median(ordered),
+        'p95': ordered[int(len(ordered) * 0.95)],
+        'slow': sum(1 for interval in intervals if interval > 1000 / 60 * 1.5),
+        'style': counters['RecalcStyleDuration'] * 1000,
+        'layout': counters['LayoutDuration'] * 1000,
+        'layouts': counters['LayoutCount'],
+        'script': counters['ScriptDuration'] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare space flight frame times before and after the canvas renderer')
+    parser.add_argument('--baseline', help='git revision to compare with (default: the last one before space-renderer.js)')
+    parser.add_argument('--runs', type=int, default=3, help='flights per version')
+    parser.add_argument('--cpu', type=float, default=4, help='CPU slowdown factor')
+    args = parser.parse_args()
+
+    if sync_playwright is None:
+        print("❌ Playwright for Python is not installed:")
+        print("   pip install playwright && playwright install chromium")
+        return
+
+    baseline = args.baseline or default_baseline()
+    server = serve('.')
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+    results = {}
+    with sync_playwright() as p:
+        browser = p.chromium.launch()
+        for name, revision in ((f"DOM ({baseline})", baseline), ('canvas', None)):
+            print(f"🚀 Flying {args.runs} times with {name}...")
+            flights = [fly(browser, url, args, revision) for _ in range(args.runs)]
+            intervals = [interval for flight, _ in flights for interval in flight]
+            counters = {metric: statistics.median(run[metric] for _, run in flights) for metric in METRICS}
+            results[name] = summarize(intervals, counters)
+        browser.close()
+    server.shutdown()
+
+    print(f"\n{'renderer':<22} {'frames':>7} {'median':>8} {'p95':>8} {'slow':>5} "
+          f"{'style':>8} {'layout':>8} {'layouts':>8} {'script':>8}")
+    for name, row in results.items():
+        print(f"{name:<22} {row['frames']:>7} {row['median']:>6.1f}ms {row['p95']:>6.1f}ms {row['slow']:>5} "
+              f"{row['style']:>6.0f}ms {row['layout']:>6.0f}ms {row['layouts']:>8.0f} {row['script']:>6.0f}ms")
+    print(f"\n   Frame intervals over {args.runs} flights at {args.cpu:g}x CPU; style, layout and script time "
+          f"are per flight (median). 'slow' frames took over 1.5 frames at 60 Hz.")
+
+
+if __name__ == '__main__':
+    main()
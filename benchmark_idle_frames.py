@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark frames the game renders per minute while the player is idle
+
+Serves the game locally and leaves it alone on three screens, once with the
+current code and once with the page's HTML, CSS and scripts from a baseline
+revision (by default the last one before this benchmark, when every scene
+loop drew every frame):
+
+    title    the title screen, before the flight
+    garden   the vegetable garden, with nobody moving
+    hidden   the garden again, with the page reported hidden
+
+It counts the frames the game's frame scheduler ran (game.scheduler.frames)
+and reports them per idle minute. Headless Chromium never really hides a
+page, so 'hidden' overrides document.hidden and sends visibilitychange:
+that measures what the game asks for, not the browser's own throttling of
+background tabs.
+
+Needs the Python Playwright package:
+    pip install playwright && playwright install chromium
+"""
+import argparse
+import subprocess
+
+from benchmark_audio_playback import serve
+from benchmark_flight_frames import route_to_revision
+
+try:
+    from playwright.sync_api import sync_playwright
+except ImportError:
+    sync_playwright = None
+
+SCREENS = ['title', 'garden', 'hidden']
+
+# Gets to the screen, lets it settle, then counts frames over `seconds`
+IDLE_SCRIPT = '''
+async ({ screen, seconds }) => {
+    const game = window.game;
+    const wait = ms => new Promise(resolve => setTimeout(resolve, ms));
+    if (screen !== 'title') {
+        await game.startVegetableGame();
+    }
+    if (screen === 'hidden') {
+        Object.defineProperty(document, 'hidden', { configurable: true, get: () => true });
+        Object.defineProperty(document, 'visibilityState', { configurable: true, get: () => 'hidden' });
+        document.dispatchEvent(new Event('visibilitychange'));
+    }
+    await wait(1000);
+    const before = game.scheduler.frames;
+    await wait(seconds * 1000);
+    return game.scheduler.frames - before;
+}
+'''
+
+
+def default_baseline():
+    """The revision before this benchmark was added, or HEAD if it isn't committed yet"""
+    added = subprocess.run(['git', 'log', '--diff-filter=A', '--format=%H', '--', 'benchmark_idle_frames.py'],
+                           capture_output=True, text=True, check=True).stdout.split()
+    return f"{added[-1]}^" if added else 'HEAD'
+
+
+def idle_frames(browser, url, screen, seconds, revision=None):
+    page = browser.new_page()
+    if revision:
+        route_to_revision(page, revision)
+    page.goto(url)
+    page.wait_for_function('window.game !== undefined')
+    frames = page.evaluate(IDLE_SCRIPT, {'screen': screen, 'seconds': seconds})
+    page.close()
+    return frames * 60 / seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare frames rendered per idle minute before and after idle throttling')
+    parser.add_argument('--baseline', help='git revision to compare with (default: the last one before this benchmark)')
+    parser.add_argument('--seconds', type=int, default=30, help='idle time measured on each screen')
+    parser.add_argument('--screen', choices=SCREENS, action='append', help='screens to measure (default: all)')
+    args = parser.parse_args()
+
+    if sync_playwright is None:
+        print("❌ Playwright for Python is not installed:")
+        print("   pip install playwright && playwright install chromium")
+        return
+
+    baseline = args.baseline or default_baseline()
+    screens = args.screen or SCREENS
+    server = serve('.')
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+    results = {}
+    with sync_playwright() as p:
+        browser = p.chromium.launch()
+        for name, revision in ((f"always ({baseline})", baseline), ('idle-aware', None)):
+            print(f"💤 Idling {args.seconds}s on {', '.join(screens)} with {name}...")
+            results[name] = {screen: idle_frames(browser, url, screen, args.seconds, revision) for screen in screens}
+        browser.close()
+    server.shutdown()
+
+    print(f"\n{'frame loop':<24}" + ''.join(f"{screen:>10}" for screen in screens))
+    for name, row in results.items():
+        print(f"{name:<24}" + ''.join(f"{row[screen]:>10.0f}" for screen in screens))
+    print("\n   Frames the game's scheduler ran per idle minute (60 Hz is 3600).")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Benchmark input-to-screen latency of character movement
+
+Serves the game locally, starts the vegetable garden and holds a direction
+again and again, once with the current code and once with the page's HTML,
+CSS and scripts from a baseline revision (by default the last one before
+input-state.js, when every keydown or button repeat moved the character by
+a fixed jump).
+
+For each press it records the time from the press to the first frame in
+which the character has moved on screen, and while the direction is held,
+how many frames showed no movement at all - the steps that made motion look
+jerky. Keyboard presses repeat the way an OS key repeat does (500ms, then
+every 33ms); buttons get a mousedown and, when let go, a mouseup, as the
+on-screen d-pad does on a desktop.
+
+Needs the Python Playwright package:
+    pip install playwright && playwright install chromium
+"""
+import argparse
+import statistics
+import subprocess
+
+from benchmark_audio_playback import serve
+from benchmark_flight_frames import route_to_revision
+
+try:
+    from playwright.sync_api import sync_playwright
+except ImportError:
+    sync_playwright = None
+
+# Starts the garden, then presses and holds a direction `trials` times,
+# alternating left and right so the character stays on screen
+PRESS_SCRIPT = '''
+async ({ input, trials, holdMs }) => {
+    const game = window.game;
+    await game.startVegetableGame();
+    const frame = () => new Promise(requestAnimationFrame);
+    const character = () => game.currentPlayer === 'george' ? game.george : game.matilda;
+    const x = () => character().getBoundingClientRect().left;
+
+    function hold(direction) {
+        const key = direction === 'right' ? 'ArrowRight' : 'ArrowLeft';
+        if (input === 'buttons') {
+            const button = document.querySelector(`.direction-btn[data-direction="${direction}"]`);
+            button.dispatchEvent(new MouseEvent('mousedown', { bubbles: true }));
+            return () => button.dispatchEvent(new MouseEvent('mouseup', { bubbles: true }));
+        }
+        const press = repeat => document.dispatchEvent(new KeyboardEvent('keydown', { key, repeat, bubbles: true }));
+        press(false);
+        let repeating = null;
+        const delay = setTimeout(() => { repeating = setInterval(() => press(true), 33); }, 500);
+        return () => {
+            clearTimeout(delay);
+            clearInterval(repeating);
+            document.dispatchEvent(new KeyboardEvent('keyup', { key, bubbles: true }));
+        };
+    }
+
+    const results = [];
+    for (let trial = 0; trial < trials; trial++) {
+        for (let i = 0; i < 10; i++) await frame();
+        let last = x();
+        const pressed = performance.now();
+        const release = hold(trial % 2 ? 'left' : 'right');
+        let latency = null;
+        let frames = 0;
+        let still = 0;
+        let now = await frame();
+        while (now - pressed < holdMs) {
+            const current = x();
+            const moved = Math.abs(current - last) > 0.01;
+            if (latency === null && moved) latency = now - pressed;
+            if (latency !== null) {
+                frames++;
+                if (!moved) still++;
+            }
+            last = current;
+            now = await frame();
+        }
+        release();
+        results.push({ latency, frames, still });
+    }
+    return results;
+}
+'''
+
+
+def default_baseline():
+    """The revision before input-state.js was added, or HEAD if it isn't committed yet"""
+    added = subprocess.run(['git', 'log', '--diff-filter=A', '--format=%H', '--', 'input-state.js'],
+                           capture_output=True, text=True, check=True).stdout.split()
+    return f"{added[-1]}^" if added else 'HEAD'
+
+
+def measure(browser, url, args, revision=None):
+    page = browser.new_page()
+    if revision:
+        route_to_revision(page, revision)
+    session = page.context.new_cdp_session(page)
+    session.send('Emulation.setCPUThrottlingRate', {'rate': args.cpu})
+    page.goto(url)
+    page.wait_for_function('window.game !== undefined')
+    results = page.evaluate(PRESS_SCRIPT, {'input': args.input, 'trials': args.trials, 'holdMs': args.hold})
+    page.close()
+    return results
+
+
+def summarize(results):
+    latencies = sorted(result['latency'] for result in results if result['latency'] is not None)
+    frames = sum(result['frames'] for result in results)
+    return {
+        'presses': len(results),
+        'missed': len(results) - len(latencies),
+        'median': statistics.median(latencies) if latencies else None,
+        'p95': latencies[int(len(latencies) * 0.95)] if latencies else None,
+        'worst': latencies[-1] if latencies else None,
+        'still': 100 * sum(result['still'] for result in results) / frames if frames else 0,
+    }
+
+
+def format_ms(value):
+    return f"{value:6.1f}ms" if value is not None else "       -"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare press-to-screen latency before and after frame-driven input')
+    parser.add_argument('--baseline', help='git revision to compare with (default: the last one before input-state.js)')
+    parser.add_argument('--input', choices=['keyboard', 'buttons'], default='keyboard')
+    parser.add_argument('--trials', type=int, default=20, help='presses per version')
+    parser.add_argument('--hold', type=int, default=800, help='ms each press is held')
+    parser.add_argument('--cpu', type=float, default=4, help='CPU slowdown factor')
+    args = parser.parse_args()
+
+    if sync_playwright is None:
+        print("❌ Playwright for Python is not installed:")
+        print("   pip install playwright && playwright install chromium")
+        return
+
+    baseline = args.baseline or default_baseline()
+    server = serve('.')
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+    results = {}
+    with sync_playwright() as p:
+        browser = p.chromium.launch()
+        for name, revision in ((f"per key ({baseline})", baseline), ('frame loop', None)):
+            print(f"🎮 Pressing {args.input} {args.trials} times with {name}...")
+            results[name] = summarize(measure(browser, url, args, revision))
+        browser.close()
+    server.shutdown()
+
+    print(f"\n{'input':<24} {'presses':>7} {'missed':>6} {'median':>8} {'p95':>8} {'worst':>8} {'still':>6}")
+    for name, row in results.items():
+        print(f"{name:<24} {row['presses']:>7} {row['missed']:>6} {format_ms(row['median'])} "
+              f"{format_ms(row['p95'])} {format_ms(row['worst'])} {row['still']:>5.0f}%")
+    print(f"\n   Latency is from the press to the first frame showing the character moved, at {args.cpu:g}x CPU. "
+          f"'still' is the share of frames\n   during a {args.hold}ms hold in which the character didn't move.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Benchmark startup: time to an interactive title screen and to first speech
+
+Builds the bundle three ways - as it was (whole script.js, plain
+index.html), split into scene chunks, and split with the critical path
+layout - serves each and loads it in a real browser a few times with an
+empty cache. For each load it reports how much script was downloaded by
+the time the title screen was interactive (the game-ready mark set once
+MoonVegetableGame is constructed), when that was, and time to first speech:
+the first scene's first line is played as soon as the game is ready, and
+the first-speech mark is set when its audio starts. In Chromium the network
+and CPU are throttled to a mid-range phone on a slow connection, where the
+difference shows.
+
+Needs the Python Playwright package:
+    pip install playwright && playwright install chromium webkit
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmark_audio_playback import serve
+
+try:
+    from playwright.sync_api import sync_playwright
+except ImportError:
+    sync_playwright = None
+
+VARIANTS = (
+    ('before', ['--no-split', '--no-critical-path']),
+    ('split', ['--no-critical-path']),
+    ('critical', []),
+)
+
+# Roughly "slow 4G" in Chrome DevTools
+NETWORKS = {
+    'slow4g': {'offline': False, 'latency': 150, 'downloadThroughput': 1.6 * 1024 * 1024 / 8,
+               'uploadThroughput': 750 * 1024 / 8},
+    'none': None,
+}
+
+# Startup timings from the page's own performance entries
+STARTUP_SCRIPT = '''
+async () => {
+    while (!performance.getEntriesByName('game-ready').length) {
+        await new Promise(resolve => setTimeout(resolve, 10));
+    }
+    const ready = performance.getEntriesByName('game-ready')[0].startTime;
+    const navigation = performance.getEntriesByType('navigation')[0];
+    const scripts = performance.getEntriesByType('resource')
+        .filter(entry => entry.name.endsWith('.js') && entry.responseEnd <= ready);
+
+    // Speak the first scene's first line as soon as the game allows
+    const audio = window.game.mobileAudio;
+    while (!audio.sceneClips.length) {
+        await new Promise(resolve => setTimeout(resolve, 5));
+    }
+    audio.unlockAudio();
+    audio.playAudio(audio.sceneClips[0][0]);
+    while (!performance.getEntriesByName('first-speech').length) {
+        await new Promise(resolve => setTimeout(resolve, 5));
+    }
+    audio.stop();
+
+    return {
+        readyMs: ready,
+        domContentLoadedMs: navigation.domContentLoadedEventEnd,
+        firstSpeechMs: performance.getEntriesByName('first-speech')[0].startTime,
+        scriptKB: scripts.reduce((total, entry) => total + entry.encodedBodySize, 0) / 1024,
+        scripts: scripts.length
+    };
+}
+'''
+
+
+def median(runs, key):
+    return statistics.median(run[key] for run in runs)
+
+
+def build(variant_flags, out_dir):
+    subprocess.run([sys.executable, 'build_bundle.py', '--allow-missing', '--out', str(out_dir), *variant_flags],
+                   check=True, stdout=subprocess.DEVNULL)
+
+
+def measure(browser, url, args):
+    context = browser.new_context()
+    page = context.new_page()
+    if args.browser == 'chromium':
+        session = context.new_cdp_session(page)
+        if NETWORKS[args.network]:
+            session.send('Network.enable')
+            session.send('Network.emulateNetworkConditions', NETWORKS[args.network])
+        session.send('Emulation.setCPUThrottlingRate', {'rate': args.cpu})
+    page.goto(url)
+    result = page.evaluate(STARTUP_SCRIPT)
+    context.close()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare startup and first-speech time across bundle layouts')
+    parser.add_argument('--browser', choices=['chromium', 'webkit', 'firefox'], default='chromium')
+    parser.add_argument('--runs', type=int, default=5, help='page loads per variant')
+    parser.add_argument('--network', choices=list(NETWORKS), default='slow4g', help='network throttling (Chromium)')
+    parser.add_argument('--cpu', type=float, default=4, help='CPU slowdown factor (Chromium)')
+    args = parser.parse_args()
+
+    if sync_playwright is None:
+        print("❌ Playwright for Python is not installed:")
+        print("   pip install playwright && playwright install chromium webkit")
+        return
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp, sync_playwright() as p:
+        launch_args = ['--autoplay-policy=no-user-gesture-required'] if args.browser == 'chromium' else []
+        browser = getattr(p, args.browser).launch(args=launch_args)
+        for variant, flags in VARIANTS:
+            out_dir = Path(tmp) / variant
+            print(f"📦 Building the {variant} bundle...")
+            build(flags, out_dir)
+            server = serve(str(out_dir))
+            url = f"http://127.0.0.1:{server.server_address[1]}/"
+            print(f"⏱️ Loading it {args.runs} times in {args.browser}...")
+            results[variant] = [measure(browser, url, args) for _ in range(args.runs)]
+            server.shutdown()
+        browser.close()
+
+    print(f"\n{'bundle':<9} {'scripts':>8} {'script KB':>10} {'DOMContentLoaded':>17} {'interactive':>12} "
+          f"{'first speech':>13}")
+    for variant, runs in results.items():
+        print(f"{variant:<9} {runs[0]['scripts']:>8} {runs[0]['scriptKB']:>10.1f} "
+              f"{median(runs, 'domContentLoadedMs'):>15.0f}ms {median(runs, 'readyMs'):>10.0f}ms "
+              f"{median(runs, 'firstSpeechMs'):>11.0f}ms")
+
+    before, after = results[VARIANTS[0][0]], results[VARIANTS[-1][0]]
+    print(f"\n🏁 Interactive after {median(after, 'readyMs'):.0f}ms (was {median(before, 'readyMs'):.0f}ms), "
+          f"first speech after {median(after, 'firstSpeechMs'):.0f}ms (was {median(before, 'firstSpeechMs'):.0f}ms)")
+    print(f"   Median of {args.runs} loads, {args.network} network, {args.cpu:g}x CPU")
+
+
+if __name__ == '__main__':
+    main()
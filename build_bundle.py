@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+"""
+Build the deployable game into dist/
+
+The source files run as-is for development. The bundle differs in two ways.
+
+Every speak() call site whose text is known at build time is resolved to
+its clip ID from audio/manifest.json, and the ID is passed as an extra
+argument so MobileAudioSystem plays it directly instead of matching text at
+runtime. Dialogue-array objects get a `clip` property for the same reason.
+
+audio/manifest.json must pass audio_manifest.validate(), clips on disk
+included, or the build fails before anything is written.
+
+A line with no clip is a build error (--allow-missing turns that into a
+warning and leaves the call site on runtime matching). Lines built from
+template literals or string concatenation can only be matched at runtime and
+are listed as such.
+
+Scene scripts (scenes/*.json) are compiled fresh into scene-timelines.js by
+compile_scenes.py; a scene that doesn't validate fails the build, and a
+scene line with no clip counts as missing like any other. Dead clips - ones
+no line in the game can play - are left out of dist/audio and its manifest.
+
+audio/scenes.json lists the clips of each scene (the script.js method its
+lines are spoken from), in order, so MobileAudioSystem can keep the current
+and next scene's clips in its cache.
+
+script.js is split into a core and lazily loaded scene chunks in
+dist/chunks/ (see split_script.py), so the title screen doesn't wait for the
+code of every later scene. --no-split keeps it whole.
+
+dist/index.html is laid out for the shortest path to the first spoken line
+(--no-critical-path keeps the plain layout). The CSS the first screen needs
+is inlined and style.css loads without blocking rendering; the scripts start
+downloading from <head> without blocking the parser, scene-timelines.js once
+the page has loaded; the manifest, timing table and scene index are embedded,
+so the audio system doesn't have to fetch them; and the first scene's clips
+get <link rel=preload> hints, so they download alongside the scripts.
+
+log.debug() calls (see logger.js) are removed from the production scripts
+entirely, so hot paths don't even build their log strings. A copy with them
+kept is written to dist/debug/, and dist/index.html loads it instead when the
+page is opened with ?debug=1.
+"""
+import argparse
+import json
+import re
+import shutil
+import sys
+import time
+from pathlib import Path
+
+from critical_css import critical_css, minify
+from audio_manifest import clip_index, load, resolve_clip, save, validate
+from compile_scenes import compile_all, find_dead_clips, render_timelines
+from dialogue_catalog import (CRITICAL_BLOCK_PATTERN, DIALOGUE_OBJECT_PATTERN, SPEAK_PATTERN, extract_catalog,
+                              unquote)
+from js_source import strip_calls
+from split_script import CHUNK_DIR, parse_methods, split, startup_methods
+
+# Files and directories that make up the site
+STATIC_FILES = ['style.css', '_redirects']
+STATIC_DIRS = ['audio']
+
+# Scripts in index.html load order
+SCRIPTS = ['logger.js', 'audio-system.js', 'space-renderer.js', 'game-clock.js', 'scene-lifecycle.js',
+           'entity-store.js', 'collision.js', 'node-pool.js',
+           'input-state.js', 'quality.js', 'scene-timelines.js', 'script.js']
+DEBUG_DIR = 'debug'
+SCRIPT_TAG_PATTERN = re.compile(r'[ \t]*<script src="(?P<src>[^"]+)"></script>\n')
+
+# Written synchronously so the scripts still run before DOMContentLoaded
+SCRIPT_LOADER = """    <script>
+        // ?debug=1 loads the developer bundle, which keeps log.debug() output
+        (function () {
+            const base = /[?&]debug=1\\b/.test(location.search) ? '%s/' : '';
+            for (const src of %s) {
+                document.write(`<script src="${base}${src}"><\\/script>`);
+            }
+        })();
+    </script>
+"""
+
+# Critical path layout: all scripts start loading from <head> and run in
+# order, without blocking the parser; LATE_SCRIPTS wait for the load event
+LATE_SCRIPTS = ['scene-timelines.js']
+HEAD_LOADER = """    <script>
+        // ?debug=1 loads the developer bundle, which keeps log.debug() output
+        (function () {
+            const base = /[?&]debug=1\\b/.test(location.search) ? '%s/' : '';
+            const add = src => {
+                const script = document.createElement('script');
+                script.src = base + src;
+                script.async = false;
+                document.head.appendChild(script);
+            };
+            %s.forEach(add);
+            window.addEventListener('load', () => %s.forEach(add));
+        })();
+    </script>
+"""
+STYLESHEET_TAG = '    <link rel="stylesheet" href="style.css">\n'
+STYLESHEET_LOADER = """    <style>%s</style>
+    <link rel="preload" href="style.css" as="style" onload="this.onload=null; this.rel='stylesheet'">
+    <noscript><link rel="stylesheet" href="style.css"></noscript>
+"""
+# Matches the fetch() in MobileAudioSystem.fetchBuffer, so the response is reused
+AUDIO_PRELOAD = '    <link rel="preload" href="audio/%s" as="fetch" crossorigin>\n'
+EMBEDDED_JSON = ['audio/manifest.json', 'audio/timing.json', 'audio/scenes.json']
+EMBEDDED_JSON_TAG = '    <script type="application/json" id="audio-index">%s</script>\n'
+CLASS_NAME_PATTERN = re.compile(r"className\s*=\s*'([^']+)'")
+
+# this.speak(dialogue.text, dialogue.character) - lines from a dialogue array
+DIALOGUE_SPEAK_PATTERN = re.compile(r'this\.speak\((\w+)\.text,\s*\1\.character\)')
+
+
+def insert_at(lines, inserts):
+    """Apply {(line_number, column): text} insertions, right to left per line"""
+    for (line_number, column), text in sorted(inserts.items(), reverse=True):
+        line = lines[line_number - 1]
+        lines[line_number - 1] = line[:column] + text + line[column:]
+
+
+def rewrite_script(source, entries, index):
+    """Add clip IDs to script.js call sites; returns (source, resolved, missing)"""
+    lines = source.split('\n')
+    inserts = {}
+    resolved = 0
+    missing = []
+
+    for entry in entries:
+        if entry['source'] == 'scene':
+            # Already carry their clip IDs in scene-timelines.js
+            continue
+
+        clip_id = resolve_clip(index, entry['character'], entry['text'], entry['clean_text'])
+        if not clip_id:
+            missing.append(entry)
+            continue
+
+        resolved += 1
+        position = (entry['line_number'], entry['column'])
+        if entry['source'] == 'dialogue-array':
+            inserts[position] = f", clip: '{clip_id}'"
+            continue
+
+        # speak(text) relies on the default character; spell it out before the ID
+        call = next(match for match in SPEAK_PATTERN.finditer(lines[entry['line_number'] - 1])
+                    if entry['column'] in (match.end('arg'), match.end('character')))
+        character = '' if call.group('character') else f", '{entry['character']}'"
+        inserts[position] = f"{character}, '{clip_id}'"
+
+    insert_at(lines, inserts)
+    source = '\n'.join(lines)
+    source = DIALOGUE_SPEAK_PATTERN.sub(r'this.speak(\1.text, \1.character, \1.clip)', source)
+    return source, resolved, missing
+
+
+def rewrite_audio_system(source, index):
+    """Add clip IDs to the preloadCriticalAudio() list; returns (source, missing)"""
+    missing = []
+
+    def add_clip(match):
+        text = unquote(match.group('text'))
+        character = unquote(match.group('character'))
+        clip_id = resolve_clip(index, character, text, text)
+        if not clip_id:
+            missing.append({'character': character, 'text': text})
+            return match.group(0)
+        end = match.end('character') - match.start()
+        return f"{match.group(0)[:end]}, clip: '{clip_id}'{match.group(0)[end:]}"
+
+    def rewrite_block(block):
+        return DIALOGUE_OBJECT_PATTERN.sub(add_clip, block.group(0))
+
+    return CRITICAL_BLOCK_PATTERN.sub(rewrite_block, source), missing
+
+
+def scene_index(entries, index):
+    """{'version': 1, 'scenes': [{'name': method, 'clips': [id, ...]}, ...]} in source order"""
+    scenes = {}
+    for entry in sorted(entries, key=lambda entry: entry['line_number']):
+        clips = scenes.setdefault(entry['method'], [])
+        clip_id = resolve_clip(index, entry['character'], entry['text'], entry['clean_text'])
+        if clip_id and clip_id not in clips:
+            clips.append(clip_id)
+    return {'version': 1, 'scenes': [{'name': name, 'clips': clips} for name, clips in scenes.items() if clips]}
+
+
+def script_tags(html):
+    tags = [match for match in SCRIPT_TAG_PATTERN.finditer(html) if match.group('src') in SCRIPTS]
+    if [match.group('src') for match in tags] != SCRIPTS:
+        raise ValueError(f"index.html should load {', '.join(SCRIPTS)} in that order")
+    return tags
+
+
+def js_list(names):
+    return '[' + ', '.join(f"'{name}'" for name in names) + ']'
+
+
+def rewrite_index(html):
+    """Swap the script tags in index.html for the debug-aware loader"""
+    tags = script_tags(html)
+    loader = SCRIPT_LOADER % (DEBUG_DIR, js_list(SCRIPTS))
+    return html[:tags[0].start()] + loader + html[tags[-1].end():]
+
+
+def startup_classes(script, helpers=()):
+    """Class names the game gives elements it creates on startup. Helper
+    scripts (classes script.js builds on) count in full."""
+    methods = parse_methods(script)
+    startup = startup_methods(methods)
+    bodies = [method.body for method in methods if method.name in startup] + list(helpers)
+    return {name for body in bodies for value in CLASS_NAME_PATTERN.findall(body) for name in value.split()}
+
+
+def first_scene_preloads(out_dir):
+    """Clip files of the first scene in the scene index. Clips with codec
+    variants are left out; which one plays is only decided at runtime."""
+    with open(out_dir / 'audio' / 'scenes.json', 'r', encoding='utf-8') as f:
+        scenes = json.load(f)['scenes']
+    files = {entry.id: entry for entry in load(out_dir / 'audio' / 'manifest.json').files}
+    clips = [files[clip_id] for clip_id in (scenes[0]['clips'] if scenes else []) if clip_id in files]
+    return [entry.filename for entry in clips if not entry.variants]
+
+
+def critical_path_index(html, css, preloads, embedded):
+    """index.html with critical CSS inlined, scripts loaded from <head>
+    without blocking, audio hints and the embedded audio index"""
+    tags = script_tags(html)
+    if STYLESHEET_TAG not in html:
+        raise ValueError("index.html should link style.css")
+
+    data = json.dumps(embedded, ensure_ascii=False, separators=(',', ':')).replace('</', '<\\/')
+    html = html[:tags[0].start()] + EMBEDDED_JSON_TAG % data + html[tags[-1].end():]
+
+    early = [src for src in SCRIPTS if src not in LATE_SCRIPTS]
+    head = (STYLESHEET_LOADER % css + ''.join(AUDIO_PRELOAD % filename for filename in preloads)
+            + HEAD_LOADER % (DEBUG_DIR, js_list(early), js_list(LATE_SCRIPTS)))
+    html = html.replace(STYLESHEET_TAG, '')
+    return html.replace('</head>', head + '</head>', 1)
+
+
+def write_scripts(out_dir, sources):
+    """Production scripts without log.debug() in out_dir, full ones in out_dir/debug"""
+    debug_dir = out_dir / DEBUG_DIR
+    debug_dir.mkdir()
+    stripped = 0
+    saved = 0
+    for name, source in sources.items():
+        production, count = strip_calls(source, 'log.debug')
+        stripped += count
+        saved += len(source.encode('utf-8')) - len(production.encode('utf-8'))
+        for path, text in ((out_dir / name, production), (debug_dir / name, source)):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(text, encoding='utf-8')
+    return stripped, saved
+
+
+def prune_audio(audio_dir, manifest, dead):
+    """Delete dead clips (and their variants) from a copied audio directory
+    and its manifest and timing table; returns (files, bytes) removed"""
+    dead = set(dead)
+    removed = 0
+    saved = 0
+    for entry in manifest.files:
+        if entry.filename not in dead:
+            continue
+        for filename in [entry.filename] + [variant.filename for variant in entry.variants]:
+            path = audio_dir / filename
+            if path.exists():
+                saved += path.stat().st_size
+                path.unlink()
+                removed += 1
+
+    manifest.files = [entry for entry in manifest.files if entry.filename not in dead]
+    save(manifest, audio_dir / 'manifest.json')
+
+    timing_path = audio_dir / 'timing.json'
+    if timing_path.exists():
+        with open(timing_path, 'r', encoding='utf-8') as f:
+            timing = json.load(f)
+        timing['clips'] = {name: row for name, row in timing['clips'].items() if name not in dead}
+        with open(timing_path, 'w', encoding='utf-8') as f:
+            json.dump(timing, f, separators=(',', ':'))
+    return removed, saved
+
+
+def copy_static(out_dir):
+    for name in STATIC_FILES:
+        if Path(name).exists():
+            shutil.copy2(name, out_dir / name)
+    for name in STATIC_DIRS:
+        shutil.copytree(name, out_dir / name, dirs_exist_ok=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the deployable game into dist/')
+    parser.add_argument('--out', default='dist')
+    parser.add_argument('--allow-missing', action='store_true',
+                        help='warn about lines with no clip instead of failing the build')
+    parser.add_argument('--no-split', action='store_true', help='ship script.js whole instead of in scene chunks')
+    parser.add_argument('--no-critical-path', action='store_true',
+                        help='keep the plain index.html layout (no inlined CSS, preloads or embedded audio index)')
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    out_dir = Path(args.out)
+    if out_dir.exists():
+        shutil.rmtree(out_dir)
+    out_dir.mkdir(parents=True)
+
+    manifest_path = Path('audio/manifest.json')
+    manifest_errors = validate(json.loads(manifest_path.read_text(encoding='utf-8')), manifest_path.parent)
+    if manifest_errors:
+        print(f"❌ {manifest_path}: {len(manifest_errors)} problem(s)")
+        for error in manifest_errors:
+            print(f"   - {error}")
+        print("   Fix them, or upgrade an older manifest with: python3 audio_manifest.py migrate")
+        shutil.rmtree(out_dir)
+        sys.exit(1)
+    print(f"📋 {manifest_path} is valid")
+
+    manifest = load(manifest_path)
+    index = clip_index(manifest)
+
+    timelines, scene_errors, scene_missing = compile_all()
+    if scene_errors:
+        print(f"❌ {len(scene_errors)} problem(s) in scene scripts:")
+        for error in scene_errors:
+            print(f"   - {error}")
+        shutil.rmtree(out_dir)
+        sys.exit(1)
+    print(f"🎬 Compiled {len(timelines)} scene scripts")
+
+    entries, dynamic = extract_catalog('script.js')
+    script, resolved, missing = rewrite_script(Path('script.js').read_text(encoding='utf-8'), entries, index)
+    audio_system, critical_missing = rewrite_audio_system(Path('audio-system.js').read_text(encoding='utf-8'), index)
+
+    scene_lines = sum(len(timeline['lines']) for timeline in timelines.values())
+    resolved += scene_lines - len(scene_missing)
+    print(f"🔗 Resolved {resolved} of {len(entries)} speak() lines to clip IDs")
+    print(f"🔀 {len(dynamic)} dynamic call sites stay on runtime matching")
+
+    problems = [f"script.js:{entry['line_number']} [{entry['character']}] {entry['text']}" for entry in missing]
+    problems += [f"scenes/{name}.json [{character}] {text}" for name, character, text in scene_missing]
+    problems += [f"audio-system.js criticalTexts [{item['character']}] {item['text']}" for item in critical_missing]
+    if problems:
+        marker = '⚠️ ' if args.allow_missing else '❌'
+        print(f"{marker} {len(problems)} line(s) have no audio clip:")
+        for problem in problems:
+            print(f"   - {problem}")
+        if not args.allow_missing:
+            print("   Generate them (plan_audio_budget.py lists what's missing) or use --allow-missing")
+            shutil.rmtree(out_dir)
+            sys.exit(1)
+
+    # Scripts the bundler rewrites, then the rest as they are
+    sources = {'audio-system.js': audio_system, 'scene-timelines.js': render_timelines(timelines), 'script.js': script}
+    for src in SCRIPTS:
+        sources.setdefault(src, Path(src).read_text(encoding='utf-8'))
+    if not args.no_split:
+        try:
+            core, chunks = split(script)
+        except ValueError as e:
+            print(f"❌ {e}")
+            shutil.rmtree(out_dir)
+            sys.exit(1)
+        sources['script.js'] = core
+        sources.update({f"{CHUNK_DIR}/{name}.js": chunk for name, chunk in chunks.items()})
+        print(f"🧩 Split script.js into a {len(core.encode('utf-8')) / 1024:.1f} KB core and {len(chunks)} scene "
+              f"chunks ({sum(len(chunk.encode('utf-8')) for chunk in chunks.values()) / 1024:.1f} KB)")
+
+    stripped, saved = write_scripts(out_dir, sources)
+    print(f"🔇 Stripped {stripped} log.debug() calls from the production scripts ({saved / 1024:.1f} KB)")
+
+    copy_static(out_dir)
+
+    removed, pruned = prune_audio(out_dir / 'audio', manifest, find_dead_clips(manifest, entries, dynamic))
+    print(f"🧹 Left out {removed} dead audio file(s) ({pruned / 1024:.1f} KB)")
+
+    scenes = scene_index(entries, index)
+    with open(out_dir / 'audio' / 'scenes.json', 'w', encoding='utf-8') as f:
+        json.dump(scenes, f, separators=(',', ':'))
+    print(f"🎬 Scene index: {len(scenes['scenes'])} scenes")
+
+    html = Path('index.html').read_text(encoding='utf-8')
+    if args.no_critical_path:
+        html = rewrite_index(html)
+    else:
+        css = minify(critical_css(Path('style.css').read_text(encoding='utf-8'), html,
+                                        startup_classes(script, [sources['space-renderer.js']])))
+        preloads = first_scene_preloads(out_dir)
+        embedded = {}
+        for name in EMBEDDED_JSON:
+            with open(out_dir / name, 'r', encoding='utf-8') as f:
+                embedded[f"./{name}"] = json.load(f)
+        html = critical_path_index(html, css, preloads, embedded)
+        print(f"⚡ Critical path: {len(css) / 1024:.1f} KB CSS inlined, {len(preloads)} clip(s) preloaded, "
+              f"{len(embedded)} audio index files embedded")
+    (out_dir / 'index.html').write_text(html, encoding='utf-8')
+
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    print(f"📦 Bundle written to {out_dir}/ ({elapsed_ms:.0f}ms)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+// Collision checks
+// Pickups and furniture interactions were found by taking Math.sqrt of the
+// distance to every vegetable, and to each piece of furniture from positions
+// worked out again every frame. Distances are now compared squared, spawned
+// items are kept in a uniform grid so a check only looks at the cells around
+// the character, and furniture gets an interaction zone when its scene is
+// built.
+
+// True if (ax, ay) is closer than `radius` to (bx, by)
+function withinRadius(ax, ay, bx, by, radius) {
+    const dx = ax - bx;
+    const dy = ay - by;
+    return dx * dx + dy * dy < radius * radius;
+}
+
+// Circles around the fixed furniture of the current scene, by name
+class InteractionZones {
+    constructor() {
+        this.zones = new Map(); // name -> { x, y, radius }
+    }
+
+    add(name, x, y, radius) {
+        this.zones.set(name, { x, y, radius });
+    }
+
+    // False if the scene has no such zone
+    contains(name, x, y) {
+        const zone = this.zones.get(name);
+        return zone !== undefined && withinRadius(x, y, zone.x, zone.y, zone.radius);
+    }
+
+    clear() {
+        this.zones.clear();
+    }
+}
+
+// Items bucketed by position into square cells, for finding the ones near a point
+class SpatialGrid {
+    constructor(cellSize = 64) {
+        this.cellSize = cellSize;
+        this.cells = new Map(); // cell key -> Set of items
+        this.items = new Map(); // item -> { x, y, key }
+        this.checks = 0; // distance checks made by query()
+    }
+
+    get size() {
+        return this.items.size;
+    }
+
+    cellKey(column, row) {
+        return column * 65536 + row;
+    }
+
+    insert(item, x, y) {
+        this.remove(item);
+        const key = this.cellKey(Math.floor(x / this.cellSize), Math.floor(y / this.cellSize));
+        let cell = this.cells.get(key);
+        if (!cell) {
+            cell = new Set();
+            this.cells.set(key, cell);
+        }
+        cell.add(item);
+        this.items.set(item, { x, y, key });
+    }
+
+    remove(item) {
+        const entry = this.items.get(item);
+        if (!entry) return;
+        const cell = this.cells.get(entry.key);
+        cell.delete(item);
+        if (cell.size === 0) this.cells.delete(entry.key);
+        this.items.delete(item);
+    }
+
+    // Items closer than `radius` to (x, y); only the cells the circle
+    // overlaps are looked at
+    query(x, y, radius) {
+        const found = [];
+        const size = this.cellSize;
+        const lastColumn = Math.floor((x + radius) / size);
+        const lastRow = Math.floor((y + radius) / size);
+        for (let column = Math.floor((x - radius) / size); column <= lastColumn; column++) {
+            for (let row = Math.floor((y - radius) / size); row <= lastRow; row++) {
+                const cell = this.cells.get(this.cellKey(column, row));
+                if (!cell) continue;
+                for (const item of cell) {
+                    const entry = this.items.get(item);
+                    this.checks++;
+                    if (withinRadius(x, y, entry.x, entry.y, radius)) found.push(item);
+                }
+            }
+        }
+        return found;
+    }
+
+    clear() {
+        this.cells.clear();
+        this.items.clear();
+    }
+}
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Compile scenes/*.json into scene-timelines.js
+
+Validates every scene script (see scene_scripts.py for the format) and turns
+it into a compact timeline that MoonVegetableGame.runScene() plays:
+
+    window.SCENE_TIMELINES = {
+        name: {
+            styles: [cssText, ...],              each distinct element style once
+            elements: [[text, style], ...],      every element, rows expanded
+            timeline: [op, ...],                 ['clear'] ['call', method]
+                                                 ['show', first, end] ['wait', ms]
+                                                 ['say', text, character, clip, ms]
+            lines: [{text, character, clip}],    spoken lines in order, for prefetching
+            durationMs: ...                      waits plus known clip lengths
+        }
+    }
+
+Each line is resolved to its clip ID and length from audio/manifest.json and
+audio/timing.json at compile time, so the game never matches scene text at
+runtime. Lines with no clip are reported (and fail build_bundle.py).
+
+The compiler also knows every line the game can speak, so it reports dead
+clips: manifest files no static line, scene line or dynamic call site can
+ever play. build_bundle.py leaves them out of dist/.
+
+Usage:
+    python3 compile_scenes.py            # write scene-timelines.js
+    python3 compile_scenes.py --check    # fail if it's out of date
+"""
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+from audio_manifest import clip_index, load, normalize_text, resolve_clip
+from dialogue_catalog import METHOD_PATTERN, clean_text_for_speech, extract_catalog
+from scene_scripts import (DEFAULT_STYLE, SCENES_DIR, load_scene, load_styles, scene_names,
+                           validate_scene)
+from tts_backends import VOICE_IDS
+
+OUTPUT = 'scene-timelines.js'
+HEADER = '// Generated by compile_scenes.py from scenes/*.json - do not edit\n'
+
+# ${...} in a template literal
+TEMPLATE_EXPRESSION = re.compile(r'\$\{[^}]*\}')
+
+
+def game_methods(script_path='script.js'):
+    """Names of the MoonVegetableGame methods a call step may use"""
+    lines = Path(script_path).read_text(encoding='utf-8').split('\n')
+    return {match.group(1) for match in map(METHOD_PATTERN.match, lines) if match}
+
+
+def load_durations(path='audio/timing.json'):
+    """filename -> clip length in ms (empty if there's no timing table yet)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return {filename: row[0] for filename, row in json.load(f)['clips'].items()}
+    except FileNotFoundError:
+        return {}
+
+
+def css_text(css):
+    return '; '.join(f"{name}: {value}" for name, value in css.items())
+
+
+def expand_element(element, styles):
+    """(text, css) for an element, or for each item of a row"""
+    css = dict(styles[element.get('style', DEFAULT_STYLE)], **element.get('css', {}))
+    if 'row' not in element:
+        return [(element.get('text', ''), css)]
+
+    expanded = []
+    for position, text in enumerate(element['row']):
+        item_css = dict(css, left=f"{element['left'] + position * element['spacing']:g}px")
+        if element.get('stagger'):
+            item_css['animation-delay'] = f"{position * element['stagger']:g}s"
+        expanded.append((text, item_css))
+    return expanded
+
+
+def compile_scene(scene, styles, index, files_by_id, durations):
+    """Return (timeline, missing lines) for one validated scene"""
+    style_table = []
+    elements = []
+    timeline = []
+    lines = []
+    missing = []
+    duration_ms = 0
+
+    for step in scene['steps']:
+        if 'clear' in step:
+            timeline.append(['clear'])
+        elif 'call' in step:
+            timeline.append(['call', step['call']])
+        elif 'wait' in step:
+            timeline.append(['wait', step['wait']])
+            duration_ms += step['wait']
+        elif 'show' in step:
+            first = len(elements)
+            for element in step['show']:
+                for text, css in expand_element(element, styles):
+                    style = css_text(css)
+                    if style not in style_table:
+                        style_table.append(style)
+                    elements.append([text, style_table.index(style)])
+            timeline.append(['show', first, len(elements)])
+        elif 'say' in step:
+            text, character = step['say'], step.get('character', 'narrator')
+            clip = resolve_clip(index, character, text)
+            clip_ms = durations.get(files_by_id[clip]) if clip else None
+            if not clip:
+                missing.append((character, text))
+            duration_ms += clip_ms or 0
+            timeline.append(['say', text, character, clip, clip_ms])
+            lines.append({'text': text, 'character': character, 'clip': clip})
+
+    compiled = {'styles': style_table, 'elements': elements, 'timeline': timeline, 'lines': lines,
+                'durationMs': duration_ms}
+    return compiled, missing
+
+
+def compile_all(scenes_dir=SCENES_DIR, manifest_path='audio/manifest.json', script_path='script.js'):
+    """Return (timelines, errors, missing) for every scene in scenes_dir"""
+    styles = load_styles(scenes_dir)
+    methods = game_methods(script_path)
+    manifest = load(manifest_path)
+    index = clip_index(manifest)
+    files_by_id = {entry.id: entry.filename for entry in manifest.files}
+    durations = load_durations(Path(manifest_path).parent / 'timing.json')
+
+    timelines = {}
+    errors = []
+    missing = []
+    for name in scene_names(scenes_dir):
+        scene = load_scene(name, scenes_dir)
+        scene_errors = validate_scene(scene, name, styles, methods)
+        if scene_errors:
+            errors += scene_errors
+            continue
+        timelines[name], scene_missing = compile_scene(scene, styles, index, files_by_id, durations)
+        missing += [(name, character, text) for character, text in scene_missing]
+    return timelines, errors, missing
+
+
+def render_timelines(timelines):
+    body = json.dumps(timelines, ensure_ascii=False, separators=(',', ':'))
+    return f"{HEADER}window.SCENE_TIMELINES = {body};\n"
+
+
+# Dead clips -----------------------------------------------------------------
+
+def template_patterns(site):
+    """Regexes for the texts a dynamic call site can produce, or None if it
+    could say anything (a variable we can't see into)"""
+    text = site['text']
+    if text.startswith('`'):
+        template = TEMPLATE_EXPRESSION.sub('\0', text[1:-1])
+    elif site['source'] == 'dialogue-array':
+        # "Matilda: We collected " + count + ...
+        template = text + '\0'
+    else:
+        return None
+
+    # JS escapes; a stray backslash (let\\'s) doesn't reach the player
+    template = re.sub(r'\\(.)', lambda m: {'n': '\n', 't': '\t'}.get(m.group(1), m.group(1)), template)
+    template = template.replace('\\', '')
+
+    patterns = []
+    for variant in (template, clean_text_for_speech(template.replace('\0', '\1')).replace('\1', '\0')):
+        parts = [re.escape(normalize_text(part) if part.strip() else part) for part in variant.split('\0')]
+        patterns.append(re.compile('^' + '.*'.join(parts) + '$', re.DOTALL))
+    return patterns
+
+
+def find_dead_clips(manifest, entries, dynamic):
+    """Manifest filenames that no line in the game can ever play"""
+    index = clip_index(manifest)
+    live_ids = {resolve_clip(index, entry['character'], entry['text'], entry['clean_text']) for entry in entries}
+
+    sites = []
+    for site in dynamic:
+        character = site['character'] if site['character'] in VOICE_IDS else None
+        sites.append((character, template_patterns(site)))
+
+    live_files = set()
+    all_files = []
+    for entry in manifest.files:
+        if entry.filename not in all_files:
+            all_files.append(entry.filename)
+        if entry.id in live_ids:
+            live_files.add(entry.filename)
+            continue
+        texts = (normalize_text(entry.text), normalize_text(entry.clean_text))
+        for character, patterns in sites:
+            if character not in (None, entry.character):
+                continue
+            if patterns is None or any(pattern.match(text) for pattern in patterns for text in texts):
+                live_files.add(entry.filename)
+                break
+
+    return [filename for filename in all_files if filename not in live_files]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compile scenes/*.json into scene-timelines.js')
+    parser.add_argument('--output', default=OUTPUT)
+    parser.add_argument('--check', action='store_true', help="don't write; fail if the output is out of date")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    timelines, errors, missing = compile_all()
+    if errors:
+        print(f"❌ {len(errors)} problem(s) in scene scripts:")
+        for error in errors:
+            print(f"   - {error}")
+        sys.exit(1)
+
+    for name, compiled in timelines.items():
+        print(f"🎬 {name:<24} {len(compiled['timeline']):>3} steps, {len(compiled['lines'])} lines, "
+              f"{len(compiled['elements'])} elements, {compiled['durationMs'] / 1000:.1f}s")
+    for name, character, text in missing:
+        print(f"⚠️  {name}: no clip for [{character}] {text}")
+
+    entries, dynamic = extract_catalog('script.js')
+    dead = find_dead_clips(load('audio/manifest.json'), entries, dynamic)
+    print(f"🧹 {len(dead)} dead clip(s) no line can play" + (':' if dead else ''))
+    for filename in dead:
+        print(f"   - {filename}")
+
+    output = render_timelines(timelines)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    if args.check:
+        current = Path(args.output).read_text(encoding='utf-8') if Path(args.output).exists() else None
+        if current != output:
+            print(f"❌ {args.output} is out of date; run: python3 compile_scenes.py")
+            sys.exit(1)
+        print(f"✅ {args.output} is up to date ({elapsed_ms:.0f}ms)")
+        return
+
+    Path(args.output).write_text(output, encoding='utf-8')
+    print(f"📋 Wrote {args.output}: {len(timelines)} scenes, {len(output) / 1024:.1f} KB ({elapsed_ms:.0f}ms)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Critical CSS - the rules the first screen needs, to inline into index.html
+
+A rule is critical if every class, id and element its selector names is
+on the page when it first renders: in index.html itself, or added by the
+code the game runs on startup (given as extra class names). @media blocks
+keep their critical rules, and @keyframes are kept when a critical rule
+animates with them.
+
+The full stylesheet still loads afterwards without blocking rendering, and
+since it repeats every inlined rule in its original order the final cascade
+is exactly the same as linking it normally.
+
+Usage:
+    python3 critical_css.py      # show what index.html would inline
+"""
+import re
+
+COMMENT = re.compile(r'/\*.*?\*/', re.DOTALL)
+CLASS_ATTRIBUTE = re.compile(r'\bclass="([^"]*)"')
+ID_ATTRIBUTE = re.compile(r'\bid="([^"]*)"')
+TAG = re.compile(r'<([a-zA-Z][a-zA-Z0-9]*)')
+# .class, #id or a tag name at the start of a compound selector
+SELECTOR_PART = re.compile(r'([.#]?)(-?[_a-zA-Z][\w-]*)')
+PSEUDO = re.compile(r'::?[\w-]+(\([^)]*\))?')
+ANIMATION = re.compile(r'animation(?:-name)?\s*:\s*([^;}]+)')
+
+
+def parse_blocks(css):
+    """[(prelude, body)] for each top-level rule or at-rule block"""
+    css = COMMENT.sub('', css)
+    blocks = []
+    i = 0
+    while True:
+        open_brace = css.find('{', i)
+        if open_brace == -1:
+            return blocks
+        depth = 0
+        for j in range(open_brace, len(css)):
+            if css[j] == '{':
+                depth += 1
+            elif css[j] == '}':
+                depth -= 1
+                if depth == 0:
+                    break
+        blocks.append((css[i:open_brace].strip(), css[open_brace + 1:j]))
+        i = j + 1
+
+
+def page_names(html, extra_classes=()):
+    """({'.class', '#id', 'tag'}) present in the page's markup"""
+    names = {tag.lower() for tag in TAG.findall(html)} | {'html', '*'}
+    for attribute in CLASS_ATTRIBUTE.findall(html):
+        names |= {f".{name}" for name in attribute.split()}
+    names |= {f"#{name}" for name in ID_ATTRIBUTE.findall(html)}
+    names |= {f".{name}" for name in extra_classes}
+    return names
+
+
+def selector_matches(selector, names):
+    selector = PSEUDO.sub('', selector)
+    for prefix, name in SELECTOR_PART.findall(selector):
+        if f"{prefix}{name.lower() if not prefix else name}" not in names:
+            return False
+    return True
+
+
+def critical_rules(blocks, names):
+    """Critical rules of a list of blocks, and the animations they use"""
+    kept = []
+    animations = set()
+    for prelude, body in blocks:
+        if prelude.startswith('@media'):
+            inner, inner_animations = critical_rules(parse_blocks(body), names)
+            if inner:
+                kept.append(f"{prelude} {{\n{inner}\n}}")
+                animations |= inner_animations
+        elif prelude.startswith('@'):
+            continue
+        elif any(selector_matches(selector, names) for selector in prelude.split(',')):
+            kept.append(f"{prelude} {{{body}}}")
+            for value in ANIMATION.findall(body):
+                animations |= set(value.split())
+    return '\n'.join(kept), animations
+
+
+def critical_css(css, html, extra_classes=()):
+    """The CSS the page needs for its first render"""
+    blocks = parse_blocks(css)
+    rules, animations = critical_rules(blocks, page_names(html, extra_classes))
+    keyframes = [f"{prelude} {{{body}}}" for prelude, body in blocks
+                 if prelude.startswith('@keyframes') and prelude.split()[1] in animations]
+    return '\n'.join([rules] + keyframes)
+
+
+def minify(css):
+    """Collapse whitespace; the inlined copy isn't meant to be read"""
+    css = re.sub(r'\s+', ' ', css)
+    return re.sub(r'\s*([{};:,])\s*', r'\1', css).strip()
+
+
+def main():
+    with open('style.css', 'r', encoding='utf-8') as f:
+        css = f.read()
+    with open('index.html', 'r', encoding='utf-8') as f:
+        html = f.read()
+
+    critical = minify(critical_css(css, html))
+    print(f"🎨 style.css: {len(css) / 1024:.1f} KB, critical for index.html: {len(critical) / 1024:.1f} KB")
+    print(critical)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Dialogue catalog - every spoken line in script.js, in scene order
+
+Scans the game source the same way the extract_* scripts do, but keeps the
+line number and enclosing method of every call site so other tools can plan
+work in the order the player actually hears it.
+"""
+import hashlib
+import re
+from pathlib import Path
+
+from scene_scripts import SCENES_DIR, load_scene, scene_lines
+
+CHARACTERS = ('narrator', 'george', 'matilda', 'moondog')
+
+EMOJI_PATTERN = r'[🚀👨‍🚀👩‍🚀🐕‍🦺🧊😢💖👨‍🍳👩‍🍳🥕🥬🌽🍅🥒🥔🌙🏠🚪😋🎉🎆✨🎈❤️🌉🏙️🗽🏢🏬🏘️🏡🚋🤵👰🌅]'
+
+# A single- or double-quoted JS string literal (no template literals)
+STRING_LITERAL = r"""'(?:[^'\\\n]|\\.)*'|"(?:[^"\\\n]|\\.)*\""""
+
+METHOD_PATTERN = re.compile(r'^    (?:async\s+)?(\w+)\s*\([^)]*\)\s*\{\s*$')
+SPEAK_PATTERN = re.compile(
+    r'this\.speak\(\s*(?P<arg>' + STRING_LITERAL + r'|`[^`]*`|[\w.]+)'
+    r'\s*(?:,\s*(?P<character>' + STRING_LITERAL + r'|[\w.]+))?\s*\)'
+)
+CONST_TEXT_PATTERN = re.compile(r'const\s+(\w+)\s*=\s*(' + STRING_LITERAL + r'|`[^`]*`)\s*;')
+DIALOGUE_OBJECT_PATTERN = re.compile(
+    r'\{\s*text:\s*(?P<text>' + STRING_LITERAL + r')\s*(?P<concat>\+)?[^}]*?'
+    r'character:\s*(?P<character>' + STRING_LITERAL + r')\s*\}'
+)
+CRITICAL_BLOCK_PATTERN = re.compile(r'const criticalTexts = \[(.*?)\];', re.DOTALL)
+RUN_SCENE_PATTERN = re.compile(r"this\.runScene\('(?P<name>\w+)'\)")
+
+
+def generate_dialogue_id(text, character):
+    """Generate unique ID for dialogue (same scheme as the generators)"""
+    combined = f"{text}_{character}"
+    return hashlib.md5(combined.encode()).hexdigest()[:8]
+
+
+def clean_text_for_speech(text):
+    """Clean text for speech synthesis - remove emojis and character prefixes"""
+    text = re.sub(EMOJI_PATTERN, '', text)
+    text = re.sub(r'^\s*(George|Matilda|Moon\s*Dog|Narrator)\s*[:\-]\s*', '', text, flags=re.IGNORECASE)
+    return text.strip()
+
+
+def unquote(literal):
+    """Turn a quoted JS string literal into its Python value"""
+    body = literal[1:-1]
+    return re.sub(r'\\(.)', lambda m: {'n': '\n', 't': '\t'}.get(m.group(1), m.group(1)), body)
+
+
+def make_entry(text, character, line_number, method, source, column=None):
+    """Build one catalog entry.
+
+    ``column`` is where the call site's last argument (or the dialogue
+    object's character property) ends, so a build step can insert after it.
+    """
+    return {
+        'id': generate_dialogue_id(text, character),
+        'character': character,
+        'text': text,
+        'clean_text': clean_text_for_speech(text),
+        'line_number': line_number,
+        'method': method,
+        'source': source,
+        'column': column,
+    }
+
+
+def extract_catalog(script_path='script.js'):
+    """Return (entries, dynamic) for every speak() call site in source order.
+
+    ``entries`` are lines whose text is known at build time. ``dynamic`` lists
+    call sites built from template literals or string concatenation, which can
+    only be matched at runtime. Lines of a scene script run with
+    this.runScene('name') are listed at the runScene() call, with source 'scene'.
+    """
+    script_path = Path(script_path)
+    scenes_dir = script_path.parent / SCENES_DIR
+    lines = script_path.read_text(encoding='utf-8').split('\n')
+
+    entries = []
+    dynamic = []
+    method = None
+    constants = {}
+
+    for index, line in enumerate(lines):
+        line_number = index + 1
+
+        method_match = METHOD_PATTERN.match(line)
+        if method_match:
+            method = method_match.group(1)
+            constants = {}
+            continue
+
+        scene_match = RUN_SCENE_PATTERN.search(line)
+        if scene_match:
+            scene = load_scene(scene_match.group('name'), scenes_dir)
+            for text, character in scene_lines(scene):
+                entries.append(make_entry(text, character, line_number, method, 'scene'))
+            continue
+
+        for const_match in CONST_TEXT_PATTERN.finditer(line):
+            constants[const_match.group(1)] = (const_match.group(2), line_number)
+
+        dialogue_match = DIALOGUE_OBJECT_PATTERN.search(line)
+        if dialogue_match:
+            text = unquote(dialogue_match.group('text'))
+            character = unquote(dialogue_match.group('character'))
+            if dialogue_match.group('concat'):
+                dynamic.append({'character': character, 'text': text, 'line_number': line_number,
+                                'method': method, 'source': 'dialogue-array'})
+            else:
+                entries.append(make_entry(text, character, line_number, method, 'dialogue-array',
+                                          dialogue_match.end('character')))
+            continue
+
+        for speak_match in SPEAK_PATTERN.finditer(line):
+            arg = speak_match.group('arg')
+            character = speak_match.group('character') or "'narrator'"
+
+            if arg.startswith('dialogue.'):
+                # Lines come from the dialogue array above
+                continue
+
+            source = 'speak'
+            if arg in constants:
+                arg, _ = constants[arg]
+                source = 'speak-const'
+
+            if arg[0] in '\'"' and character[0] in '\'"':
+                column = speak_match.end('character') if speak_match.group('character') else speak_match.end('arg')
+                entries.append(make_entry(unquote(arg), unquote(character), line_number, method, source, column))
+            else:
+                dynamic.append({'character': character.strip('\'"'), 'text': arg,
+                                'line_number': line_number, 'method': method, 'source': source})
+
+    return entries, dynamic
+
+
+def load_critical_lines(audio_system_path='audio-system.js'):
+    """Return the lines MobileAudioSystem.preloadCriticalAudio() warms up first"""
+    content = Path(audio_system_path).read_text(encoding='utf-8')
+    block = CRITICAL_BLOCK_PATTERN.search(content)
+    if not block:
+        return []
+
+    critical = []
+    for match in DIALOGUE_OBJECT_PATTERN.finditer(block.group(1)):
+        text = unquote(match.group('text'))
+        character = unquote(match.group('character'))
+        critical.append({'character': character, 'text': text, 'clean_text': clean_text_for_speech(text)})
+    return critical
+
+
+def unique_lines(entries):
+    """Drop repeated (character, clean_text) pairs, keeping the first occurrence"""
+    seen = set()
+    unique = []
+    for entry in entries:
+        key = (entry['character'], entry['clean_text'])
+        if entry['clean_text'] and key not in seen:
+            seen.add(key)
+            unique.append(entry)
+    return unique
+
+
+def main():
+    entries, dynamic = extract_catalog()
+    print(f"📝 Found {len(entries)} static lines ({len(unique_lines(entries))} unique) "
+          f"and {len(dynamic)} dynamic call sites")
+
+    for entry in entries:
+        print(f"  {entry['line_number']:>5} {entry['method']:<28} [{entry['character']}] {entry['clean_text'][:50]}")
+
+    for site in dynamic:
+        print(f"  {site['line_number']:>5} {site['method']:<28} [{site['character']}] (dynamic) {site['text'][:50]}")
+
+
+if __name__ == '__main__':
+    main()
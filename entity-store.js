@@ -0,0 +1,64 @@
+// Entity positions
+// Character and vegetable positions used to live only in style strings:
+// every key press and frame parsed style.left/bottom back into numbers and
+// wrote new strings, and each left/bottom write lays the page out again.
+// The store keeps positions as numbers. An element is placed with left and
+// bottom once, when it's added; after that flush() writes every position
+// that changed, once per frame, as a translate3d from that spot, which the
+// browser can apply without layout.
+
+class EntityStore {
+    constructor() {
+        this.entities = new Map(); // element -> { element, left, bottom, originLeft, originBottom }
+        this.dirty = new Set();
+        this.writes = 0;
+        this.moved = 0; // entities the last flush wrote
+    }
+
+    // Track an element, placing it at left/bottom (px from the game area's bottom-left)
+    add(element, left, bottom) {
+        element.style.left = left + 'px';
+        element.style.bottom = bottom + 'px';
+        element.style.transform = '';
+        const entity = { element, left, bottom, originLeft: left, originBottom: bottom };
+        this.entities.set(element, entity);
+        return entity;
+    }
+
+    get(element) {
+        return this.entities.get(element);
+    }
+
+    move(element, left, bottom) {
+        const entity = this.entities.get(element);
+        if (!entity || (entity.left === left && entity.bottom === bottom)) return;
+        entity.left = left;
+        entity.bottom = bottom;
+        this.dirty.add(entity);
+    }
+
+    delete(element) {
+        const entity = this.entities.get(element);
+        if (!entity) return;
+        this.entities.delete(element);
+        this.dirty.delete(entity);
+    }
+
+    // Forget every entity (the scene's elements are gone)
+    clear() {
+        this.entities.clear();
+        this.dirty.clear();
+    }
+
+    // Write the moved entities' transforms in one pass
+    flush() {
+        for (const entity of this.dirty) {
+            const x = entity.left - entity.originLeft;
+            const y = entity.originBottom - entity.bottom;
+            entity.element.style.transform = `translate3d(${x}px, ${y}px, 0)`;
+        }
+        this.moved = this.dirty.size;
+        this.writes += this.moved;
+        this.dirty.clear();
+    }
+}
@@ -4,6 +4,8 @@ import re
 import json
 import hashlib
 
+from scene_scripts import load_scene, scene_names, scene_lines
+
 def extract_dialogue_from_js(file_path):
     """Extract all dialogue from the JavaScript game file."""
     
@@ -15,6 +17,10 @@ def extract_dialogue_from_js(file_path):
     
     matches = re.findall(speak_pattern, content)
     
+    # Cutscenes written as scene scripts (scenes/*.json)
+    for name in scene_names():
+        matches += scene_lines(load_scene(name))
+    
     dialogue_entries = []
     
     for text, character in matches:
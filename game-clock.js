@@ -0,0 +1,210 @@
+// Fixed-timestep game clock and the frame scheduler that drives it
+// The game's per-frame logic (flight progress, star scrolling, following)
+// was tuned as "so much per frame" at 60 Hz, so it ran twice as fast at
+// 120 Hz and slowed down whenever frames were dropped. The clock turns the
+// time between frames into a whole number of fixed simulation steps, so the
+// game plays at the same speed however often frames arrive.
+
+class GameClock {
+    constructor({ stepMs = 1000 / 60, maxStepsPerFrame = 5 } = {}) {
+        this.stepMs = stepMs;
+        // A long gap (tab in the background, a stall) is dropped rather than
+        // replayed all at once
+        this.maxStepsPerFrame = maxStepsPerFrame;
+        this.reset();
+    }
+
+    // Start timing afresh; the next frame runs no steps, or one if `step`
+    // (waking up to input that should show on that frame)
+    reset(step = false) {
+        this.lastTime = null;
+        this.accumulator = step ? this.stepMs : 0;
+        this.deltaMs = 0;
+    }
+
+    // Number of fixed steps to simulate for a frame at `time` (a
+    // requestAnimationFrame timestamp)
+    advance(time) {
+        if (this.lastTime === null || time < this.lastTime) {
+            this.deltaMs = 0;
+        } else {
+            this.deltaMs = time - this.lastTime;
+        }
+        this.lastTime = time;
+        this.accumulator = Math.min(this.accumulator + this.deltaMs, this.stepMs * this.maxStepsPerFrame);
+
+        const steps = Math.floor(this.accumulator / this.stepMs);
+        this.accumulator -= steps * this.stepMs;
+        return steps;
+    }
+
+    // How far the next step is along, 0-1, for interpolating what's drawn
+    get alpha() {
+        return this.accumulator / this.stepMs;
+    }
+}
+
+// Owns the animation frame: a single requestAnimationFrame loop runs the
+// current scene's systems, so a scene change can't leave an old loop going.
+// A system is { name, step(), frame(time), idle() }, all optional: step()
+// runs once per fixed clock step, then frame() once per drawn frame. The
+// scene stops as soon as its isActive() check fails, or when another scene
+// is run.
+//
+// When every system reports idle() after a frame that ran a step, nothing
+// is moving and the next frame would look the same, so the scheduler stops
+// asking for frames until wake() (input, a timer, speech ending), or every
+// idleFrameMs if the scene still wants an occasional redraw. suspend()
+// holds the loop while the page is hidden.
+class FrameScheduler {
+    constructor(clock) {
+        this.clock = clock;
+        this.scene = null;
+        this.systems = null;
+        this.isActive = null;
+        this.idleFrameMs = null;
+        this.frameRequest = null;
+        this.idleTimer = null;
+        this.sleeping = false;
+        this.suspended = false;
+        this.frames = 0;
+        this.wakes = 0;
+        this.timings = new Map(); // 'scene:system' -> { calls, totalMs, maxMs }
+    }
+
+    // Replace whatever is running with this scene's systems
+    run(scene, systems, isActive = () => true, { idleFrameMs = null } = {}) {
+        this.scene = scene;
+        this.systems = systems;
+        this.isActive = isActive;
+        this.idleFrameMs = idleFrameMs;
+        this.sleeping = false;
+        this.clearIdleTimer();
+        this.clock.reset();
+        this.request();
+    }
+
+    stop() {
+        this.scene = null;
+        this.systems = null;
+        this.isActive = null;
+        this.sleeping = false;
+        this.clearIdleTimer();
+        if (this.frameRequest !== null) {
+            cancelAnimationFrame(this.frameRequest);
+            this.frameRequest = null;
+        }
+    }
+
+    get running() {
+        return this.systems !== null;
+    }
+
+    request() {
+        if (this.frameRequest === null && !this.suspended) {
+            this.frameRequest = requestAnimationFrame((time) => this.frame(time));
+        }
+    }
+
+    clearIdleTimer() {
+        if (this.idleTimer !== null) {
+            clearTimeout(this.idleTimer);
+            this.idleTimer = null;
+        }
+    }
+
+    // Start frames again after the scene went idle
+    wake() {
+        if (!this.sleeping || this.suspended) return;
+        this.sleeping = false;
+        this.wakes++;
+        this.clearIdleTimer();
+        this.clock.reset(true);
+        this.request();
+    }
+
+    // Page hidden: no frames until resume()
+    suspend() {
+        this.suspended = true;
+        this.clearIdleTimer();
+        if (this.frameRequest !== null) {
+            cancelAnimationFrame(this.frameRequest);
+            this.frameRequest = null;
+        }
+    }
+
+    resume() {
+        if (!this.suspended) return;
+        this.suspended = false;
+        if (!this.running) return;
+        // Carry on from now rather than catching up on the hidden time
+        this.sleeping = false;
+        this.clock.reset();
+        this.request();
+    }
+
+    frame(time) {
+        this.frameRequest = null;
+        const systems = this.systems;
+        if (!systems) return;
+        if (!this.isActive()) {
+            this.stop();
+            return;
+        }
+        this.frames++;
+
+        const steps = this.clock.advance(time);
+        for (let step = 0; step < steps; step++) {
+            for (const system of systems) {
+                if (system.step && !this.call(systems, system, system.step)) return;
+            }
+        }
+        for (const system of systems) {
+            if (system.frame && !this.call(systems, system, system.frame, time)) return;
+        }
+
+        // A frame without a step can't tell whether anything would move
+        if (steps > 0 && systems.every(system => system.idle && system.idle())) {
+            this.sleeping = true;
+            if (this.idleFrameMs !== null) {
+                this.idleTimer = setTimeout(() => this.wake(), this.idleFrameMs);
+            }
+            return;
+        }
+        this.request();
+    }
+
+    // Run one system callback and count its time; false if the scene ended
+    call(systems, system, callback, time) {
+        const key = `${this.scene}:${system.name}`;
+        const started = performance.now();
+        callback(time);
+        const elapsed = performance.now() - started;
+
+        let timing = this.timings.get(key);
+        if (!timing) {
+            timing = { calls: 0, totalMs: 0, maxMs: 0 };
+            this.timings.set(key, timing);
+        }
+        timing.calls++;
+        timing.totalMs += elapsed;
+        timing.maxMs = Math.max(timing.maxMs, elapsed);
+
+        // The callback may have moved the game to another scene
+        if (this.systems !== systems) return false;
+        if (!this.isActive()) {
+            this.stop();
+            return false;
+        }
+        return true;
+    }
+
+    // { scene, frames, wakes, sleeping, systems: { 'scene:system': { calls, totalMs, meanMs, maxMs } } }
+    getTimings() {
+        const systems = {};
+        for (const [key, timing] of this.timings) {
+            systems[key] = { ...timing, meanMs: timing.totalMs / timing.calls };
+        }
+        return { scene: this.scene, frames: this.frames, wakes: this.wakes, sleeping: this.sleeping, systems };
+    }
+}
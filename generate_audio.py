@@ -1,100 +1,207 @@
 #!/usr/bin/env python3
 
+import argparse
 import json
-import os
-import requests
 import time
 from pathlib import Path
 
-# ElevenLabs API configuration
-ELEVENLABS_API_KEY = os.getenv('ELEVENLABS_API_KEY')
-ELEVENLABS_URL = "https://api.elevenlabs.io/v1/text-to-speech"
+from audio_clips import can_encode, clip_timing, encode_clip, read_timing_table, split_lines, write_timing_table
+from audio_manifest import ClipEntry, Manifest, load, save, utc_timestamp
+from dialogue_catalog import clean_text_for_speech
+from tts_backends import BACKENDS, TTSError, get_backend
 
-# Voice mappings for different characters
-VOICE_IDS = {
-    'narrator': 'pNInz6obpgDQGcFmaJgB',  # Adam - clear, friendly narrator voice
-    'george': 'VR6AewLTigWG4xSOukaG',    # Josh - young, energetic male voice  
-    'matilda': 'jsCqWAovK2LkecY7zXl4',   # Jessica - young, cheerful female voice
-    'moondog': 'cgSgspJ2msm6clMCkdW9'    # Brian - warm, friendly character voice
-}
+DEFAULT_EXCHANGE_PAUSE_MS = 1000
+DEFAULT_MAX_BATCH_CHARS = 2000
 
-def create_audio_directory():
+
+def create_audio_directory(output_dir='audio'):
     """Create audio directory if it doesn't exist."""
-    audio_dir = Path('audio')
-    audio_dir.mkdir(exist_ok=True)
+    audio_dir = Path(output_dir)
+    audio_dir.mkdir(parents=True, exist_ok=True)
     return audio_dir
 
-def generate_audio_file(text, voice_id, filename, audio_dir):
-    """Generate audio file using ElevenLabs API."""
+def generate_audio_file(backend, text, character, filename, audio_dir, word_timestamps=None):
+    """Generate audio file using the selected TTS backend.
+    
+    Word start times reported by the backend are stored in word_timestamps,
+    keyed by file name, for the manifest's timing table.
+    """
     
-    if not ELEVENLABS_API_KEY:
-        print("❌ ELEVENLABS_API_KEY environment variable not set")
+    try:
+        audio, word_starts = backend.synthesize_with_timestamps(text, character)
+    except TTSError as e:
+        print(f"❌ Error generating {filename}: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Exception generating {filename}: {str(e)}")
         return False
     
-    headers = {
-        "Accept": "audio/mpeg",
-        "Content-Type": "application/json",
-        "xi-api-key": ELEVENLABS_API_KEY
-    }
-    
-    data = {
-        "text": text,
-        "model_id": "eleven_monolingual_v1",
-        "voice_settings": {
-            "stability": 0.5,
-            "similarity_boost": 0.5,
-            "style": 0.0,
-            "use_speaker_boost": True
-        }
-    }
+    file_path = audio_dir / f"{filename}.{backend.extension}"
+    with open(file_path, 'wb') as f:
+        f.write(audio)
+    if word_starts is not None and word_timestamps is not None:
+        word_timestamps[file_path.name] = word_starts
+    print(f"✅ Generated: {filename}.{backend.extension}")
+    return True
+
+def group_exchanges(entries, max_chars=DEFAULT_MAX_BATCH_CHARS, scope='exchange'):
+    """Batch each speaker's lines within an exchange (the enclosing method).
+    
+    scope='speaker' batches across scenes too, which is fewer requests but less
+    conversational prosody. Lines without a method (dialogue_data.json) are
+    always batched per speaker. Batches keep scene order and stay under max_chars.
+    """
+    groups = {}
+    for entry in entries:
+        method = entry.get('method') if scope == 'exchange' else None
+        groups.setdefault((method, entry['character']), []).append(entry)
+    
+    batches = []
+    for group in groups.values():
+        batch, chars = [], 0
+        for entry in group:
+            if batch and chars + len(entry['clean_text']) > max_chars:
+                batches.append(batch)
+                batch, chars = [], 0
+            batch.append(entry)
+            chars += len(entry['clean_text'])
+        batches.append(batch)
+    return batches
+
+def generate_exchange(backend, batch, audio_dir, pause_ms):
+    """Voice a batch of one speaker's lines in a single request and split it per line.
+    
+    Returns False if the request failed or the audio couldn't be split cleanly,
+    so the caller can fall back to one request per line.
+    """
+    character = batch[0]['character']
+    texts = [entry['clean_text'] for entry in batch]
     
     try:
-        response = requests.post(
-            f"{ELEVENLABS_URL}/{voice_id}",
-            json=data,
-            headers=headers,
-            timeout=30
-        )
-        
-        if response.status_code == 200:
-            file_path = audio_dir / f"{filename}.mp3"
-            with open(file_path, 'wb') as f:
-                f.write(response.content)
-            print(f"✅ Generated: {filename}.mp3")
-            return True
-        else:
-            print(f"❌ Error generating {filename}: {response.status_code} - {response.text}")
-            return False
-            
+        pcm, sample_rate = backend.synthesize_pcm(backend.join_lines(texts, pause_ms), character)
+    except TTSError as e:
+        print(f"❌ Error generating exchange [{character}]: {e}")
+        return False
     except Exception as e:
-        print(f"❌ Exception generating {filename}: {str(e)}")
+        print(f"❌ Exception generating exchange [{character}]: {str(e)}")
+        return False
+    
+    clips = split_lines(pcm, sample_rate, texts, min_gap_ms=pause_ms // 2)
+    if clips is None:
+        print(f"⚠️  Couldn't split {len(batch)} lines for [{character}] at silences")
         return False
+    
+    for entry, clip in zip(batch, clips):
+        filename = f"{character}_{entry['id']}.{backend.extension}"
+        encode_clip(clip, sample_rate, audio_dir / filename)
+        print(f"✅ Generated: {filename}")
+    return True
+
+def load_entries(args):
+    """Dialogue entries to generate, from dialogue_data.json or a saved plan.
+    
+    clean_text is normalised the way the manifest schema requires (some
+    dialogue_data.json lines still carry "Name:" prefixes), so the clip, its
+    manifest entry and its timing row all follow the same text.
+    """
+    if args.plan:
+        # Ordered jobs written by plan_audio_budget.py --output
+        with open(args.plan, 'r', encoding='utf-8') as f:
+            entries = json.load(f)['jobs']
+    else:
+        with open(args.dialogue, 'r', encoding='utf-8') as f:
+            dialogue_data = json.load(f)
+        print(f"🎭 Characters: {', '.join(dialogue_data['characters'])}")
+        entries = dialogue_data['dialogue']
+    
+    return [dict(entry, clean_text=clean_text_for_speech(entry['clean_text'])) for entry in entries]
+
+def existing_manifest(audio_dir, voice_mappings, fresh=False):
+    """The manifest and timing table to add this run's clips to.
+    
+    A run only voices some of the lines (a plan, or only the missing files),
+    so the existing manifest - with its codec variants - and timing table are
+    kept and updated; fresh=True starts both from scratch.
+    """
+    manifest_path = audio_dir / 'manifest.json'
+    if fresh or not manifest_path.exists():
+        return Manifest.new(voice_mappings), {}
+    
+    manifest = load(manifest_path)
+    manifest.generated_at = utc_timestamp()
+    manifest.voice_mappings.update(voice_mappings)
+    return manifest, read_timing_table(audio_dir / 'timing.json')
+
+def upsert_entry(manifest, clip):
+    """Add a clip to the manifest, or update the entry with its filename
+    (keeping that entry's variants)"""
+    for index, entry in enumerate(manifest.files):
+        if entry.filename == clip.filename:
+            clip.variants = entry.variants
+            manifest.files[index] = clip
+            return
+    manifest.files.append(clip)
 
 def main():
-    print("🎙️ Generating audio files with ElevenLabs...")
+    parser = argparse.ArgumentParser(description='Generate dialogue audio files and the audio manifest')
+    parser.add_argument('--backend', choices=sorted(BACKENDS), default='elevenlabs',
+                        help='TTS engine (tone and espeak work offline)')
+    parser.add_argument('--output-dir', default='audio')
+    parser.add_argument('--dialogue', default='dialogue_data.json')
+    parser.add_argument('--plan', help='ordered plan from plan_audio_budget.py --output')
+    parser.add_argument('--delay', type=float, default=None,
+                        help='seconds to wait between requests (default: 1 for network backends, 0 otherwise)')
+    parser.add_argument('--batch-exchanges', action='store_true',
+                        help="voice each speaker's lines in an exchange with one request, then split per line")
+    parser.add_argument('--exchange-pause-ms', type=int, default=DEFAULT_EXCHANGE_PAUSE_MS,
+                        help='pause inserted between batched lines (the split points)')
+    parser.add_argument('--batch-scope', choices=['exchange', 'speaker'], default='exchange',
+                        help='batch lines per exchange (scene method) or per speaker across the game')
+    parser.add_argument('--max-batch-chars', type=int, default=DEFAULT_MAX_BATCH_CHARS)
+    parser.add_argument('--fresh-manifest', action='store_true',
+                        help='rebuild manifest.json and timing.json from this run alone (full dialogue runs only)')
+    args = parser.parse_args()
+    
+    backend = get_backend(args.backend)
+    delay = args.delay if args.delay is not None else (1.0 if backend.requires_network else 0.0)
     
-    if not ELEVENLABS_API_KEY:
+    print(f"🎙️ Generating audio files with {backend.name}...")
+    
+    if backend.name == 'elevenlabs' and not backend.api_key:
         print("\n❌ Please set ELEVENLABS_API_KEY environment variable")
         print("   export ELEVENLABS_API_KEY='your_api_key_here'")
+        print("   (or use --backend tone / --backend espeak to build offline)")
+        return
+    
+    if args.fresh_manifest and args.plan:
+        print("\n❌ --fresh-manifest would drop every line the plan doesn't cover; run it without --plan")
+        return
+    
+    if args.batch_exchanges and not can_encode(backend.extension):
+        print(f"\n❌ --batch-exchanges needs ffmpeg to encode {backend.extension} clips")
         return
     
     # Load dialogue data
     try:
-        with open('dialogue_data.json', 'r', encoding='utf-8') as f:
-            dialogue_data = json.load(f)
-    except FileNotFoundError:
-        print("❌ dialogue_data.json not found. Run extract_dialogue.py first.")
+        entries = load_entries(args)
+    except FileNotFoundError as e:
+        print(f"❌ {e.filename} not found. Run extract_dialogue.py (or plan_audio_budget.py) first.")
         return
     
-    audio_dir = create_audio_directory()
+    audio_dir = create_audio_directory(args.output_dir)
     
-    print(f"📝 Processing {dialogue_data['total_entries']} dialogue entries...")
-    print(f"🎭 Characters: {', '.join(dialogue_data['characters'])}")
+    print(f"📝 Processing {len(entries)} dialogue entries...")
     
     successful = 0
     failed = 0
+    generated = 0
+    requests = 0
+    pending = []
+    word_timestamps = {}
+    started = time.perf_counter()
+    synth_seconds = 0.0
     
-    for entry in dialogue_data['dialogue']:
+    for entry in entries:
         dialogue_id = entry['id']
         text = entry['clean_text']
         character = entry['character']
@@ -104,9 +211,7 @@ def main():
             print(f"⏭️  Skipping empty dialogue: {dialogue_id}")
             continue
         
-        # Get voice ID for character
-        voice_id = VOICE_IDS.get(character)
-        if not voice_id:
+        if character not in backend.voice_mappings():
             print(f"❌ No voice ID configured for character: {character}")
             failed += 1
             continue
@@ -114,54 +219,80 @@ def main():
         filename = f"{character}_{dialogue_id}"
         
         # Check if file already exists
-        file_path = audio_dir / f"{filename}.mp3"
+        file_path = audio_dir / f"{filename}.{backend.extension}"
         if file_path.exists():
-            print(f"⏭️  Skipping existing: {filename}.mp3")
+            print(f"⏭️  Skipping existing: {file_path.name}")
             successful += 1
             continue
         
-        print(f"🎵 Generating [{character}]: {text[:50]}...")
-        
-        if generate_audio_file(text, voice_id, filename, audio_dir):
-            successful += 1
-        else:
-            failed += 1
+        pending.append(entry)
+    
+    if args.batch_exchanges:
+        batches = group_exchanges(pending, args.max_batch_chars, args.batch_scope)
+    else:
+        batches = [[entry] for entry in pending]
+    
+    for batch in batches:
+        if len(batch) > 1:
+            print(f"🎭 Generating exchange [{batch[0]['character']}]: {len(batch)} lines...")
+            request_started = time.perf_counter()
+            requests += 1
+            done = generate_exchange(backend, batch, audio_dir, args.exchange_pause_ms)
+            synth_seconds += time.perf_counter() - request_started
+            if delay:
+                time.sleep(delay)
+            if done:
+                successful += len(batch)
+                generated += len(batch)
+                continue
         
-        # Rate limiting - wait between requests
-        time.sleep(1)
+        for entry in batch:
+            character = entry['character']
+            text = entry['clean_text']
+            print(f"🎵 Generating [{character}]: {text[:50]}...")
+            
+            request_started = time.perf_counter()
+            requests += 1
+            if generate_audio_file(backend, text, character, f"{character}_{entry['id']}", audio_dir,
+                                   word_timestamps):
+                successful += 1
+                generated += 1
+            else:
+                failed += 1
+            synth_seconds += time.perf_counter() - request_started
+            
+            # Rate limiting - wait between requests
+            if delay:
+                time.sleep(delay)
+    
+    elapsed = time.perf_counter() - started
     
     print(f"\n🎉 Audio generation complete!")
     print(f"   ✅ Successful: {successful}")
     print(f"   ❌ Failed: {failed}")
+    print(f"   📨 Requests: {requests} for {len(pending)} lines")
+    print(f"   ⏱️  {elapsed:.2f}s total, {synth_seconds / max(1, generated) * 1000:.1f}ms per generated file")
     print(f"   📁 Audio files saved to: {audio_dir.absolute()}")
     
-    # Generate audio manifest
-    manifest = {
-        "version": "1.0",
-        "generated_at": time.strftime("%Y-%m-%d %H:%M:%S"),
-        "total_files": successful,
-        "voice_mappings": VOICE_IDS,
-        "files": []
-    }
+    # Add this run's clips to the audio manifest
+    manifest, timings = existing_manifest(audio_dir, backend.voice_mappings(), args.fresh_manifest)
     
-    for entry in dialogue_data['dialogue']:
+    for entry in entries:
         if entry['clean_text'].strip():
-            filename = f"{entry['character']}_{entry['id']}.mp3"
+            filename = f"{entry['character']}_{entry['id']}.{backend.extension}"
             file_path = audio_dir / filename
             if file_path.exists():
-                manifest["files"].append({
-                    "id": entry['id'],
-                    "character": entry['character'],
-                    "filename": filename,
-                    "text": entry['text'],
-                    "clean_text": entry['clean_text']
-                })
+                upsert_entry(manifest, ClipEntry(entry['id'], entry['character'], filename,
+                                                 entry['text'], entry['clean_text']))
+                timings[filename] = clip_timing(file_path, entry['clean_text'], word_timestamps.get(filename))
     
     # Save audio manifest
-    with open(audio_dir / 'manifest.json', 'w', encoding='utf-8') as f:
-        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    save(manifest, audio_dir / 'manifest.json')
     
     print(f"📋 Audio manifest saved to: {audio_dir / 'manifest.json'}")
+    
+    write_timing_table(timings, audio_dir / 'timing.json')
+    print(f"⏱️  Clip timing saved to: {audio_dir / 'timing.json'}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,77 @@
+// Input state
+// Movement used to happen inside the input events: a fixed jump per keydown
+// (so as fast as the keyboard repeats), and on touch screens a jump, then
+// another every 100ms after a 300ms wait. Neither lined up with frames, so
+// motion was steppy and a press could wait up to 100ms to show. Events now
+// only record which directions are held; the frame loop samples that every
+// step and moves the character by a velocity that accelerates towards the
+// held direction and eases off when it's let go.
+
+// Arrow keys and the on-screen buttons' data-direction values
+const KEY_DIRECTIONS = { ArrowUp: 'up', ArrowDown: 'down', ArrowLeft: 'left', ArrowRight: 'right' };
+
+class InputState {
+    // speed in px/s; acceleration in px/s², so speed / acceleration is the
+    // time to get up to speed (and to stop). onChange() is called on every
+    // press and release.
+    constructor({ acceleration = 3000, onChange = () => {} } = {}) {
+        this.acceleration = acceleration;
+        this.onChange = onChange;
+        this.held = new Set();
+        this.velocityX = 0;
+        this.velocityY = 0;
+        this.lastInputAt = 0; // performance.now() of the latest press or release
+    }
+
+    directionFor(key) {
+        return KEY_DIRECTIONS[key] || null;
+    }
+
+    press(direction) {
+        this.held.add(direction);
+        this.lastInputAt = performance.now();
+        this.onChange();
+    }
+
+    release(direction) {
+        this.held.delete(direction);
+        this.lastInputAt = performance.now();
+        this.onChange();
+    }
+
+    releaseAll() {
+        this.held.clear();
+        this.lastInputAt = performance.now();
+        this.onChange();
+    }
+
+    // Come to a standstill at once (new scene, other character)
+    stop() {
+        this.velocityX = 0;
+        this.velocityY = 0;
+    }
+
+    get moving() {
+        return this.held.size > 0 || this.velocityX !== 0 || this.velocityY !== 0;
+    }
+
+    // Advance the velocity by `seconds` towards the held direction at
+    // `speed`; returns how far to move, x to the right and y up
+    update(seconds, speed) {
+        const x = (this.held.has('right') ? 1 : 0) - (this.held.has('left') ? 1 : 0);
+        const y = (this.held.has('up') ? 1 : 0) - (this.held.has('down') ? 1 : 0);
+        // Diagonals aren't faster than straight lines
+        const scale = x && y ? speed / Math.SQRT2 : speed;
+        const change = this.acceleration * seconds;
+
+        this.velocityX = approach(this.velocityX, x * scale, change);
+        this.velocityY = approach(this.velocityY, y * scale, change);
+        return { dx: this.velocityX * seconds, dy: this.velocityY * seconds };
+    }
+}
+
+// value moved towards target by at most `change`
+function approach(value, target, change) {
+    if (value < target) return Math.min(value + change, target);
+    return Math.max(value - change, target);
+}
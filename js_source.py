@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Minimal JavaScript source scanning for the build scripts
+
+Just enough of a lexer to tell code from strings, template literals, comments
+and regex literals, so the bundler can find calls and matching brackets in
+script.js without being fooled by a "(" or "//" inside a string. It doesn't
+parse JavaScript; a `/` after an identifier is always taken as division.
+"""
+
+OPENERS = {'(': ')', '[': ']', '{': '}'}
+CLOSERS = set(OPENERS.values())
+
+# A `/` after one of these (or at the start) begins a regex literal
+REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^')
+
+
+def skip_string(source, i):
+    quote = source[i]
+    i += 1
+    while source[i] != quote:
+        i += 2 if source[i] == '\\' else 1
+    return i + 1
+
+
+def skip_template(source, i):
+    i += 1
+    while source[i] != '`':
+        if source[i] == '\\':
+            i += 2
+        elif source.startswith('${', i):
+            i = find_closing(source, i + 1) + 1
+        else:
+            i += 1
+    return i + 1
+
+
+def skip_regex(source, i):
+    i += 1
+    in_class = False
+    while in_class or source[i] != '/':
+        if source[i] == '\\':
+            i += 1
+        elif source[i] == '[':
+            in_class = True
+        elif source[i] == ']':
+            in_class = False
+        i += 1
+    i += 1
+    while i < len(source) and source[i].isalpha():
+        i += 1
+    return i
+
+
+def skip_literal(source, i, previous):
+    """Index just past the string, template, comment or regex starting at i,
+    or None if i is ordinary code"""
+    c = source[i]
+    if c in '\'"':
+        return skip_string(source, i)
+    if c == '`':
+        return skip_template(source, i)
+    if source.startswith('//', i):
+        end = source.find('\n', i)
+        return len(source) if end == -1 else end
+    if source.startswith('/*', i):
+        return source.index('*/', i + 2) + 2
+    if c == '/' and (previous is None or previous in REGEX_PRECEDERS):
+        return skip_regex(source, i)
+    return None
+
+
+def code_positions(source, start=0):
+    """Yield (index, previous) for every code character from start on, where
+    previous is the last non-space code character before it (None at the start)"""
+    i = start
+    previous = None
+    while i < len(source):
+        end = skip_literal(source, i, previous)
+        if end is not None:
+            if not source.startswith(('//', '/*'), i):
+                previous = source[end - 1]
+            i = end
+            continue
+        yield i, previous
+        if not source[i].isspace():
+            previous = source[i]
+        i += 1
+
+
+def find_closing(source, i):
+    """Index of the bracket that closes the one at source[i]"""
+    depth = 0
+    for j, _ in code_positions(source, i):
+        if source[j] in OPENERS:
+            depth += 1
+        elif source[j] in CLOSERS:
+            depth -= 1
+            if depth == 0:
+                return j
+    raise ValueError(f"Unbalanced {source[i]!r} at offset {i}")
+
+
+def find_calls(source, callee):
+    """Yield (start, end, previous) for each call `callee(...)` in code;
+    end is just past the closing parenthesis"""
+    opener = callee + '('
+    for i, previous in code_positions(source):
+        if source.startswith(opener, i) and (i == 0 or not (source[i - 1].isalnum() or source[i - 1] in '_$.')):
+            yield i, find_closing(source, i + len(callee)) + 1, previous
+
+
+def strip_calls(source, callee):
+    """Remove every `callee(...)` call; returns (source, count).
+
+    A call that is a whole statement on its own line(s) is deleted with its
+    lines. Anywhere else (say the body of an `if` without braces) it becomes
+    `void 0`, which keeps the surrounding code valid.
+    """
+    calls = list(find_calls(source, callee))
+    for start, end, previous in reversed(calls):
+        line_start = source.rfind('\n', 0, start) + 1
+        after = end + 1 if source.startswith(';', end) else end
+        line_end = source.find('\n', after)
+        line_end = len(source) if line_end == -1 else line_end
+
+        whole_lines = not source[line_start:start].strip() and not source[after:line_end].strip()
+        if whole_lines and (previous is None or previous in '{};'):
+            source = source[:line_start] + source[line_end + 1:]
+        else:
+            source = source[:start] + 'void 0' + source[end:]
+    return source, len(calls)
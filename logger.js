@@ -0,0 +1,33 @@
+// Leveled logging for the game
+// log.debug() is for hot-path detail (every line spoken, every key press).
+// build_bundle.py removes log.debug() calls from the production bundle
+// entirely; open the game with ?debug=1 to load the developer bundle and see
+// them. info, warn and error are always kept.
+
+const LOG_LEVELS = { debug: 10, info: 20, warn: 30, error: 40, silent: 100 };
+
+const log = {
+    level: /[?&]debug=1\b/.test(location.search) ? 'debug' : 'info',
+
+    enabled(level) {
+        return LOG_LEVELS[level] >= LOG_LEVELS[this.level];
+    },
+
+    debug(...args) {
+        if (this.enabled('debug')) console.log(...args);
+    },
+
+    info(...args) {
+        if (this.enabled('info')) console.log(...args);
+    },
+
+    warn(...args) {
+        if (this.enabled('warn')) console.warn(...args);
+    },
+
+    error(...args) {
+        if (this.enabled('error')) console.error(...args);
+    }
+};
+
+window.log = log;
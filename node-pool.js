@@ -0,0 +1,57 @@
+// DOM node pools
+// Vegetables in the garden and the clean and chopped pieces in the kitchen
+// used to be new divs every time, removed again a few seconds later, so a
+// long garden round kept the garbage collector busy. A pool hands out nodes
+// it has already made: release() takes a node off the page and keeps it for
+// the next acquire(), so once a scene has warmed up it creates no nodes.
+
+class NodePool {
+    // create() makes a fresh node; reset(node) returns a released one to that state
+    constructor(name, create, reset = () => {}) {
+        this.name = name;
+        this.create = create;
+        this.reset = reset;
+        this.free = [];
+        this.inUse = new Set();
+        this.created = 0;
+        this.reused = 0;
+        this.peakInUse = 0;
+    }
+
+    acquire() {
+        let node = this.free.pop();
+        if (node) {
+            this.reused++;
+        } else {
+            node = this.create();
+            this.created++;
+        }
+        this.inUse.add(node);
+        this.peakInUse = Math.max(this.peakInUse, this.inUse.size);
+        return node;
+    }
+
+    release(node) {
+        if (!this.inUse.delete(node)) return;
+        node.remove();
+        this.reset(node);
+        this.free.push(node);
+    }
+
+    // Take back every node handed out (the scene they were in has ended)
+    releaseAll() {
+        this.inUse.forEach(node => this.release(node));
+    }
+
+    // { name, inUse, free, created, reused, peakInUse }
+    stats() {
+        return {
+            name: this.name,
+            inUse: this.inUse.size,
+            free: this.free.length,
+            created: this.created,
+            reused: this.reused,
+            peakInUse: this.peakInUse
+        };
+    }
+}
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Dry-run planner for audio generation
+
+Works out how many characters a generation run would send to ElevenLabs,
+per voice, before a single request is made:
+
+- reads every spoken line from script.js (see dialogue_catalog.py)
+- subtracts lines that already have an audio file (cache hits)
+- estimates cost and wall time for the configured concurrency / rate limit
+- optionally puts the critical-path lines first (the preloadCriticalAudio()
+  lines, then scene order) and writes the ordered plan for a generator to use
+"""
+import argparse
+import heapq
+import json
+from collections import defaultdict
+from pathlib import Path
+
+from dialogue_catalog import extract_catalog, load_critical_lines, unique_lines
+
+# Voice mappings for different characters (same as generate_audio.py)
+VOICE_IDS = {
+    'narrator': 'pNInz6obpgDQGcFmaJgB',  # Adam
+    'george': 'VR6AewLTigWG4xSOukaG',    # Josh
+    'matilda': 'jsCqWAovK2LkecY7zXl4',   # Jessica
+    'moondog': 'cgSgspJ2msm6clMCkdW9'    # Brian
+}
+
+# Defaults match what the generator scripts do today: one request at a time
+# with a 1 second sleep in between
+DEFAULT_CONCURRENCY = 1
+DEFAULT_REQUEST_DELAY = 1.0
+DEFAULT_REQUESTS_PER_MINUTE = 0       # 0 = no explicit rate limit
+DEFAULT_BASE_LATENCY = 0.8            # seconds per request before any audio
+DEFAULT_SECONDS_PER_CHAR = 0.012      # synthesis time per character
+DEFAULT_USD_PER_1K_CHARS = 0.30
+
+
+def load_cached_lines(audio_dir):
+    """Return the (character, clean_text) pairs that already have audio on disk"""
+    cached = set()
+    manifest_path = audio_dir / 'manifest.json'
+    if manifest_path.exists():
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        for entry in manifest.get('files', []):
+            if (audio_dir / entry['filename']).exists():
+                cached.add((entry['character'], entry['clean_text']))
+    return cached
+
+
+def is_cached(entry, cached, audio_dir):
+    """A line is a cache hit if the manifest has it or its generator filename exists"""
+    if (entry['character'], entry['clean_text']) in cached:
+        return True
+    return (audio_dir / f"{entry['character']}_{entry['id']}.mp3").exists()
+
+
+def order_jobs(entries, critical_lines, critical_first):
+    """Scene order, optionally with the preloadCriticalAudio() lines up front"""
+    if not critical_first:
+        return list(entries), 0
+
+    critical_keys = [(line['character'], line['clean_text']) for line in critical_lines]
+    by_key = {(entry['character'], entry['clean_text']): entry for entry in entries}
+
+    front = [by_key[key] for key in critical_keys if key in by_key]
+    front_ids = {id(entry) for entry in front}
+    rest = [entry for entry in entries if id(entry) not in front_ids]
+    return front + rest, len(front)
+
+
+def estimate_wall_time(jobs, concurrency, request_delay, requests_per_minute,
+                       base_latency, seconds_per_char):
+    """Simulate the run and return the finish time (seconds) of every job"""
+    workers = [0.0] * max(1, concurrency)
+    heapq.heapify(workers)
+    min_spacing = 60.0 / requests_per_minute if requests_per_minute else 0.0
+    next_slot = 0.0
+
+    finish_times = []
+    for job in jobs:
+        worker_free = heapq.heappop(workers)
+        start = max(worker_free, next_slot)
+        next_slot = start + min_spacing
+        end = start + base_latency + len(job['clean_text']) * seconds_per_char
+        finish_times.append(end)
+        heapq.heappush(workers, end + request_delay)
+
+    return finish_times
+
+
+def format_seconds(seconds):
+    """Format seconds as m:ss"""
+    minutes, seconds = divmod(int(round(seconds)), 60)
+    return f"{minutes}:{seconds:02d}"
+
+
+def build_plan(args):
+    """Compute the plan as a plain dict"""
+    audio_dir = Path(args.audio_dir)
+    entries, dynamic = extract_catalog(args.script)
+    entries = unique_lines(entries)
+    critical_lines = load_critical_lines(args.audio_system)
+
+    cached = set() if args.ignore_cache else load_cached_lines(audio_dir)
+
+    per_voice = defaultdict(lambda: {'lines': 0, 'chars': 0, 'cached_lines': 0, 'cached_chars': 0})
+    to_generate = []
+    for entry in entries:
+        stats = per_voice[entry['character']]
+        chars = len(entry['clean_text'])
+        stats['lines'] += 1
+        stats['chars'] += chars
+        if not args.ignore_cache and is_cached(entry, cached, audio_dir):
+            stats['cached_lines'] += 1
+            stats['cached_chars'] += chars
+        else:
+            to_generate.append(entry)
+
+    jobs, critical_count = order_jobs(to_generate, critical_lines, args.critical_first)
+    finish_times = estimate_wall_time(jobs, args.concurrency, args.request_delay,
+                                      args.requests_per_minute, args.base_latency,
+                                      args.seconds_per_char)
+
+    total_chars = sum(len(job['clean_text']) for job in jobs)
+    return {
+        'voices': {
+            character: dict(stats,
+                            voice_id=VOICE_IDS.get(character),
+                            chars_to_send=stats['chars'] - stats['cached_chars'])
+            for character, stats in sorted(per_voice.items())
+        },
+        'dynamic_call_sites': len(dynamic),
+        'total_chars_to_send': total_chars,
+        'estimated_cost_usd': round(total_chars / 1000 * args.usd_per_1k_chars, 2),
+        'estimated_wall_seconds': round(max(finish_times, default=0.0), 1),
+        'critical_path_seconds': round(max(finish_times[:critical_count], default=0.0), 1),
+        'settings': {
+            'concurrency': args.concurrency,
+            'request_delay': args.request_delay,
+            'requests_per_minute': args.requests_per_minute,
+            'critical_first': args.critical_first,
+        },
+        'jobs': [
+            {
+                'id': job['id'],
+                'character': job['character'],
+                'text': job['text'],
+                'clean_text': job['clean_text'],
+                'chars': len(job['clean_text']),
+                'line_number': job['line_number'],
+                'method': job['method'],
+                'critical': index < critical_count,
+                'estimated_finish_seconds': round(finish, 1),
+            }
+            for index, (job, finish) in enumerate(zip(jobs, finish_times))
+        ],
+    }
+
+
+def print_plan(plan, show_order):
+    """Print the plan in the same style as the generator scripts"""
+    print("🎙️ Audio generation plan (dry run - nothing is sent)")
+    print(f"\n{'voice':<10} {'lines':>6} {'chars':>7} {'cached':>7} {'to send':>8}")
+    for character, stats in plan['voices'].items():
+        print(f"{character:<10} {stats['lines']:>6} {stats['chars']:>7} "
+              f"{stats['cached_chars']:>7} {stats['chars_to_send']:>8}")
+
+    settings = plan['settings']
+    print(f"\n📝 Requests to send: {len(plan['jobs'])}")
+    print(f"🔤 Characters to send: {plan['total_chars_to_send']}")
+    print(f"💵 Estimated cost: ${plan['estimated_cost_usd']:.2f}")
+    print(f"⏱️  Estimated wall time: {format_seconds(plan['estimated_wall_seconds'])} "
+          f"(concurrency {settings['concurrency']}, {settings['request_delay']}s delay"
+          f"{', %d req/min' % settings['requests_per_minute'] if settings['requests_per_minute'] else ''})")
+    if settings['critical_first']:
+        print(f"🚦 Critical-path lines done after: {format_seconds(plan['critical_path_seconds'])}")
+    if plan['dynamic_call_sites']:
+        print(f"⚠️  {plan['dynamic_call_sites']} dynamic call sites can't be planned (template text)")
+
+    if show_order:
+        print("\n📋 Order:")
+        for job in plan['jobs']:
+            marker = '🚦' if job['critical'] else '  '
+            print(f"  {marker} {format_seconds(job['estimated_finish_seconds']):>5} "
+                  f"[{job['character']}] {job['clean_text'][:60]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Estimate characters, cost and time for an audio generation run')
+    parser.add_argument('--script', default='script.js', help='game source to scan for dialogue')
+    parser.add_argument('--audio-system', default='audio-system.js', help='source of the critical preload lines')
+    parser.add_argument('--audio-dir', default='audio', help='directory holding already generated audio')
+    parser.add_argument('--ignore-cache', action='store_true', help='plan a full regeneration')
+    parser.add_argument('--critical-first', action='store_true',
+                        help='order preloadCriticalAudio() lines first, then scene order')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument('--request-delay', type=float, default=DEFAULT_REQUEST_DELAY,
+                        help='seconds each worker sleeps between requests')
+    parser.add_argument('--requests-per-minute', type=int, default=DEFAULT_REQUESTS_PER_MINUTE,
+                        help='account-wide request rate limit (0 = none)')
+    parser.add_argument('--base-latency', type=float, default=DEFAULT_BASE_LATENCY)
+    parser.add_argument('--seconds-per-char', type=float, default=DEFAULT_SECONDS_PER_CHAR)
+    parser.add_argument('--usd-per-1k-chars', type=float, default=DEFAULT_USD_PER_1K_CHARS)
+    parser.add_argument('--show-order', action='store_true', help='list every request in planned order')
+    parser.add_argument('--output', help='write the ordered plan as JSON')
+    args = parser.parse_args()
+
+    plan = build_plan(args)
+    print_plan(plan, args.show_order)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(plan, f, indent=2, ensure_ascii=False)
+        print(f"\n📋 Plan saved to: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
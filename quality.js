@@ -0,0 +1,130 @@
+// Adaptive quality
+// On older phones the space starfield, the asteroids, the garden's twinkling
+// stars and the buttons' transitions were enough to drop frames, and there
+// was no way to turn any of it down. The controller watches frame times in
+// the flight and the garden and steps quality down when too many frames are
+// slow, and back up once they've been smooth for a while. Going back up
+// needs several calm windows in a row, and more each time a step up had to
+// be undone, so it settles instead of flapping between two tiers.
+//
+// "Slow" is relative to the display, so a 30 Hz screen's steady 33ms frames
+// aren't mistaken for dropped 60 Hz ones. The first window's fastest frames
+// (its 10th percentile) are snapped to the nearest common refresh interval,
+// and no screen is taken to be slower than 30 Hz, so a phone that is janky
+// from the start isn't measured as normal: steady 50ms frames are slow
+// whatever the screen.
+
+// Best first. starScale scales every star field; spawnScale stretches the
+// time between asteroids and garden vegetables and divides how many
+// vegetables can lie on the ground at once.
+const QUALITY_TIERS = [
+    { name: 'high', starScale: 1, spawnScale: 1, transitions: true },
+    { name: 'medium', starScale: 0.6, spawnScale: 1.5, transitions: true },
+    { name: 'low', starScale: 0.25, spawnScale: 2, transitions: false }
+];
+
+// Refresh intervals (ms) of 120, 90, 60 and 30 Hz displays
+const REFRESH_INTERVALS = [1000 / 120, 1000 / 90, 1000 / 60, 1000 / 30];
+
+// Upper bounds (ms) of the frame-time histogram's buckets
+const FRAME_TIME_BUCKETS = [8.5, 17, 25, 34, 50, 100, Infinity];
+
+class QualityController {
+    // slowFrameMs fixes the threshold instead of measuring the display;
+    // otherwise it is slowFactor times the measured refresh interval
+    constructor({ windowSize = 60, slowFrameMs = null, slowFactor = 1.4, downgradeShare = 0.2, upgradeShare = 0.02, calmWindows = 3, onChange = () => {} } = {}) {
+        this.windowSize = windowSize;
+        this.slowFrameMs = slowFrameMs;
+        this.slowFactor = slowFactor;
+        this.calibration = []; // the first window's frame times, until it's full
+        this.downgradeShare = downgradeShare;
+        this.upgradeShare = upgradeShare;
+        this.calmWindowsNeeded = calmWindows;
+        this.onChange = onChange;
+
+        this.level = 0;
+        this.histogram = new Array(FRAME_TIME_BUCKETS.length).fill(0);
+        this.frames = 0;
+        this.windowFrames = 0;
+        this.windowSlow = 0;
+        this.calmWindows = 0;
+        this.changes = []; // { tier, slowShare }, oldest first
+    }
+
+    get tier() {
+        return QUALITY_TIERS[this.level].name;
+    }
+
+    get settings() {
+        return QUALITY_TIERS[this.level];
+    }
+
+    // Time since the last frame; 0 (the first frame after a pause) is skipped
+    sample(frameMs) {
+        if (!(frameMs > 0)) return;
+        this.histogram[FRAME_TIME_BUCKETS.findIndex(bound => frameMs <= bound)]++;
+        this.frames++;
+        if (this.slowFrameMs === null) {
+            this.calibrate(frameMs);
+            return;
+        }
+        this.windowFrames++;
+        if (frameMs > this.slowFrameMs) this.windowSlow++;
+        if (this.windowFrames < this.windowSize) return;
+
+        const slowShare = this.windowSlow / this.windowFrames;
+        this.windowFrames = 0;
+        this.windowSlow = 0;
+
+        if (slowShare > this.downgradeShare) {
+            if (this.level < QUALITY_TIERS.length - 1) {
+                // Undoing a step up: wait longer before the next one
+                const last = this.changes[this.changes.length - 1];
+                if (last && last.up) this.calmWindowsNeeded *= 2;
+                this.setLevel(this.level + 1, slowShare);
+            }
+            this.calmWindows = 0;
+        } else if (slowShare < this.upgradeShare) {
+            this.calmWindows++;
+            if (this.level > 0 && this.calmWindows >= this.calmWindowsNeeded) {
+                this.setLevel(this.level - 1, slowShare);
+                this.calmWindows = 0;
+            }
+        } else {
+            this.calmWindows = 0;
+        }
+    }
+
+    // Measure the display from the first window of frames
+    calibrate(frameMs) {
+        this.calibration.push(frameMs);
+        if (this.calibration.length < this.windowSize) return;
+
+        const sorted = this.calibration.sort((a, b) => a - b);
+        const fast = sorted[Math.floor(sorted.length / 10)];
+        const refreshMs = REFRESH_INTERVALS.reduce((best, interval) =>
+            Math.abs(interval - fast) < Math.abs(best - fast) ? interval : best);
+        this.slowFrameMs = refreshMs * this.slowFactor;
+        this.calibration = [];
+        log.info(`🎚️ Frames slower than ${this.slowFrameMs.toFixed(1)}ms count as slow`);
+    }
+
+    setLevel(level, slowShare) {
+        const up = level < this.level;
+        this.level = level;
+        this.changes.push({ tier: this.tier, up, slowShare });
+        log.info(`🎚️ Quality ${up ? 'up' : 'down'} to ${this.tier} (${Math.round(slowShare * 100)}% slow frames)`);
+        this.onChange(this.settings);
+    }
+
+    // { tier, frames, slowFrameMs, histogram: [{ upToMs, count }], changes }
+    report() {
+        return {
+            tier: this.tier,
+            frames: this.frames,
+            slowFrameMs: this.slowFrameMs,
+            histogram: FRAME_TIME_BUCKETS.map((upToMs, i) => ({ upToMs, count: this.histogram[i] })),
+            changes: this.changes.map(change => ({ ...change }))
+        };
+    }
+}
@@ -0,0 +1,210 @@
+// Scene lifecycle
+// Scenes used to end with gameArea.innerHTML = '', which removes their
+// elements but not their work: self-rescheduling spawners, removal timers
+// and listeners kept running into later scenes. Each scene now gets a
+// SceneScope to register timers, intervals, frames and listeners with, and
+// entering the next scene cancels whatever the last one left pending.
+// While the page is hidden the scene's timers are paused, so a garden round
+// doesn't run out (or fill up with vegetables) in a background tab.
+
+// Timer IDs are the scope's own, unique across scenes, since a paused
+// timer has no browser timer behind it
+let sceneTimerId = 0;
+
+class SceneScope {
+    // wake() is called after each timer fires, as it may have changed the scene
+    constructor(name, wake = () => {}) {
+        this.name = name;
+        this.wake = wake;
+        this.enteredAt = performance.now();
+        this.disposed = false;
+        this.paused = false;
+        this.timeouts = new Map(); // id -> { callback, remaining, due, handle }
+        this.intervals = new Map(); // id -> { callback, ms, handle }
+        this.frames = new Set();
+        this.listeners = new Set(); // [target, type, handler, options]
+    }
+
+    setTimeout(callback, ms) {
+        if (this.disposed) return null;
+        const id = ++sceneTimerId;
+        const timeout = { callback, remaining: ms, due: 0, handle: null };
+        this.timeouts.set(id, timeout);
+        if (!this.paused) this.startTimeout(id, timeout);
+        return id;
+    }
+
+    // Resolves after ms of the scene's time; never, if the scene ends first,
+    // so an awaiting script stops instead of running on into the next scene
+    delay(ms) {
+        return new Promise(resolve => this.setTimeout(resolve, ms));
+    }
+
+    startTimeout(id, timeout) {
+        timeout.due = performance.now() + timeout.remaining;
+        timeout.handle = setTimeout(() => {
+            this.timeouts.delete(id);
+            timeout.callback();
+            this.wake();
+        }, timeout.remaining);
+    }
+
+    clearTimeout(id) {
+        const timeout = this.timeouts.get(id);
+        if (!timeout) return;
+        clearTimeout(timeout.handle);
+        this.timeouts.delete(id);
+    }
+
+    setInterval(callback, ms) {
+        if (this.disposed) return null;
+        const id = ++sceneTimerId;
+        const interval = { callback, ms, handle: null };
+        this.intervals.set(id, interval);
+        if (!this.paused) this.startInterval(interval);
+        return id;
+    }
+
+    startInterval(interval) {
+        interval.handle = setInterval(() => {
+            interval.callback();
+            this.wake();
+        }, interval.ms);
+    }
+
+    clearInterval(id) {
+        const interval = this.intervals.get(id);
+        if (!interval) return;
+        clearInterval(interval.handle);
+        this.intervals.delete(id);
+    }
+
+    // Hold the timers, keeping how long each timeout had left
+    pause() {
+        if (this.paused) return;
+        this.paused = true;
+        const now = performance.now();
+        this.timeouts.forEach(timeout => {
+            clearTimeout(timeout.handle);
+            timeout.remaining = Math.max(0, timeout.due - now);
+        });
+        this.intervals.forEach(interval => clearInterval(interval.handle));
+    }
+
+    resume() {
+        if (!this.paused || this.disposed) return;
+        this.paused = false;
+        this.timeouts.forEach((timeout, id) => this.startTimeout(id, timeout));
+        this.intervals.forEach(interval => this.startInterval(interval));
+    }
+
+    requestAnimationFrame(callback) {
+        if (this.disposed) return null;
+        const id = requestAnimationFrame((time) => {
+            this.frames.delete(id);
+            callback(time);
+        });
+        this.frames.add(id);
+        return id;
+    }
+
+    cancelAnimationFrame(id) {
+        cancelAnimationFrame(id);
+        this.frames.delete(id);
+    }
+
+    listen(target, type, handler, options) {
+        if (this.disposed) return;
+        target.addEventListener(type, handler, options);
+        this.listeners.add([target, type, handler, options]);
+    }
+
+    // { timeouts, intervals, frames, listeners } still registered
+    pending() {
+        return {
+            timeouts: this.timeouts.size,
+            intervals: this.intervals.size,
+            frames: this.frames.size,
+            listeners: this.listeners.size
+        };
+    }
+
+    // Cancel everything still registered; returns what was cancelled
+    dispose() {
+        const cancelled = this.pending();
+        this.timeouts.forEach(timeout => clearTimeout(timeout.handle));
+        this.intervals.forEach(interval => clearInterval(interval.handle));
+        this.frames.forEach(id => cancelAnimationFrame(id));
+        this.listeners.forEach(([target, type, handler, options]) => target.removeEventListener(type, handler, options));
+        this.timeouts.clear();
+        this.intervals.clear();
+        this.frames.clear();
+        this.listeners.clear();
+        this.disposed = true;
+        return cancelled;
+    }
+}
+
+class SceneLifecycle {
+    constructor(scheduler, { historySize = 50 } = {}) {
+        this.scheduler = scheduler;
+        this.historySize = historySize;
+        this.suspended = false;
+        this.scope = this.createScope('startup');
+        this.history = []; // { scene, durationMs, cancelled }, oldest first
+        this.totals = { scenes: 0, timeouts: 0, intervals: 0, frames: 0, listeners: 0 };
+    }
+
+    createScope(name) {
+        const scope = new SceneScope(name, () => this.scheduler.wake());
+        if (this.suspended) scope.pause();
+        return scope;
+    }
+
+    // End the current scene, cancelling its pending work, and start `name`
+    enter(name) {
+        this.scheduler.stop();
+        const previous = this.scope;
+        const cancelled = previous.dispose();
+        const durationMs = performance.now() - previous.enteredAt;
+
+        this.history.push({ scene: previous.name, durationMs, cancelled });
+        if (this.history.length > this.historySize) this.history.shift();
+        this.totals.scenes++;
+        for (const kind of Object.keys(cancelled)) {
+            this.totals[kind] += cancelled[kind];
+        }
+        const count = Object.values(cancelled).reduce((total, value) => total + value, 0);
+        if (count) {
+            log.debug(`🧹 Left ${previous.name} scene: cancelled`, cancelled);
+        }
+
+        this.scope = this.createScope(name);
+        return this.scope;
+    }
+
+    // The page is hidden: hold the scene's timers and its frame loop
+    suspend() {
+        this.suspended = true;
+        this.scope.pause();
+        this.scheduler.suspend();
+    }
+
+    resume() {
+        this.suspended = false;
+        this.scope.resume();
+        this.scheduler.resume();
+    }
+
+    // What the current scene has pending, and what earlier scenes left
+    // behind when they ended (each of which would otherwise have leaked)
+    leakReport() {
+        return {
+            scene: this.scope.name,
+            pending: this.scope.pending(),
+            frameLoop: this.scheduler.scene,
+            cancelledOnExit: { ...this.totals },
+            recent: this.history.filter(entry => Object.values(entry.cancelled).some(Boolean))
+        };
+    }
+}
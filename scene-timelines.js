@@ -0,0 +1,2 @@
+// Generated by compile_scenes.py from scenes/*.json - do not edit
+window.SCENE_TIMELINES = {"dropOffGeorgeNYC":{"styles":["position: absolute; width: 100%; height: 100%; background: linear-gradient(to bottom, #87CEEB 0%, #F0E68C 100%)","position: absolute; left: 50%; transform: translateX(-50%); font-size: 2em; text-shadow: 2px 2px 4px rgba(0,0,0,0.8); font-family: Comic Sans MS, cursive; z-index: 25; top: 30px; color: #FF6B6B","position: absolute; bottom: 100px; font-size: 4em; z-index: 10; left: 80px","position: absolute; bottom: 100px; font-size: 4em; z-index: 10; left: 170px","position: absolute; bottom: 100px; font-size: 4em; z-index: 10; left: 260px","position: absolute; bottom: 100px; font-size: 4em; z-index: 10; left: 350px","position: absolute; bottom: 100px; font-size: 4em; z-index: 10; left: 440px","position: absolute; bottom: 100px; font-size: 4em; z-index: 10; left: 530px","position: absolute; bottom: 100px; font-size: 4em; z-index: 10; left: 620px","position: absolute; bottom: 150px; right: 100px; font-size: 5em; z-index: 15; animation: float 3s ease-in-out infinite","position: absolute; bottom: 200px; left: 250px; font-size: 3em; z-index: 20","position: absolute; bottom: 200px; left: 400px; font-size: 3em; z-index: 20","position: absolute; bottom: 150px; left: 150px; font-size: 3em; z-index: 15"],"elements":[["",0],["🏙️ New York City - George's Home! 🗽",1],["🏢",2],["🏬",3],["🏢",4],["🏭",5],["🏢",6],["🏬",7],["🏢",8],["🗽",9],["👨‍🚀",10],["👩‍🚀",11],["🚕",12]],"timeline":[["clear"],["show",0,13],["say","Welcome to New York City! This is where George lives!","narrator","222a6f2f",2690],["wait",2000],["say","👨‍🚀 George: Wow! It feels so good to be back in New York! I can't wait to tell everyone about our moon adventure!","george","241a4b2d",5381],["wait",2500],["say","👩‍🚀 Matilda: I'm going to miss you so much, George! This was the best adventure ever!","matilda","d38744d7",4179],["wait",2000],["say","👨‍🚀 George: I'll miss you too, Matilda! Let's plan another adventure soon!","george","d3d2c2c1",3343],["wait",2500],["say","George waves goodbye as Matilda continues on to San Francisco...","narrator","a8ad0225",3526],["wait",2000]],"lines":[{"text":"Welcome to New York City! This is where George lives!","character":"narrator","clip":"222a6f2f"},{"text":"👨‍🚀 George: Wow! It feels so good to be back in New York! I can't wait to tell everyone about our moon adventure!","character":"george","clip":"241a4b2d"},{"text":"👩‍🚀 Matilda: I'm going to miss you so much, George! This was the best adventure ever!","character":"matilda","clip":"d38744d7"},{"text":"👨‍🚀 George: I'll miss you too, Matilda! Let's plan another adventure soon!","character":"george","clip":"d3d2c2c1"},{"text":"George waves goodbye as Matilda continues on to San Francisco...","character":"narrator","clip":"a8ad0225"}],"durationMs":30119},"goToFancyRestaurant":{"styles":["position: absolute; width: 100%; height: 100%; background: linear-gradient(45deg, #8B0000 0%, #FFD700 50%, #8B0000 100%)","position: absolute; left: 50%; transform: translateX(-50%); font-size: 2em; text-shadow: 3px 3px 6px rgba(0,0,0,0.8); font-family: Comic Sans MS, cursive; z-index: 25; top: 30px; color: #FFD700","position: absolute; bottom: 200px; left: 300px; font-size: 6em; z-index: 10","position: absolute; bottom: 280px; font-size: 2.5em; z-index: 15; animation: float 2s ease-in-out infinite; left: 250px; animation-delay: 0s","position: absolute; bottom: 280px; font-size: 2.5em; z-index: 15; animation: float 2s ease-in-out infinite; left: 310px; animation-delay: 0.3s","position: absolute; bottom: 280px; font-size: 2.5em; z-index: 15; animation: float 2s ease-in-out infinite; left: 370px; animation-delay: 0.6s","position: absolute; bottom: 280px; font-size: 2.5em; z-index: 15; animation: float 2s ease-in-out infinite; left: 430px; animation-delay: 0.9s","position: absolute; bottom: 280px; font-size: 2.5em; z-index: 15; animation: float 2s ease-in-out infinite; left: 490px; animation-delay: 1.2s","position: absolute; bottom: 120px; font-size: 3em; z-index: 20; animation: float 3s ease-in-out infinite; left: 150px","position: absolute; bottom: 120px; font-size: 3em; z-index: 20; animation: float 3s ease-in-out infinite; left: 300px","position: absolute; bottom: 120px; font-size: 3em; z-index: 20; animation: float 3s ease-in-out infinite; left: 450px"],"elements":[["",0],["🍽️ ✨ Fancy Moon Restaurant ✨ 🍽️",1],["🪑",2],["🥾",3],["🍞",4],["🥭",5],["🍷",6],["🍰",7],["🤵",8],["👰",9],["🐕‍🦺",10]],"timeline":[["say","Now let's go to the fanciest restaurant on the moon!","narrator","ad01f5f1",2821],["clear"],["show",0,11],["say","Welcome to the most elegant restaurant on the moon! Everyone looks so fancy!","narrator","74c28425",4545],["wait",3000],["say","🤵 George: I feel so fancy in this tuxedo!","george","34382d1c",1985],["say","👰 Matilda: This restaurant is absolutely beautiful!","matilda","059eb177",2220],["say","🐕‍🦺 Moon Dog: Thank you for bringing me to such a special place! This is the best day ever!","moondog","4e4ff699",4440],["wait",4000],["say","What a perfect ending to a wonderful day!","narrator","39cb0a6c",2351]],"lines":[{"text":"Now let's go to the fanciest restaurant on the moon!","character":"narrator","clip":"ad01f5f1"},{"text":"Welcome to the most elegant restaurant on the moon! Everyone looks so fancy!","character":"narrator","clip":"74c28425"},{"text":"🤵 George: I feel so fancy in this tuxedo!","character":"george","clip":"34382d1c"},{"text":"👰 Matilda: This restaurant is absolutely beautiful!","character":"matilda","clip":"059eb177"},{"text":"🐕‍🦺 Moon Dog: Thank you for bringing me to such a special place! This is the best day ever!","character":"moondog","clip":"4e4ff699"},{"text":"What a perfect ending to a wonderful day!","character":"narrator","clip":"39cb0a6c"}],"durationMs":25362},"matildaToSanFrancisco":{"styles":["position: absolute; width: 100%; height: 100%; background: linear-gradient(to bottom, #FF7F50 0%, #FFB6C1 100%)","position: absolute; left: 50%; transform: translateX(-50%); font-size: 2em; text-shadow: 2px 2px 4px rgba(0,0,0,0.8); font-family: Comic Sans MS, cursive; z-index: 25; top: 30px; color: #4ECDC4","position: absolute; top: 120px; left: 50%; transform: translateX(-50%); font-size: 6em; z-index: 15; animation: float 4s ease-in-out infinite","position: absolute; bottom: 150px; font-size: 3.5em; z-index: 10; left: 120px","position: absolute; bottom: 150px; font-size: 3.5em; z-index: 10; left: 240px","position: absolute; bottom: 150px; font-size: 3.5em; z-index: 10; left: 360px","position: absolute; bottom: 150px; font-size: 3.5em; z-index: 10; left: 480px","position: absolute; bottom: 150px; font-size: 3.5em; z-index: 10; left: 600px","position: absolute; bottom: 250px; font-size: 2.5em; z-index: 5; opacity: 0.8; left: 200px","position: absolute; bottom: 250px; font-size: 2.5em; z-index: 5; opacity: 0.8; left: 350px","position: absolute; bottom: 250px; font-size: 2.5em; z-index: 5; opacity: 0.8; left: 500px","position: absolute; bottom: 200px; left: 350px; font-size: 3em; z-index: 20","position: absolute; bottom: 180px; left: 500px; font-size: 2.5em; z-index: 15"],"elements":[["",0],["🌉 San Francisco - Matilda's Home! 🌁",1],["🌉",2],["🏢",3],["🏬",4],["🏘️",5],["🏢",6],["🏬",7],["🏘️",8],["🏡",9],["🏘️",10],["👩‍🚀",11],["🚋",12]],"timeline":[["clear"],["show",0,13],["say","Welcome to beautiful San Francisco! This is Matilda's home!","narrator","ee090b83",3239],["wait",2000],["say","👩‍🚀 Matilda: Home sweet home! I love San Francisco, but I'll always remember our incredible moon adventure!","matilda","f4414700",5198],["wait",2500],["say","👩‍🚀 Matilda: I can't wait to tell my family about Moon Dog, the vegetable garden, the playground, and all our fun activities!","matilda","f5136875",5982],["wait",3000],["say","👩‍🚀 Matilda: George, Moon Dog, and I will be friends forever! What an amazing adventure we had!","matilda","8dc414df",4675],["wait",3000]],"lines":[{"text":"Welcome to beautiful San Francisco! This is Matilda's home!","character":"narrator","clip":"ee090b83"},{"text":"👩‍🚀 Matilda: Home sweet home! I love San Francisco, but I'll always remember our incredible moon adventure!","character":"matilda","clip":"f4414700"},{"text":"👩‍🚀 Matilda: I can't wait to tell my family about Moon Dog, the vegetable garden, the playground, and all our fun activities!","character":"matilda","clip":"f5136875"},{"text":"👩‍🚀 Matilda: George, Moon Dog, and I will be friends forever! What an amazing adventure we had!","character":"matilda","clip":"8dc414df"}],"durationMs":29594},"playBreakfastActivity":{"styles":["position: absolute; left: 50%; transform: translateX(-50%); font-size: 2em; text-shadow: 2px 2px 4px rgba(0,0,0,0.8); font-family: Comic Sans MS, cursive; z-index: 25; top: 50px; color: #FFD700","position: absolute; top: 200px; font-size: 3em; z-index: 15; animation: float 2s ease-in-out infinite; left: 200px; animation-delay: 0s","position: absolute; top: 200px; font-size: 3em; z-index: 15; animation: float 2s ease-in-out infinite; left: 280px; animation-delay: 0.3s","position: absolute; top: 200px; font-size: 3em; z-index: 15; animation: float 2s ease-in-out infinite; left: 360px; animation-delay: 0.6s","position: absolute; top: 200px; font-size: 3em; z-index: 15; animation: float 2s ease-in-out infinite; left: 440px; animation-delay: 0.9s","position: absolute; top: 200px; font-size: 3em; z-index: 15; animation: float 2s ease-in-out infinite; left: 520px; animation-delay: 1.2s"],"elements":[["🍳 Cooking Breakfast Together! 🥞",0],["🥞",1],["🥓",2],["🍳",3],["🥖",4],["🍌",5]],"timeline":[["clear"],["call","createHouseInterior"],["show",0,6],["call","createInteractiveCharacters"],["say","Everyone is helping to make a delicious breakfast! Pancakes, bacon, eggs, and fresh fruit!","narrator","57ceb4e0",5328],["wait",3000],["say","🐕‍🦺 Moon Dog: This breakfast smells amazing! Thank you for cooking with me!","moondog","5f6cfe01",3108],["say","👨‍🚀 George: Cooking together is so much fun!","george","2fe0ba20",1750],["say","👩‍🚀 Matilda: The best part is sharing it with friends!","matilda","f9f7c43a",2037]],"lines":[{"text":"Everyone is helping to make a delicious breakfast! Pancakes, bacon, eggs, and fresh fruit!","character":"narrator","clip":"57ceb4e0"},{"text":"🐕‍🦺 Moon Dog: This breakfast smells amazing! Thank you for cooking with me!","character":"moondog","clip":"5f6cfe01"},{"text":"👨‍🚀 George: Cooking together is so much fun!","character":"george","clip":"2fe0ba20"},{"text":"👩‍🚀 Matilda: The best part is sharing it with friends!","character":"matilda","clip":"f9f7c43a"}],"durationMs":15223}};
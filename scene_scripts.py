@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Declarative scene scripts - scenes/<name>.json
+
+A scene is a list of steps run in order by MoonVegetableGame.runScene():
+
+    {"clear": true}                              empty the game area
+    {"call": "createHouseInterior"}              run (and await) a game method
+    {"show": [element, ...]}                     add elements to the game area
+    {"say": "text", "character": "narrator"}     speak a line and wait for it
+    {"wait": 2000}                               pause, in milliseconds
+
+An element is {"text": "🗽", "style": "title", "css": {"top": "30px"}}: a div
+with the named shared style from scenes/styles.json (default "prop"), then
+the element's own CSS on top. A row of similar elements is written once:
+
+    {"row": ["🏢", "🏬"], "left": 80, "spacing": 90, "stagger": 0.3, "css": {...}}
+
+which places each item `spacing` px further right, starting at `left` px,
+with each item's animation delayed `stagger` seconds more than the last.
+
+This module loads and validates the format; compile_scenes.py turns scenes
+into the timelines the game runs.
+"""
+import json
+from pathlib import Path
+
+from tts_backends import VOICE_IDS
+
+SCENES_DIR = 'scenes'
+STYLES_FILE = 'styles.json'
+DEFAULT_STYLE = 'prop'
+
+STEP_KINDS = ('clear', 'call', 'show', 'say', 'wait')
+ELEMENT_KEYS = {'text', 'style', 'css'}
+ROW_KEYS = {'row', 'left', 'spacing', 'stagger', 'style', 'css'}
+
+
+def load_styles(scenes_dir=SCENES_DIR):
+    """Shared named styles: {name: {css property: value}}"""
+    with open(Path(scenes_dir) / STYLES_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def scene_path(name, scenes_dir=SCENES_DIR):
+    return Path(scenes_dir) / f"{name}.json"
+
+
+def load_scene(name, scenes_dir=SCENES_DIR):
+    with open(scene_path(name, scenes_dir), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def scene_names(scenes_dir=SCENES_DIR):
+    return sorted(path.stem for path in Path(scenes_dir).glob('*.json') if path.name != STYLES_FILE)
+
+
+def scene_lines(scene):
+    """(text, character) for every say step, in order"""
+    return [(step['say'], step.get('character', 'narrator')) for step in scene['steps'] if 'say' in step]
+
+
+def validate_css(css, where):
+    if not isinstance(css, dict):
+        return [f"{where} css is not an object"]
+    return [f"{where} css {name!r} is not a string" for name, value in css.items() if not isinstance(value, str)]
+
+
+def validate_element(element, where, styles):
+    if not isinstance(element, dict):
+        return [f"{where} is not an object"]
+
+    errors = []
+    is_row = 'row' in element
+    allowed = ROW_KEYS if is_row else ELEMENT_KEYS
+    errors += [f"{where} has unknown key {key!r}" for key in element if key not in allowed]
+
+    if element.get('style', DEFAULT_STYLE) not in styles:
+        errors.append(f"{where} style {element['style']!r} is not in {STYLES_FILE}")
+    errors += validate_css(element.get('css', {}), where)
+
+    if is_row:
+        if not isinstance(element['row'], list) or not all(isinstance(text, str) for text in element['row']):
+            errors.append(f"{where} row is not a list of strings")
+        for key in ('left', 'spacing'):
+            if not isinstance(element.get(key), (int, float)):
+                errors.append(f"{where} row needs a numeric {key!r}")
+        if not isinstance(element.get('stagger', 0), (int, float)):
+            errors.append(f"{where} stagger is not a number")
+    elif not isinstance(element.get('text', ''), str):
+        errors.append(f"{where} text is not a string")
+    return errors
+
+
+def validate_scene(scene, name, styles, methods=None):
+    """Return a list of problems with a scene (empty if it's valid).
+
+    methods, if given, is the set of MoonVegetableGame method names that
+    call steps may use.
+    """
+    if not isinstance(scene, dict) or not isinstance(scene.get('steps'), list):
+        return [f"{name}: needs a list of steps"]
+
+    errors = []
+    if scene.get('scene') != name:
+        errors.append(f"{name}: 'scene' is {scene.get('scene')!r}, expected the file name {name!r}")
+
+    for index, step in enumerate(scene['steps']):
+        where = f"{name}: steps[{index}]"
+        kinds = [kind for kind in STEP_KINDS if isinstance(step, dict) and kind in step]
+        if len(kinds) != 1:
+            errors.append(f"{where} needs exactly one of: {', '.join(STEP_KINDS)}")
+            continue
+        kind = kinds[0]
+        extra = set(step) - {kind} - ({'character'} if kind == 'say' else set())
+        errors += [f"{where} has unknown key {key!r}" for key in sorted(extra)]
+
+        if kind == 'clear' and step['clear'] is not True:
+            errors.append(f"{where} clear must be true")
+        elif kind == 'call':
+            if not isinstance(step['call'], str):
+                errors.append(f"{where} call is not a method name")
+            elif methods is not None and step['call'] not in methods:
+                errors.append(f"{where} calls unknown method {step['call']!r}")
+        elif kind == 'show':
+            if not isinstance(step['show'], list):
+                errors.append(f"{where} show is not a list")
+                continue
+            for element_index, element in enumerate(step['show']):
+                errors += validate_element(element, f"{where}.show[{element_index}]", styles)
+        elif kind == 'say':
+            if not isinstance(step['say'], str) or not step['say'].strip():
+                errors.append(f"{where} say is empty")
+            if step.get('character', 'narrator') not in VOICE_IDS:
+                errors.append(f"{where} character {step.get('character')!r} has no voice")
+        elif kind == 'wait':
+            if not isinstance(step['wait'], int) or isinstance(step['wait'], bool) or step['wait'] < 0:
+                errors.append(f"{where} wait is not a number of milliseconds")
+    return errors
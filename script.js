@@ -8,7 +8,9 @@ class MoonVegetableGame {
         this.currentPlayer = 'george';
         this.gameRunning = false;
         this.vegetables = ['🥕', '🥬', '🌽', '🍅', '🥒', '🥔'];
-        this.vegetableElements = [];
+        this.vegetableGrid = new SpatialGrid(64); // vegetables waiting to be picked up
+        this.vegetableExpiry = new Map(); // vegetable -> timeout that removes it uncollected
+        this.maxGardenVegetables = 6; // on the ground at once, at the high quality tier
         this.collectedVegetables = [];
         this.vegetablesNeeded = 6;
         
@@ -17,13 +19,14 @@ class MoonVegetableGame {
         this.spaceshipX = 400;
         this.spaceshipY = 300;
         this.flightProgress = 0;
-        this.asteroids = [];
+        this.spaceRenderer = null; // SpaceFlightRenderer for the current space scene
         this.dialogueStep = 0;
         this.houseEntered = false;
         this.cookingStarted = false;
         this.returnDialogueStep = 0;
         this.cookingDialogueStep = 0;
         this.cleanedVegetables = [];
+        this.cleanVegetableNodes = []; // by index in cleanedVegetables
         this.choppedVegetables = [];
         this.platedFood = false;
         this.dayCounter = 0;
@@ -36,6 +39,40 @@ class MoonVegetableGame {
         this.followQueue = [];
         this.maxFollowDistance = 80;
         this.followSpeed = 12;
+        this.followStep = 15; // px the player moves between points left for the follower
+        
+        // Held directions, from the keyboard and the on-screen buttons; the
+        // frame loop turns them into movement
+        this.input = new InputState({ onChange: () => this.scheduler.wake() });
+        
+        // The shortest pause after a line (see pauseAfterLine)
+        this.lineBeatMs = 500;
+        
+        // Steps stars, spawn rates and transitions down when frames are slow
+        this.quality = new QualityController({ onChange: (settings) => this.applyQuality(settings) });
+        
+        // Movement and progress advance in fixed steps of game time, not per
+        // frame; the scheduler runs the current scene's systems every frame
+        this.clock = new GameClock();
+        this.scheduler = new FrameScheduler(this.clock);
+        
+        // Timers, listeners and the frame loop belong to the scene that
+        // started them and are cancelled when the next scene is entered
+        this.lifecycle = new SceneLifecycle(this.scheduler);
+        this.scene = this.lifecycle.scope;
+        
+        // Positions of the characters and vegetables, as numbers
+        this.entities = new EntityStore();
+        
+        // Where the current scene's furniture can be reached from
+        this.zones = new InteractionZones();
+        
+        // Nodes for things that are spawned and removed over and over
+        this.pools = {
+            vegetable: this.createNodePool('vegetable'),
+            cleanVegetable: this.createNodePool('clean-vegetable'),
+            choppedVegetable: this.createNodePool('chopped-vegetable')
+        };
         
         this.init();
     }
@@ -43,6 +80,8 @@ class MoonVegetableGame {
     init() {
         this.startBtn.addEventListener('click', () => this.startSpaceFlight());
         document.addEventListener('keydown', (e) => this.handleKeyPress(e));
+        document.addEventListener('keyup', (e) => this.handleKeyRelease(e));
+        document.addEventListener('visibilitychange', () => this.handleVisibilityChange());
         
         // Add click listener to unlock audio on any user interaction (all platforms)
         this.gameArea.addEventListener('click', () => {
@@ -51,13 +90,33 @@ class MoonVegetableGame {
             }
         });
         
-        this.createPickupSound();
+        this.initTextToSpeech();
+        this.initElevenLabsAudio();
         this.initSpaceFlight();
         this.initAudioSettings();
-        this.initElevenLabsAudio();
         this.initMobileControls();
     }
     
+    // Nothing runs while the page is hidden: the frame loop and the
+    // scene's timers wait, and carry on from where they were when it's shown
+    handleVisibilityChange() {
+        if (document.hidden) {
+            this.releaseAllMovement();
+            this.lifecycle.suspend();
+        } else {
+            this.lifecycle.resume();
+        }
+    }
+    
+    // A new quality tier takes effect at once for the space starfield and
+    // the buttons; star fields built later and spawn timings read it as they go
+    applyQuality(settings) {
+        if (this.spaceRenderer) {
+            this.spaceRenderer.setStarCount(100 * settings.starScale);
+        }
+        document.body.dataset.quality = settings.name;
+    }
+    
     initAudioSettings() {
         // Audio is always enabled - no mute functionality
         this.speechMuted = false;
@@ -76,10 +135,6 @@ class MoonVegetableGame {
         const directionButtons = document.querySelectorAll('.direction-btn');
         const switchButton = document.getElementById('switchBtn');
         
-        // Initialize mobile movement state
-        this.mobileMovementIntervals = {};
-        this.mobileMovementActive = {};
-        
         directionButtons.forEach(btn => {
             const direction = btn.dataset.direction;
             
@@ -162,13 +217,10 @@ class MoonVegetableGame {
             }
         });
         
-        // Clear mobile movement timers when window loses focus or page unloads
+        // Let go of everything held when the window loses focus, as the
+        // matching keyup or touchend never arrives
         window.addEventListener('blur', () => {
-            this.clearAllMobileMovementTimers();
-        });
-        
-        window.addEventListener('beforeunload', () => {
-            this.clearAllMobileMovementTimers();
+            this.releaseAllMovement();
         });
     }
     
@@ -186,59 +238,14 @@ class MoonVegetableGame {
         }
     }
     
-    handleMobileMovement(direction) {
-        // Simulate keyboard event for mobile touch
-        const keyMap = {
-            'up': 'ArrowUp',
-            'down': 'ArrowDown',
-            'left': 'ArrowLeft',
-            'right': 'ArrowRight'
-        };
-        
-        const keyEvent = {
-            key: keyMap[direction],
-            preventDefault: () => {}
-        };
-        
-        this.handleKeyPress(keyEvent);
-    }
-    
     startContinuousMovement(direction, button) {
-        // Stop any existing movement for this direction
-        this.stopContinuousMovement(direction, button);
-        
         // Add visual feedback - make button appear pressed
         button.style.backgroundColor = 'rgba(255, 255, 255, 0.5)';
         button.style.transform = 'scale(0.95)';
-        button.style.transition = 'all 0.1s ease';
-        
-        // Mark this direction as active
-        this.mobileMovementActive[direction] = true;
-        
-        // Start immediate movement
-        this.handleMobileMovement(direction);
-        
-        // Set up continuous movement with iOS-optimized timing
-        const initialDelay = 300; // Slightly longer initial delay for iOS
-        const repeatInterval = 100; // Slower repeat rate for smoother mobile experience
-        
-        // Store the timeout reference for cleanup
-        this.mobileMovementTimeouts = this.mobileMovementTimeouts || {};
-        
-        this.mobileMovementTimeouts[direction] = setTimeout(() => {
-            // Only start continuous movement if button is still being pressed
-            if (this.mobileMovementActive[direction]) {
-                this.mobileMovementIntervals[direction] = setInterval(() => {
-                    if (this.mobileMovementActive[direction]) {
-                        this.handleMobileMovement(direction);
-                    } else {
-                        // Clean up if movement is no longer active
-                        clearInterval(this.mobileMovementIntervals[direction]);
-                        this.mobileMovementIntervals[direction] = null;
-                    }
-                }, repeatInterval);
-            }
-        }, initialDelay);
+        button.style.transition = this.quality.settings.transitions ? 'all 0.1s ease' : 'none';
+        
+        // Held until released; the frame loop does the moving
+        this.input.press(direction);
     }
     
     stopContinuousMovement(direction, button) {
@@ -247,48 +254,11 @@ class MoonVegetableGame {
         button.style.transform = '';
         button.style.transition = '';
         
-        // Mark direction as inactive
-        this.mobileMovementActive[direction] = false;
-        
-        // Clear any existing timeout
-        if (this.mobileMovementTimeouts && this.mobileMovementTimeouts[direction]) {
-            clearTimeout(this.mobileMovementTimeouts[direction]);
-            this.mobileMovementTimeouts[direction] = null;
-        }
-        
-        // Clear any existing interval
-        if (this.mobileMovementIntervals[direction]) {
-            clearInterval(this.mobileMovementIntervals[direction]);
-            this.mobileMovementIntervals[direction] = null;
-        }
+        this.input.release(direction);
     }
     
-    clearAllMobileMovementTimers() {
-        // Clear all mobile movement timeouts
-        if (this.mobileMovementTimeouts) {
-            Object.keys(this.mobileMovementTimeouts).forEach(direction => {
-                if (this.mobileMovementTimeouts[direction]) {
-                    clearTimeout(this.mobileMovementTimeouts[direction]);
-                    this.mobileMovementTimeouts[direction] = null;
-                }
-            });
-        }
-        
-        // Clear all mobile movement intervals and reset states
-        if (this.mobileMovementIntervals) {
-            Object.keys(this.mobileMovementIntervals).forEach(direction => {
-                if (this.mobileMovementIntervals[direction]) {
-                    clearInterval(this.mobileMovementIntervals[direction]);
-                    this.mobileMovementIntervals[direction] = null;
-                }
-            });
-        }
-        
-        if (this.mobileMovementActive) {
-            Object.keys(this.mobileMovementActive).forEach(direction => {
-                this.mobileMovementActive[direction] = false;
-            });
-        }
+    releaseAllMovement() {
+        this.input.releaseAll();
         
         // Reset visual state of all direction buttons
         const directionButtons = document.querySelectorAll('.direction-btn');
@@ -299,15 +269,6 @@ class MoonVegetableGame {
         });
     }
     
-    createPickupSound() {
-        // Create a simple pickup sound using Web Audio API
-        this.audioContext = new (window.AudioContext || window.webkitAudioContext)();
-        
-        // Initialize text-to-speech and mobile audio system
-        this.initTextToSpeech();
-        this.initElevenLabsAudio();
-    }
-    
     initTextToSpeech() {
         if ('speechSynthesis' in window) {
             this.speechSynthesis = window.speechSynthesis;
@@ -348,7 +309,7 @@ class MoonVegetableGame {
             // Also listen for voice changes (some browsers load voices async)
             this.speechSynthesis.onvoiceschanged = loadVoices;
         } else {
-            console.log('Text-to-speech not supported in this browser');
+            log.info('Text-to-speech not supported in this browser');
         }
     }
     
@@ -356,25 +317,39 @@ class MoonVegetableGame {
         // Initialize ElevenLabs audio system for all platforms
         if (window.MobileAudioSystem) {
             this.mobileAudio = new window.MobileAudioSystem();
-            console.log('🎵 ElevenLabs audio system initialized for all platforms');
+            this.mobileAudio.onWord = (index, text) => this.highlightSpokenWord(index, text);
+            log.info('🎵 ElevenLabs audio system initialized for all platforms');
         } else {
-            console.warn('⚠️ ElevenLabs audio system not available');
+            log.warn('⚠️ ElevenLabs audio system not available');
             this.mobileAudio = null;
         }
     }
     
-    speak(text, character = 'narrator') {
-        console.log(`🎮 Game speak() called - text: "${text.substring(0, 30)}..."`);
+    // clipId is filled in by build_bundle.py for lines known at build time.
+    // Resolves, when the line has been spoken, with the length of its clip
+    // in ms (null when it isn't known).
+    speak(text, character = 'narrator', clipId = null) {
+        const lineMs = (this.mobileAudio && this.mobileAudio.getClipDuration(text, character, clipId)) || null;
+        
+        // Scenes move on when a line ends (the next vegetable to wash, say),
+        // so an idle frame loop wakes up to look again
+        return this.speakLine(text, character, clipId)
+            .then(() => lineMs)
+            .finally(() => this.scheduler.wake());
+    }
+    
+    speakLine(text, character, clipId) {
+        log.debug(`🎮 Game speak() called - text: "${text.substring(0, 30)}..."`);
         
         // Audio is always enabled
         
         // Try ElevenLabs audio system first (on ALL platforms)
         if (this.mobileAudio) {
-            console.log('🎵 Using ElevenLabs audio system');
-            return this.mobileAudio.speak(text, character);
+            log.debug('🎵 Using ElevenLabs audio system');
+            return this.mobileAudio.speak(text, character, clipId);
         }
         
-        console.log('🖥️ Using desktop text-to-speech fallback');
+        log.debug('🖥️ Using desktop text-to-speech fallback');
         
         // Fallback to text-to-speech only if no audio system
         if (!this.speechSynthesis) return Promise.resolve();
@@ -411,14 +386,84 @@ class MoonVegetableGame {
         });
     }
     
-    // Calculate estimated speech duration for fallback timing
-    estimateSpeechDuration(text, rate = 0.8) {
-        // Rough estimate: average speaking rate is about 150-160 words per minute
-        // Adjusted for our slower rate
-        const wordsPerMinute = 120 * rate;
-        const words = text.split(' ').length;
-        const durationMs = (words / wordsPerMinute) * 60 * 1000;
-        return Math.max(2000, durationMs + 1000); // Minimum 2 seconds, plus 1 second buffer
+    // Start loading the lines after the current one while it plays
+    prefetchDialogue(lines) {
+        if (this.mobileAudio) {
+            this.mobileAudio.prefetchLines(lines);
+        }
+    }
+    
+    // Play a scene compiled from scenes/<name>.json by compile_scenes.py.
+    // Lines already carry their clip IDs, so nothing is matched at runtime.
+    async runScene(name) {
+        const scene = window.SCENE_TIMELINES[name];
+        let spoken = 0;
+        
+        for (const [op, ...args] of scene.timeline) {
+            if (op === 'clear') {
+                this.enterScene(name);
+            } else if (op === 'call') {
+                await this[args[0]]();
+            } else if (op === 'show') {
+                this.showSceneElements(scene, args[0], args[1]);
+            } else if (op === 'say') {
+                const [text, character, clipId] = args;
+                spoken++;
+                const speaking = this.speak(text, character, clipId);
+                this.prefetchDialogue(scene.lines.slice(spoken));
+                await speaking;
+            } else if (op === 'wait') {
+                await this.scene.delay(args[0]);
+            }
+        }
+    }
+    
+    showSceneElements(scene, start, end) {
+        const fragment = document.createDocumentFragment();
+        for (const [text, style] of scene.elements.slice(start, end)) {
+            const element = document.createElement('div');
+            element.textContent = text;
+            element.style.cssText = scene.styles[style];
+            fragment.appendChild(element);
+        }
+        this.gameArea.appendChild(fragment);
+    }
+    
+    // The pause after a line. `ms` is the time the scene gives the line and
+    // lineMs its clip's length, as speak() resolves with: a clip of known
+    // length has just played in full, so only the rest of that time is
+    // waited, and never less than a beat; a line without one keeps all of it.
+    pauseAfterLine(ms, lineMs) {
+        const pauseMs = lineMs ? Math.max(this.lineBeatMs, ms - lineMs) : ms;
+        return this.scene.delay(pauseMs);
+    }
+    
+    // Light up the dialogue box word by word as the clip plays
+    highlightSpokenWord(index, text) {
+        const dialogueBox = document.getElementById('dialogue-box');
+        if (!dialogueBox) return;
+        
+        if (!dialogueBox.querySelector('.word') || dialogueBox.dataset.spokenText !== text) {
+            if (dialogueBox.textContent !== text) return;
+            
+            dialogueBox.dataset.spokenText = text;
+            dialogueBox.textContent = '';
+            text.split(' ').forEach((word, i) => {
+                if (i > 0) dialogueBox.appendChild(document.createTextNode(' '));
+                const span = document.createElement('span');
+                span.className = 'word';
+                span.textContent = word;
+                dialogueBox.appendChild(span);
+            });
+        }
+        
+        // Timing covers the spoken words only, not the emoji/name prefix
+        const words = dialogueBox.querySelectorAll('.word');
+        const spokenWords = this.mobileAudio.cleanTextForMatching(text).split(/\s+/).length;
+        const offset = Math.max(0, words.length - spokenWords);
+        words.forEach((word, i) => {
+            word.classList.toggle('spoken', i < offset || i <= offset + index);
+        });
     }
     
     processTextForSpeech(text, character) {
@@ -511,77 +556,122 @@ class MoonVegetableGame {
         };
     }
     
+    // A short chirp, played on the dialogue's AudioContext so the game only
+    // ever has the one
     playPickupSound() {
-        const oscillator = this.audioContext.createOscillator();
-        const gainNode = this.audioContext.createGain();
+        if (!this.mobileAudio || !(window.AudioContext || window.webkitAudioContext)) return;
+        const audioContext = this.mobileAudio.getAudioContext();
+        const oscillator = audioContext.createOscillator();
+        const gainNode = audioContext.createGain();
         
         oscillator.connect(gainNode);
-        gainNode.connect(this.audioContext.destination);
+        gainNode.connect(audioContext.destination);
         
-        oscillator.frequency.setValueAtTime(800, this.audioContext.currentTime);
-        oscillator.frequency.setValueAtTime(1000, this.audioContext.currentTime + 0.1);
+        oscillator.frequency.setValueAtTime(800, audioContext.currentTime);
+        oscillator.frequency.setValueAtTime(1000, audioContext.currentTime + 0.1);
         
-        gainNode.gain.setValueAtTime(0.3, this.audioContext.currentTime);
-        gainNode.gain.exponentialRampToValueAtTime(0.01, this.audioContext.currentTime + 0.2);
+        gainNode.gain.setValueAtTime(0.3, audioContext.currentTime);
+        gainNode.gain.exponentialRampToValueAtTime(0.01, audioContext.currentTime + 0.2);
         
-        oscillator.start(this.audioContext.currentTime);
-        oscillator.stop(this.audioContext.currentTime + 0.2);
+        oscillator.start(audioContext.currentTime);
+        oscillator.stop(audioContext.currentTime + 0.2);
+    }
+    
+    // Start a new scene: clear the game area and cancel the timers,
+    // listeners and frame loop the previous one left running
+    enterScene(name) {
+        this.scene = this.lifecycle.enter(name);
+        this.gameArea.innerHTML = '';
+        this.entities.clear();
+        this.zones.clear();
+        this.vegetableGrid.clear();
+        this.vegetableExpiry.clear();
+        Object.values(this.pools).forEach(pool => pool.releaseAll());
+        this.input.stop();
+        return this.scene;
+    }
+    
+    // A pool of divs with this class; released ones lose their inline styles
+    createNodePool(className) {
+        return new NodePool(className, () => {
+            const node = document.createElement('div');
+            node.className = className;
+            return node;
+        }, (node) => {
+            node.className = className;
+            node.removeAttribute('style');
+        });
+    }
+    
+    // Size and reuse counts of each node pool
+    poolStats() {
+        return Object.values(this.pools).map(pool => pool.stats());
     }
     
     initSpaceFlight() {
         this.gameState = 'spaceFlight';
-        this.gameArea.innerHTML = '';
+        this.enterScene('spaceFlight');
         this.createSpaceBackground();
         this.createSpaceship();
         this.createEarth();
         this.createMoon();
+        this.drawSpaceScene('title');
         this.startBtn.textContent = 'Start Space Journey!';
     }
     
     createSpaceBackground() {
-        // Create scrolling starfield
-        for (let i = 0; i < 100; i++) {
-            const star = document.createElement('div');
-            star.className = 'space-star';
-            star.textContent = '✦';
-            star.style.left = Math.random() * 800 + 'px';
-            star.style.top = Math.random() * 600 + 'px';
-            star.style.animationDelay = Math.random() * 3 + 's';
-            star.style.fontSize = (Math.random() * 10 + 5) + 'px';
-            this.gameArea.appendChild(star);
-        }
+        // Scrolling starfield, drawn on the scene's canvas
+        this.spaceRenderer = new SpaceFlightRenderer(this.gameArea, { starCount: 100 });
+        this.spaceRenderer.setStarCount(100 * this.quality.settings.starScale);
+    }
+    
+    // Systems the scenes' frame loops share
+    spaceRenderSystem() {
+        return { name: 'render', frame: (time) => this.spaceRenderer.render(time) };
+    }
+    
+    // Feeds frame times to the quality controller
+    qualitySystem() {
+        return { name: 'quality', frame: () => this.quality.sample(this.clock.deltaMs), idle: () => true };
+    }
+    
+    // Its moves show up in the entity store, so it's idle when that is
+    followSystem() {
+        return { name: 'follow', step: () => this.smoothFollowUpdate(), idle: () => true };
+    }
+    
+    // Move the player's character by the held directions, each fixed step
+    inputSystem() {
+        return {
+            name: 'input',
+            step: () => this.moveWithInput(this.clock.stepMs / 1000),
+            idle: () => !this.input.moving
+        };
+    }
+    
+    // Write the positions that changed this frame in one pass
+    entitySystem() {
+        return { name: 'entities', frame: () => this.entities.flush(), idle: () => this.entities.moved === 0 };
+    }
+    
+    // Keep the space canvas drawn (stars twinkle) while it's on the page
+    drawSpaceScene(scene, systems = []) {
+        // With nothing moving, only the stars' twinkle changes: redraw that
+        // a few times a second instead of every frame
+        const render = { ...this.spaceRenderSystem(), idle: () => systems.length === 0 };
+        this.scheduler.run(scene, [...systems, render], () => this.spaceRenderer.attached, { idleFrameMs: 100 });
     }
     
     createSpaceship() {
-        const spaceship = document.createElement('div');
-        spaceship.id = 'spaceship';
-        spaceship.className = 'spaceship';
-        spaceship.textContent = '🚀';
-        spaceship.style.left = this.spaceshipX + 'px';
-        spaceship.style.top = this.spaceshipY + 'px';
-        this.gameArea.appendChild(spaceship);
+        this.spaceRenderer.setShip(this.spaceshipX, this.spaceshipY);
     }
     
     createEarth() {
-        const earth = document.createElement('div');
-        earth.id = 'earth';
-        earth.className = 'planet';
-        earth.textContent = '🌍';
-        earth.style.left = '50px';
-        earth.style.bottom = '50px';
-        earth.style.fontSize = '80px';
-        this.gameArea.appendChild(earth);
+        this.spaceRenderer.addBody('🌍', { left: 50, bottom: 50, size: 80 });
     }
     
     createMoon() {
-        const moon = document.createElement('div');
-        moon.id = 'moon';
-        moon.className = 'planet';
-        moon.textContent = '🌙';
-        moon.style.right = '50px';
-        moon.style.top = '50px';
-        moon.style.fontSize = '60px';
-        this.gameArea.appendChild(moon);
+        this.spaceRenderer.addBody('🌙', { right: 50, top: 50, size: 60 });
     }
     
     startSpaceFlight() {
@@ -614,24 +704,30 @@ class MoonVegetableGame {
     resetGameState() {
         // Clear any existing timers
         if (this.gameTimer) {
-            clearTimeout(this.gameTimer);
+            this.scene.clearTimeout(this.gameTimer);
             this.gameTimer = null;
         }
         
-        // Clear mobile movement timers
-        this.clearAllMobileMovementTimers();
+        // Let go of held directions
+        this.releaseAllMovement();
+        
+        // Lines queued for the previous game won't be spoken
+        if (this.mobileAudio) {
+            this.mobileAudio.cancelPrefetch();
+        }
         
         // Reset all cooking and game variables
         this.cookingStarted = false;
         this.returnDialogueStep = 0;
         this.cookingDialogueStep = 0;
         this.cleanedVegetables = [];
+        this.cleanVegetableNodes = [];
         this.choppedVegetables = [];
         this.platedFood = false;
         this.dayCounter = 0;
         this.currentCookingStep = 'washing';
         this.collectedVegetables = [];
-        this.vegetableElements = [];
+        this.vegetableGrid.clear();
         this.dialogueStep = 0;
         this.houseEntered = false;
         this.refrigeratorChecked = false;
@@ -641,7 +737,7 @@ class MoonVegetableGame {
         this.dailyActivitiesCompleted = [];
         this.gameState = 'spaceFlight';
         
-        console.log('Game state reset for new game');
+        log.info('Game state reset for new game');
     }
     
     startVegetableGame() {
@@ -656,11 +752,11 @@ class MoonVegetableGame {
         this.gameLoop();
         
         // Game timer - store reference so we can clear it later
-        this.gameTimer = setTimeout(() => this.endGame(), 60000); // 1 minute game
+        this.gameTimer = this.scene.setTimeout(() => this.endGame(), 60000); // 1 minute game
     }
     
     initVegetableGarden() {
-        this.gameArea.innerHTML = '';
+        this.enterScene('vegetableGarden');
         
         // Create moon surface
         const moonSurface = document.createElement('div');
@@ -671,7 +767,7 @@ class MoonVegetableGame {
         this.createInventoryDisplay();
         
         // Create stars background
-        for (let i = 0; i < 50; i++) {
+        for (let i = 0; i < 50 * this.quality.settings.starScale; i++) {
             const star = document.createElement('div');
             star.className = 'star';
             star.textContent = '✦';
@@ -686,16 +782,14 @@ class MoonVegetableGame {
         george.className = 'character';
         george.id = 'george';
         george.textContent = '👨‍🚀';
-        george.style.bottom = '120px';
-        george.style.left = '100px';
+        this.entities.add(george, 100, 120);
         this.gameArea.appendChild(george);
         
         const matilda = document.createElement('div');
         matilda.className = 'character';
         matilda.id = 'matilda';
         matilda.textContent = '👩‍🚀';
-        matilda.style.bottom = '120px';
-        matilda.style.left = '200px';
+        this.entities.add(matilda, 200, 120);
         this.gameArea.appendChild(matilda);
         
         this.george = george;
@@ -703,17 +797,13 @@ class MoonVegetableGame {
     }
     
     spaceFlightLoop() {
-        if (!this.gameRunning || this.gameState !== 'spaceFlight') return;
-        
-        this.updateSpaceFlight();
-        this.checkAsteroidCollisions();
-        
-        if (this.flightProgress >= 100) {
-            this.completeFlight();
-            return;
-        }
-        
-        requestAnimationFrame(() => this.spaceFlightLoop());
+        this.scheduler.run('spaceFlight', [
+            { name: 'flight', step: () => this.updateSpaceFlight() },
+            { name: 'asteroids', step: () => this.checkAsteroidCollisions() },
+            { name: 'landing', step: () => this.flightProgress >= 100 && this.completeFlight() },
+            this.spaceRenderSystem(),
+            this.qualitySystem()
+        ], () => this.gameRunning && this.gameState === 'spaceFlight');
     }
     
     updateSpaceFlight() {
@@ -729,63 +819,29 @@ class MoonVegetableGame {
         this.spaceshipX = startX + (endX - startX) * progress;
         this.spaceshipY = startY + (endY - startY) * progress;
         
-        const spaceship = document.getElementById('spaceship');
-        if (spaceship) {
-            spaceship.style.left = this.spaceshipX + 'px';
-            spaceship.style.top = this.spaceshipY + 'px';
-        }
-        
-        // Scroll stars
-        document.querySelectorAll('.space-star').forEach(star => {
-            let left = parseInt(star.style.left);
-            left -= 2;
-            if (left < -20) {
-                left = 820;
-                star.style.top = Math.random() * 600 + 'px';
-            }
-            star.style.left = left + 'px';
-        });
+        this.spaceRenderer.setShip(this.spaceshipX, this.spaceshipY);
+        this.spaceRenderer.scrollStars(2);
         
-        // Update progress display
-        this.startBtn.textContent = `Flying to Moon... ${Math.floor(this.flightProgress)}%`;
+        // Update progress display when the percentage changes
+        const label = `Flying to Moon... ${Math.floor(this.flightProgress)}%`;
+        if (this.startBtn.textContent !== label) {
+            this.startBtn.textContent = label;
+        }
     }
     
     spawnAsteroids() {
         if (!this.gameRunning || this.gameState !== 'spaceFlight') return;
         
-        const asteroid = document.createElement('div');
-        asteroid.className = 'asteroid';
-        asteroid.textContent = '☄️';
-        asteroid.style.right = '0px';
-        asteroid.style.top = Math.random() * 500 + 'px';
-        asteroid.style.fontSize = '30px';
-        this.gameArea.appendChild(asteroid);
-        this.asteroids.push(asteroid);
+        this.spaceRenderer.spawnAsteroid(Math.random() * 500);
         
-        setTimeout(() => this.spawnAsteroids(), Math.random() * 3000 + 2000);
+        this.scene.setTimeout(() => this.spawnAsteroids(), (Math.random() * 3000 + 2000) * this.quality.settings.spawnScale);
     }
     
     checkAsteroidCollisions() {
-        const spaceship = document.getElementById('spaceship');
-        if (!spaceship) return;
+        if (!this.spaceRenderer || !this.spaceRenderer.attached) return;
         
-        this.asteroids.forEach((asteroid, index) => {
-            if (!asteroid.parentNode) {
-                this.asteroids.splice(index, 1);
-                return;
-            }
-            
-            // Move asteroid left
-            let right = parseInt(asteroid.style.right) || 0;
-            right += 3;
-            asteroid.style.right = right + 'px';
-            
-            // Remove if off screen
-            if (right > 850) {
-                asteroid.remove();
-                this.asteroids.splice(index, 1);
-            }
-        });
+        // Move asteroids left; the renderer drops them once they're off screen
+        this.spaceRenderer.moveAsteroids(3);
     }
     
     completeFlight() {
@@ -793,12 +849,13 @@ class MoonVegetableGame {
         this.startBtn.textContent = 'Landed! Walk to Moon Dog\'s House';
         this.startBtn.disabled = false;
         this.gameState = 'readyForSurface';
+        this.drawSpaceScene('landed');
         this.speak('We have landed on the moon! Now let\'s walk to Moon Dog\'s house!', 'narrator');
     }
     
     initMoonSurface() {
         this.gameState = 'moonSurface';
-        this.gameArea.innerHTML = '';
+        this.enterScene('moonSurface');
         this.createMoonSurfaceScene();
         this.createCharactersOnSurface();
         this.createMoonDogHouse();
@@ -819,7 +876,7 @@ class MoonVegetableGame {
         this.gameArea.appendChild(surface);
         
         // Create stars
-        for (let i = 0; i < 30; i++) {
+        for (let i = 0; i < 30 * this.quality.settings.starScale; i++) {
             const star = document.createElement('div');
             star.className = 'star';
             star.textContent = '✦';
@@ -863,8 +920,7 @@ class MoonVegetableGame {
         george.className = 'character';
         george.id = 'george';
         george.textContent = '👨‍🚀';
-        george.style.bottom = '170px';
-        george.style.left = '100px';
+        this.entities.add(george, 100, 170);
         this.gameArea.appendChild(george);
         
         // Matilda
@@ -872,8 +928,7 @@ class MoonVegetableGame {
         matilda.className = 'character';
         matilda.id = 'matilda';
         matilda.textContent = '👩‍🚀';
-        matilda.style.bottom = '170px';
-        matilda.style.left = '150px';
+        this.entities.add(matilda, 150, 170);
         this.gameArea.appendChild(matilda);
         
         this.george = george;
@@ -907,36 +962,28 @@ class MoonVegetableGame {
         door.style.fontSize = '2em';
         door.style.zIndex = '10';
         this.gameArea.appendChild(door);
+        
+        this.zones.add('house', 650, 150, 100); // Right side - house size
     }
     
     surfaceLoop() {
-        if (!this.gameRunning || this.gameState !== 'moonSurface') return;
-        
-        this.checkHouseCollision();
-        this.smoothFollowUpdate();
-        requestAnimationFrame(() => this.surfaceLoop());
+        this.scheduler.run('moonSurface', [
+            { name: 'checkHouseCollision', frame: () => this.checkHouseCollision(), idle: () => true },
+            this.inputSystem(),
+            this.followSystem(),
+            this.entitySystem()
+        ], () => this.gameRunning && this.gameState === 'moonSurface');
     }
     
     checkHouseCollision() {
-        const george = this.george;
-        const matilda = this.matilda;
-        const house = document.getElementById('moon-dog-house');
-        
-        if (!george || !matilda || !house) return;
-        
-        const georgeLeft = parseInt(george.style.left) || 100;
-        const georgeBottom = parseInt(george.style.bottom) || 170;
-        const matildaLeft = parseInt(matilda.style.left) || 200;
-        const matildaBottom = parseInt(matilda.style.bottom) || 170;
+        const george = this.entities.get(this.george);
+        const matilda = this.entities.get(this.matilda);
         
-        const houseLeft = 650; // Right side - house size
-        const houseBottom = 150;
+        if (!george || !matilda) return;
         
         // Check if both characters are near the house
-        const georgeDistance = Math.sqrt(Math.pow(georgeLeft - houseLeft, 2) + Math.pow(georgeBottom - houseBottom, 2));
-        const matildaDistance = Math.sqrt(Math.pow(matildaLeft - houseLeft, 2) + Math.pow(matildaBottom - houseBottom, 2));
-        
-        if (georgeDistance < 100 && matildaDistance < 100) {
+        if (this.zones.contains('house', george.left, george.bottom) &&
+            this.zones.contains('house', matilda.left, matilda.bottom)) {
             this.enterHouse();
         }
     }
@@ -964,14 +1011,14 @@ class MoonVegetableGame {
         this.speak(enterText, 'narrator');
         this.gameArea.appendChild(enterMsg);
         
-        setTimeout(() => {
+        this.scene.setTimeout(() => {
             this.initMoonDogHouse();
         }, 2000);
     }
     
     initMoonDogHouse() {
         this.gameState = 'moonDogHouse';
-        this.gameArea.innerHTML = '';
+        this.enterScene('moonDogHouse');
         this.dialogueStep = 0;
         this.refrigeratorChecked = false;
         this.createHouseInterior();
@@ -1027,8 +1074,7 @@ class MoonVegetableGame {
         george.className = 'character';
         george.textContent = '👨‍🚀';
         george.style.position = 'absolute';
-        george.style.bottom = '120px';
-        george.style.left = '100px';
+        this.entities.add(george, 100, 120);
         george.style.fontSize = '3em';
         george.style.zIndex = '10';
         this.gameArea.appendChild(george);
@@ -1039,8 +1085,7 @@ class MoonVegetableGame {
         matilda.className = 'character';
         matilda.textContent = '👩‍🚀';
         matilda.style.position = 'absolute';
-        matilda.style.bottom = '120px';
-        matilda.style.left = '200px';
+        this.entities.add(matilda, 200, 120);
         matilda.style.fontSize = '3em';
         matilda.style.zIndex = '10';
         this.gameArea.appendChild(matilda);
@@ -1076,42 +1121,38 @@ class MoonVegetableGame {
         fridge.style.fontSize = '4em';
         fridge.style.zIndex = '10';
         this.gameArea.appendChild(fridge);
+        
+        this.zones.add('refrigerator', 600, 100, 80); // 800 - 200 (right position)
     }
     
     houseLoop() {
-        if (!this.gameRunning || this.gameState !== 'moonDogHouse') return;
-        
-        this.checkRefrigeratorCollision();
-        this.smoothFollowUpdate();
-        requestAnimationFrame(() => this.houseLoop());
+        this.scheduler.run('moonDogHouse', [
+            { name: 'checkRefrigeratorCollision', frame: () => this.checkRefrigeratorCollision(), idle: () => true },
+            this.inputSystem(),
+            this.followSystem(),
+            this.entitySystem()
+        ], () => this.gameRunning && this.gameState === 'moonDogHouse');
     }
     
     checkRefrigeratorCollision() {
         if (this.refrigeratorChecked) return;
         
-        const george = this.george;
-        const matilda = this.matilda;
-        
-        if (!george || !matilda) return;
-        
-        const georgeLeft = parseInt(george.style.left) || 100;
-        const georgeBottom = parseInt(george.style.bottom) || 120;
-        const matildaLeft = parseInt(matilda.style.left) || 200;
-        const matildaBottom = parseInt(matilda.style.bottom) || 120;
-        
-        const fridgeRight = 200;
-        const fridgeLeft = 600; // 800 - 200 (right position)
-        const fridgeBottom = 100;
-        
-        // Check if either character is near the refrigerator
-        const georgeDistance = Math.sqrt(Math.pow(georgeLeft - fridgeLeft, 2) + Math.pow(georgeBottom - fridgeBottom, 2));
-        const matildaDistance = Math.sqrt(Math.pow(matildaLeft - fridgeLeft, 2) + Math.pow(matildaBottom - fridgeBottom, 2));
-        
-        if (georgeDistance < 80 || matildaDistance < 80) {
+        if (this.characterNear('refrigerator')) {
             this.openRefrigerator();
         }
     }
     
+    // Is either character inside the named furniture zone?
+    characterNear(zone) {
+        const george = this.entities.get(this.george);
+        const matilda = this.entities.get(this.matilda);
+        
+        if (!george || !matilda) return false;
+        
+        return this.zones.contains(zone, george.left, george.bottom) ||
+            this.zones.contains(zone, matilda.left, matilda.bottom);
+    }
+    
     startDialogue() {
         this.createDialogueBox();
         this.showNextDialogue();
@@ -1134,7 +1175,7 @@ class MoonVegetableGame {
         dialogueBox.style.textAlign = 'center';
         dialogueBox.style.zIndex = '20';
         dialogueBox.style.cursor = 'pointer';
-        dialogueBox.addEventListener('click', () => this.showNextDialogue());
+        this.scene.listen(dialogueBox, 'click', () => this.showNextDialogue());
         this.gameArea.appendChild(dialogueBox);
     }
     
@@ -1152,13 +1193,14 @@ class MoonVegetableGame {
         if (this.dialogueStep < dialogues.length) {
             const dialogue = dialogues[this.dialogueStep];
             dialogueBox.textContent = dialogue.text;
+            this.prefetchDialogue(dialogues.slice(this.dialogueStep + 1));
             
             // Wait for speech to complete before moving to next dialogue
             await this.speak(dialogue.text, dialogue.character);
             this.dialogueStep++;
             
             // Automatically continue to next dialogue after speech completes
-            setTimeout(() => {
+            this.scene.setTimeout(() => {
                 if (this.dialogueStep < dialogues.length) {
                     this.showNextDialogue();
                 } else {
@@ -1170,11 +1212,10 @@ class MoonVegetableGame {
     
     async showFinalDialogue() {
         const dialogueBox = document.getElementById('dialogue-box');
-        const finalText = "Walk close to the refrigerator 🧊 to see what's inside!";
-        dialogueBox.textContent = finalText;
+        // Matilda has just said this; the hint stays on screen, unvoiced
+        dialogueBox.textContent = "Walk close to the refrigerator 🧊 to see what's inside!";
         dialogueBox.style.background = 'rgba(255,215,0,0.8)';
         dialogueBox.style.color = 'black';
-        await this.speak(finalText, 'narrator');
     }
     
     async openRefrigerator() {
@@ -1195,21 +1236,17 @@ class MoonVegetableGame {
         dialogueBox.textContent = emptyText;
         dialogueBox.style.background = 'rgba(255,0,0,0.8)';
         dialogueBox.style.color = 'white';
-        await this.speak(emptyText, 'narrator');
-        
-        await new Promise(resolve => setTimeout(resolve, 1000)); // Pause
+        await this.speak(emptyText, 'narrator').then(lineMs => this.pauseAfterLine(1000, lineMs));
         
         const moondogText = "🐕‍🦺 Moon Dog: I'm so sorry! I haven't been to the garden in days...";
         dialogueBox.textContent = moondogText;
-        await this.speak(moondogText, 'moondog');
-        
-        await new Promise(resolve => setTimeout(resolve, 1000)); // Pause
+        await this.speak(moondogText, 'moondog').then(lineMs => this.pauseAfterLine(1000, lineMs));
         
         const matildaText = "👩‍🚀 Matilda: Don't worry! Let's go to your vegetable garden and pick some fresh food!";
         dialogueBox.textContent = matildaText;
         await this.speak(matildaText, 'matilda');
         
-        await new Promise(resolve => setTimeout(resolve, 500)); // Brief pause
+        await this.scene.delay(500); // Brief pause
         
         const georgeText = "👨‍🚀 George: Great idea! Let's help our friend Moon Dog!";
         dialogueBox.textContent = georgeText;
@@ -1223,78 +1260,66 @@ class MoonVegetableGame {
     }
     
     gameLoop() {
-        if (!this.gameRunning) return;
-        
-        this.checkCollisions();
-        this.smoothFollowUpdate();
-        requestAnimationFrame(() => this.gameLoop());
+        this.scheduler.run('vegetableGarden', [
+            { name: 'checkCollisions', frame: () => this.checkCollisions(), idle: () => true },
+            this.inputSystem(),
+            this.followSystem(),
+            this.entitySystem(),
+            this.qualitySystem()
+        ], () => this.gameRunning);
     }
     
     checkCollisions() {
         const currentCharacter = this.currentPlayer === 'george' ? this.george : this.matilda;
-        const charLeft = parseInt(currentCharacter.style.left) || 100;
-        const charBottom = parseInt(currentCharacter.style.bottom) || 120;
+        const { left: charLeft, bottom: charBottom } = this.entities.get(currentCharacter);
         
-        this.vegetableElements.forEach((vegetable, index) => {
-            if (!vegetable.parentNode) return;
-            
-            const vegLeft = parseInt(vegetable.style.left);
-            const vegBottom = parseInt(vegetable.style.bottom);
-            
-            const distance = Math.sqrt(
-                Math.pow(charLeft - vegLeft, 2) + 
-                Math.pow(charBottom - vegBottom, 2)
-            );
-            
-            if (distance < 50) {
-                this.collectVegetable(vegetable);
-                this.vegetableElements.splice(index, 1);
-            }
+        // Collect after the query, so removing from the grid can't skip any
+        const reached = this.vegetableGrid.query(charLeft, charBottom, 50);
+        reached.forEach(vegetable => {
+            this.vegetableGrid.remove(vegetable);
+            this.collectVegetable(vegetable);
         });
     }
     
     spawnVegetables() {
         if (!this.gameRunning) return;
         
-        const vegetable = document.createElement('div');
-        vegetable.className = 'vegetable';
+        // Fewer vegetables, further apart, on a phone that has stepped down
+        const { spawnScale } = this.quality.settings;
+        this.scene.setTimeout(() => this.spawnVegetables(), (Math.random() * 2000 + 1500) * spawnScale);
+        if (this.vegetableExpiry.size >= Math.floor(this.maxGardenVegetables / spawnScale)) return;
+        
+        const vegetable = this.pools.vegetable.acquire();
         vegetable.textContent = this.vegetables[Math.floor(Math.random() * this.vegetables.length)];
         
         // Position vegetables on the ground (moon surface)
-        vegetable.style.left = Math.random() * 700 + 'px';
-        vegetable.style.bottom = '120px'; // Right on the moon surface
+        const { left, bottom } = this.entities.add(vegetable, Math.random() * 700, 120); // Right on the moon surface
         
         this.gameArea.appendChild(vegetable);
-        this.vegetableElements.push(vegetable);
+        this.vegetableGrid.insert(vegetable, left, bottom);
         
         // Remove vegetable after 8 seconds if not collected
-        setTimeout(() => {
-            if (vegetable.parentNode) {
-                vegetable.remove();
-                const index = this.vegetableElements.indexOf(vegetable);
-                if (index > -1) {
-                    this.vegetableElements.splice(index, 1);
-                }
-            }
-        }, 8000);
-        
-        // Spawn next vegetable
-        setTimeout(() => this.spawnVegetables(), Math.random() * 2000 + 1500);
+        this.vegetableExpiry.set(vegetable, this.scene.setTimeout(() => {
+            this.vegetableExpiry.delete(vegetable);
+            this.entities.delete(vegetable);
+            this.vegetableGrid.remove(vegetable);
+            this.pools.vegetable.release(vegetable);
+        }, 8000));
     }
     
     collectVegetable(vegetable) {
         vegetable.classList.add('collected');
+        this.entities.delete(vegetable);
+        // The node goes back to the pool; its expiry mustn't remove it once reused
+        this.scene.clearTimeout(this.vegetableExpiry.get(vegetable));
+        this.vegetableExpiry.delete(vegetable);
         this.playPickupSound();
         
         // Add to inventory
         this.collectedVegetables.push(vegetable.textContent);
         this.updateInventoryDisplay();
         
-        setTimeout(() => {
-            if (vegetable.parentNode) {
-                vegetable.remove();
-            }
-        }, 500);
+        this.scene.setTimeout(() => this.pools.vegetable.release(vegetable), 500);
         
         // Check if enough vegetables collected
         if (this.collectedVegetables.length >= this.vegetablesNeeded) {
@@ -1303,69 +1328,64 @@ class MoonVegetableGame {
     }
     
     handleKeyPress(e) {
+        // Arrow keys only mark a direction as held (repeats change nothing)
+        const direction = this.input.directionFor(e.key);
+        if (direction) {
+            this.input.press(direction);
+        }
+        
         if (!this.gameRunning) {
-            console.log('Key press ignored - game not running. Game state:', this.gameState);
+            log.debug('Key press ignored - game not running. Game state:', this.gameState);
             return;
         }
         
         if (this.gameState === 'spaceFlight') {
             this.handleSpaceFlightControls(e);
-        } else if (this.gameState === 'moonSurface' || this.gameState === 'moonDogHouse' || this.gameState === 'moonDogHouseWithFood') {
-            this.handleWalkingControls(e);
-        } else if (this.gameState === 'vegetableGarden') {
-            this.handleGardenControls(e);
-        } else if (this.gameState === 'cookingGame') {
-            this.handleCookingControls(e);
+        } else if (e.key === ' ' && this.movementArea()) {
+            e.preventDefault();
+            this.switchCharacter();
         }
     }
     
-    handleWalkingControls(e) {
-        const currentCharacter = this.currentPlayer === 'george' ? this.george : this.matilda;
-        if (!currentCharacter) return;
-        
-        // Store previous position for following
-        const prevLeft = parseInt(currentCharacter.style.left) || 100;
-        const prevBottom = parseInt(currentCharacter.style.bottom) || 170;
-        
-        let newLeft = prevLeft;
-        let newBottom = prevBottom;
-        
-        const moveSpeed = 15;
-        
-        switch(e.key) {
-            case 'ArrowLeft':
-                newLeft = Math.max(20, newLeft - moveSpeed);
-                break;
-            case 'ArrowRight':
-                newLeft = Math.min(750, newLeft + moveSpeed);
-                break;
-            case 'ArrowUp':
-                if (this.gameState === 'moonSurface') {
-                    newBottom = Math.min(400, newBottom + moveSpeed);
-                } else {
-                    newBottom = Math.min(450, newBottom + moveSpeed);
-                }
-                break;
-            case 'ArrowDown':
-                if (this.gameState === 'moonSurface') {
-                    newBottom = Math.max(170, newBottom - moveSpeed);
-                } else {
-                    newBottom = Math.max(120, newBottom - moveSpeed);
-                }
-                break;
-            case ' ':
-                e.preventDefault();
-                this.switchCharacter();
-                return; // Don't add to follow queue for character switch
+    handleKeyRelease(e) {
+        const direction = this.input.directionFor(e.key);
+        if (direction) {
+            this.input.release(direction);
         }
-        
-        // Only move and add to follow queue if position actually changed
-        if (newLeft !== prevLeft || newBottom !== prevBottom) {
-            currentCharacter.style.left = newLeft + 'px';
-            currentCharacter.style.bottom = newBottom + 'px';
-            
-            // Add previous position to follow queue
-            this.addToFollowQueue(prevLeft, prevBottom);
+    }
+    
+    // Where the player can walk in the current scene, and how fast (px/s)
+    movementArea() {
+        switch (this.gameState) {
+            case 'moonSurface':
+                return { minLeft: 20, maxLeft: 750, minBottom: 170, maxBottom: 400, speed: 240 };
+            case 'moonDogHouse':
+            case 'moonDogHouseWithFood':
+                return { minLeft: 20, maxLeft: 750, minBottom: 120, maxBottom: 450, speed: 240 };
+            case 'vegetableGarden':
+                return { minLeft: 0, maxLeft: 750, minBottom: 120, maxBottom: 550, speed: 320 };
+            case 'cookingGame':
+                return { minLeft: 0, maxLeft: 750, minBottom: 120, maxBottom: 450, speed: 400 };
+            default:
+                return null;
+        }
+    }
+    
+    moveWithInput(seconds) {
+        const area = this.movementArea();
+        const currentCharacter = this.currentPlayer === 'george' ? this.george : this.matilda;
+        const position = this.entities.get(currentCharacter);
+        if (!area || !position || !this.input.moving) return;
+        
+        const { dx, dy } = this.input.update(seconds, area.speed);
+        const newLeft = Math.min(area.maxLeft, Math.max(area.minLeft, position.left + dx));
+        const newBottom = Math.min(area.maxBottom, Math.max(area.minBottom, position.bottom + dy));
+        this.entities.move(currentCharacter, newLeft, newBottom);
+        
+        // Leave a trail for the follower, a point every followStep px
+        const last = this.followQueue[this.followQueue.length - 1];
+        if (!last || !withinRadius(newLeft, newBottom, last.left, last.bottom, this.followStep)) {
+            this.addToFollowQueue(newLeft, newBottom);
             this.updateFollower();
         }
     }
@@ -1383,21 +1403,14 @@ class MoonVegetableGame {
         const follower = this.currentPlayer === 'george' ? this.matilda : this.george;
         if (!follower || this.followQueue.length === 0) return;
         
-        const followerLeft = parseInt(follower.style.left) || 200;
-        const followerBottom = parseInt(follower.style.bottom) || 170;
+        const { left: followerLeft, bottom: followerBottom } = this.entities.get(follower);
         
         // Get target position from queue (a few steps behind)
         const targetIndex = Math.max(0, this.followQueue.length - 3);
         const target = this.followQueue[targetIndex];
         
-        // Calculate distance to target
-        const distance = Math.sqrt(
-            Math.pow(followerLeft - target.left, 2) + 
-            Math.pow(followerBottom - target.bottom, 2)
-        );
-        
         // Only move if distance is significant enough
-        if (distance > this.maxFollowDistance) {
+        if (!withinRadius(followerLeft, followerBottom, target.left, target.bottom, this.maxFollowDistance)) {
             // Move follower towards target position
             const moveX = (target.left - followerLeft) * 0.3;
             const moveY = (target.bottom - followerBottom) * 0.3;
@@ -1405,45 +1418,35 @@ class MoonVegetableGame {
             const newFollowerLeft = Math.round(followerLeft + moveX);
             const newFollowerBottom = Math.round(followerBottom + moveY);
             
-            follower.style.left = newFollowerLeft + 'px';
-            follower.style.bottom = newFollowerBottom + 'px';
+            this.entities.move(follower, newFollowerLeft, newFollowerBottom);
         }
     }
     
     smoothFollowUpdate() {
-        // Continuous smooth following update for animation frames
+        // Continuous smooth following, one fixed step of the game clock
         const follower = this.currentPlayer === 'george' ? this.matilda : this.george;
         if (!follower || this.followQueue.length === 0) return;
         
-        const followerLeft = parseInt(follower.style.left) || 200;
-        const followerBottom = parseInt(follower.style.bottom) || 170;
+        const { left: followerLeft, bottom: followerBottom } = this.entities.get(follower);
         
         // Get target position from queue (a few steps behind)
         const targetIndex = Math.max(0, this.followQueue.length - 2);
         const target = this.followQueue[targetIndex];
         
-        // Calculate distance to target
-        const distance = Math.sqrt(
-            Math.pow(followerLeft - target.left, 2) + 
-            Math.pow(followerBottom - target.bottom, 2)
-        );
-        
         // Smooth following with smaller increments for animation
-        if (distance > 30) {
+        if (!withinRadius(followerLeft, followerBottom, target.left, target.bottom, 30)) {
             const moveX = (target.left - followerLeft) * 0.08;
             const moveY = (target.bottom - followerBottom) * 0.08;
             
             const newFollowerLeft = Math.round(followerLeft + moveX);
             const newFollowerBottom = Math.round(followerBottom + moveY);
             
-            follower.style.left = newFollowerLeft + 'px';
-            follower.style.bottom = newFollowerBottom + 'px';
+            this.entities.move(follower, newFollowerLeft, newFollowerBottom);
         }
     }
     
     handleSpaceFlightControls(e) {
-        const spaceship = document.getElementById('spaceship');
-        if (!spaceship) return;
+        if (!this.spaceRenderer || !this.spaceRenderer.attached) return;
         
         const moveSpeed = 15;
         
@@ -1462,43 +1465,7 @@ class MoonVegetableGame {
                 break;
         }
         
-        spaceship.style.left = this.spaceshipX + 'px';
-        spaceship.style.top = this.spaceshipY + 'px';
-    }
-    
-    handleGardenControls(e) {
-        const currentCharacter = this.currentPlayer === 'george' ? this.george : this.matilda;
-        if (!currentCharacter) return;
-        
-        const rect = currentCharacter.getBoundingClientRect();
-        const gameRect = this.gameArea.getBoundingClientRect();
-        
-        let newLeft = parseInt(currentCharacter.style.left) || 100;
-        let newBottom = parseInt(currentCharacter.style.bottom) || 120;
-        
-        const moveSpeed = 20;
-        
-        switch(e.key) {
-            case 'ArrowLeft':
-                newLeft = Math.max(0, newLeft - moveSpeed);
-                break;
-            case 'ArrowRight':
-                newLeft = Math.min(750, newLeft + moveSpeed);
-                break;
-            case 'ArrowUp':
-                newBottom = Math.min(550, newBottom + moveSpeed);
-                break;
-            case 'ArrowDown':
-                newBottom = Math.max(120, newBottom - moveSpeed);
-                break;
-            case ' ':
-                e.preventDefault();
-                this.switchCharacter();
-                break;
-        }
-        
-        currentCharacter.style.left = newLeft + 'px';
-        currentCharacter.style.bottom = newBottom + 'px';
+        this.spaceRenderer.setShip(this.spaceshipX, this.spaceshipY);
     }
     
     switchCharacter() {
@@ -1508,6 +1475,7 @@ class MoonVegetableGame {
         
         // Switch character
         this.currentPlayer = this.currentPlayer === 'george' ? 'matilda' : 'george';
+        this.input.stop();
         
         // Highlight new character
         const newCurrent = this.currentPlayer === 'george' ? this.george : this.matilda;
@@ -1582,7 +1550,7 @@ class MoonVegetableGame {
         this.startBtn.disabled = false;
         this.gameState = 'readyToReturn';
         
-        setTimeout(() => {
+        this.scene.setTimeout(() => {
             if (returnMsg.parentNode) {
                 returnMsg.remove();
             }
@@ -1597,7 +1565,7 @@ class MoonVegetableGame {
     
     returnToHouseWithVegetables() {
         this.gameState = 'moonDogHouseWithFood';
-        this.gameArea.innerHTML = '';
+        this.enterScene('moonDogHouseWithFood');
         this.createHouseInterior();
         this.createCharactersInHouse();
         this.createMoonDog();
@@ -1622,6 +1590,7 @@ class MoonVegetableGame {
         fridge.style.padding = '10px';
         fridge.style.cursor = 'pointer';
         this.gameArea.appendChild(fridge);
+        this.zones.add('refrigerator', 600, 100, 80);
         
         // Show vegetables around the fridge
         this.collectedVegetables.forEach((vegetable, index) => {
@@ -1639,34 +1608,18 @@ class MoonVegetableGame {
     }
     
     returnHouseLoop() {
-        if (!this.gameRunning || this.gameState !== 'moonDogHouseWithFood') return;
-        
-        this.checkFilledRefrigeratorCollision();
-        this.smoothFollowUpdate();
-        requestAnimationFrame(() => this.returnHouseLoop());
+        this.scheduler.run('moonDogHouseWithFood', [
+            { name: 'checkFilledRefrigeratorCollision', frame: () => this.checkFilledRefrigeratorCollision(), idle: () => true },
+            this.inputSystem(),
+            this.followSystem(),
+            this.entitySystem()
+        ], () => this.gameRunning && this.gameState === 'moonDogHouseWithFood');
     }
     
     checkFilledRefrigeratorCollision() {
         if (this.cookingStarted) return;
         
-        const george = this.george;
-        const matilda = this.matilda;
-        
-        if (!george || !matilda) return;
-        
-        const georgeLeft = parseInt(george.style.left) || 100;
-        const georgeBottom = parseInt(george.style.bottom) || 120;
-        const matildaLeft = parseInt(matilda.style.left) || 200;
-        const matildaBottom = parseInt(matilda.style.bottom) || 120;
-        
-        const fridgeRight = 200;
-        const fridgeLeft = 600;
-        const fridgeBottom = 100;
-        
-        const georgeDistance = Math.sqrt(Math.pow(georgeLeft - fridgeLeft, 2) + Math.pow(georgeBottom - fridgeBottom, 2));
-        const matildaDistance = Math.sqrt(Math.pow(matildaLeft - fridgeLeft, 2) + Math.pow(matildaBottom - fridgeBottom, 2));
-        
-        if (georgeDistance < 80 || matildaDistance < 80) {
+        if (this.characterNear('refrigerator')) {
             this.startCooking();
         }
     }
@@ -1690,13 +1643,14 @@ class MoonVegetableGame {
         if (this.returnDialogueStep < dialogues.length) {
             const dialogue = dialogues[this.returnDialogueStep];
             dialogueBox.textContent = dialogue.text;
+            this.prefetchDialogue(dialogues.slice(this.returnDialogueStep + 1));
             
             // Wait for speech to complete before moving to next dialogue
             await this.speak(dialogue.text, dialogue.character);
             this.returnDialogueStep++;
             
             // Brief pause between dialogues, then continue
-            await new Promise(resolve => setTimeout(resolve, 500));
+            await this.scene.delay(500);
             
             if (this.returnDialogueStep < dialogues.length) {
                 this.showReturnDialogue();
@@ -1708,11 +1662,10 @@ class MoonVegetableGame {
     
     async showReturnFinalDialogue() {
         const dialogueBox = document.getElementById('dialogue-box');
-        const finalText = "Walk close to the refrigerator 😋 to put the vegetables inside and start cooking!";
-        dialogueBox.textContent = finalText;
+        // Matilda has just said this; the hint stays on screen, unvoiced
+        dialogueBox.textContent = "Walk close to the refrigerator 😋 to put the vegetables inside and start cooking!";
         dialogueBox.style.background = 'rgba(255,215,0,0.8)';
         dialogueBox.style.color = 'black';
-        await this.speak(finalText, 'narrator');
     }
     
     async startCooking() {
@@ -1722,9 +1675,9 @@ class MoonVegetableGame {
         
         // Clear any existing game timer from vegetable collection
         if (this.gameTimer) {
-            clearTimeout(this.gameTimer);
+            this.scene.clearTimeout(this.gameTimer);
             this.gameTimer = null;
-            console.log('Cleared vegetable game timer');
+            log.debug('Cleared vegetable game timer');
         }
         
         // Create or update dialogue box
@@ -1745,7 +1698,7 @@ class MoonVegetableGame {
             await this.speak(cookingText, 'narrator');
             this.initCookingKitchen();
         } catch (error) {
-            console.error('Error in startCooking:', error);
+            log.error('Error in startCooking:', error);
             // Fallback: continue to cooking kitchen even if speech fails
             this.initCookingKitchen();
         }
@@ -1753,10 +1706,10 @@ class MoonVegetableGame {
     
     initCookingKitchen() {
         try {
-            console.log('Initializing cooking kitchen...');
+            log.debug('Initializing cooking kitchen...');
             this.gameState = 'cookingGame';
             this.currentCookingStep = 'washing';
-            this.gameArea.innerHTML = '';
+            this.enterScene('cookingKitchen');
             
             // Create kitchen background
             this.createHouseInterior();
@@ -1779,11 +1732,11 @@ class MoonVegetableGame {
             // Ensure game is running
             this.gameRunning = true;
             
-            console.log('Cooking kitchen initialized, starting game loop...');
+            log.debug('Cooking kitchen initialized, starting game loop...');
             
             // Start the cooking game loop
-            setTimeout(() => {
-                console.log('Starting cooking game loop with characters:', this.george, this.matilda);
+            this.scene.setTimeout(() => {
+                log.debug('Starting cooking game loop with characters:', this.george, this.matilda);
                 this.cookingGameLoop();
             }, 100);
             
@@ -1792,7 +1745,7 @@ class MoonVegetableGame {
             this.startBtn.disabled = true;
             
         } catch (error) {
-            console.error('Error initializing cooking kitchen:', error);
+            log.error('Error initializing cooking kitchen:', error);
             // Fallback to simple message
             this.gameArea.innerHTML = '<div style="position: absolute; top: 50%; left: 50%; transform: translate(-50%, -50%); color: white; font-size: 2em; text-align: center;">Cooking time! Use arrow keys to move around the kitchen!</div>';
             this.gameRunning = true;
@@ -1814,6 +1767,7 @@ class MoonVegetableGame {
         sink.style.padding = '10px';
         sink.style.zIndex = '5';
         this.gameArea.appendChild(sink);
+        this.zones.add('sink', 100, 600 - 200, 80); // top: 200px
     }
     
     createChoppingBoard() {
@@ -1830,6 +1784,7 @@ class MoonVegetableGame {
         board.style.zIndex = '5';
         board.style.opacity = '0.5'; // Initially disabled
         this.gameArea.appendChild(board);
+        this.zones.add('choppingBoard', 300, 600 - 200, 80); // top: 200px
     }
     
     createPlate() {
@@ -1846,6 +1801,7 @@ class MoonVegetableGame {
         plate.style.zIndex = '5';
         plate.style.opacity = '0.5'; // Initially disabled
         this.gameArea.appendChild(plate);
+        this.zones.add('plate', 500, 600 - 200, 80); // top: 200px
     }
     
     createTable() {
@@ -1862,6 +1818,7 @@ class MoonVegetableGame {
         table.style.zIndex = '5';
         table.style.opacity = '0.5'; // Initially disabled
         this.gameArea.appendChild(table);
+        this.zones.add('table', 350, 50, 100);
     }
     
     createCookingCharacters() {
@@ -1871,8 +1828,7 @@ class MoonVegetableGame {
         george.className = 'character';
         george.textContent = '👨‍🍳';
         george.style.position = 'absolute';
-        george.style.bottom = '120px';
-        george.style.left = '200px';
+        this.entities.add(george, 200, 120);
         george.style.fontSize = '3em';
         george.style.zIndex = '10';
         this.gameArea.appendChild(george);
@@ -1883,8 +1839,7 @@ class MoonVegetableGame {
         matilda.className = 'character';
         matilda.textContent = '👩‍🍳';
         matilda.style.position = 'absolute';
-        matilda.style.bottom = '120px';
-        matilda.style.left = '400px';
+        this.entities.add(matilda, 400, 120);
         matilda.style.fontSize = '3em';
         matilda.style.zIndex = '10';
         this.gameArea.appendChild(matilda);
@@ -1907,7 +1862,7 @@ class MoonVegetableGame {
         this.followQueue = [];
         george.style.boxShadow = '0 0 20px #ffff00';
         
-        console.log('Cooking characters created:', {
+        log.debug('Cooking characters created:', {
             george: this.george,
             matilda: this.matilda,
             currentPlayer: this.currentPlayer
@@ -1951,17 +1906,17 @@ class MoonVegetableGame {
     }
     
     cookingGameLoop() {
-        if (!this.gameRunning || this.gameState !== 'cookingGame') return;
-        
-        this.checkCookingInteractions();
-        this.smoothFollowUpdate();
-        requestAnimationFrame(() => this.cookingGameLoop());
+        this.scheduler.run('cookingGame', [
+            { name: 'checkCookingInteractions', frame: () => this.checkCookingInteractions(), idle: () => true },
+            this.inputSystem(),
+            this.followSystem(),
+            this.entitySystem()
+        ], () => this.gameRunning && this.gameState === 'cookingGame');
     }
     
     checkCookingInteractions() {
         const currentCharacter = this.currentPlayer === 'george' ? this.george : this.matilda;
-        const charLeft = parseInt(currentCharacter.style.left) || 100;
-        const charBottom = parseInt(currentCharacter.style.bottom) || 120;
+        const { left: charLeft, bottom: charBottom } = this.entities.get(currentCharacter);
         
         if (this.currentCookingStep === 'washing') {
             this.checkSinkInteraction(charLeft, charBottom);
@@ -1975,41 +1930,25 @@ class MoonVegetableGame {
     }
     
     checkSinkInteraction(charLeft, charBottom) {
-        const sinkLeft = 100;
-        const sinkTop = 200;
-        const distance = Math.sqrt(Math.pow(charLeft - sinkLeft, 2) + Math.pow(charBottom - (600 - sinkTop), 2));
-        
-        if (distance < 80 && this.cleanedVegetables.length < this.collectedVegetables.length) {
+        if (this.zones.contains('sink', charLeft, charBottom) && this.cleanedVegetables.length < this.collectedVegetables.length) {
             this.washVegetable();
         }
     }
     
     checkChoppingInteraction(charLeft, charBottom) {
-        const boardLeft = 300;
-        const boardTop = 200;
-        const distance = Math.sqrt(Math.pow(charLeft - boardLeft, 2) + Math.pow(charBottom - (600 - boardTop), 2));
-        
-        if (distance < 80 && this.choppedVegetables.length < this.cleanedVegetables.length) {
+        if (this.zones.contains('choppingBoard', charLeft, charBottom) && this.choppedVegetables.length < this.cleanedVegetables.length) {
             this.chopVegetable();
         }
     }
     
     checkPlatingInteraction(charLeft, charBottom) {
-        const plateLeft = 500;
-        const plateTop = 200;
-        const distance = Math.sqrt(Math.pow(charLeft - plateLeft, 2) + Math.pow(charBottom - (600 - plateTop), 2));
-        
-        if (distance < 80 && !this.platedFood && this.choppedVegetables.length === this.collectedVegetables.length) {
+        if (this.zones.contains('plate', charLeft, charBottom) && !this.platedFood && this.choppedVegetables.length === this.collectedVegetables.length) {
             this.plateFood();
         }
     }
     
     checkTableInteraction(charLeft, charBottom) {
-        const tableLeft = 350;
-        const tableBottom = 50;
-        const distance = Math.sqrt(Math.pow(charLeft - tableLeft, 2) + Math.pow(charBottom - tableBottom, 2));
-        
-        if (distance < 100 && this.platedFood) {
+        if (this.zones.contains('table', charLeft, charBottom) && this.platedFood) {
             this.startEating();
         }
     }
@@ -2028,9 +1967,9 @@ class MoonVegetableGame {
         }
         
         // Create clean vegetable near sink
-        const cleanVeg = document.createElement('div');
+        const cleanVeg = this.pools.cleanVegetable.acquire();
+        this.cleanVegetableNodes[vegetableIndex] = cleanVeg;
         cleanVeg.textContent = vegetable;
-        cleanVeg.className = 'clean-vegetable';
         cleanVeg.style.position = 'absolute';
         cleanVeg.style.top = '350px';
         cleanVeg.style.left = (200 + vegetableIndex * 40) + 'px';
@@ -2058,16 +1997,15 @@ class MoonVegetableGame {
         this.choppedVegetables.push(vegetable);
         
         // Remove clean vegetable and create chopped pieces
-        const cleanVegs = document.querySelectorAll('.clean-vegetable');
-        if (cleanVegs[vegetableIndex]) {
-            cleanVegs[vegetableIndex].remove();
+        const cleanVeg = this.cleanVegetableNodes[vegetableIndex];
+        if (cleanVeg) {
+            this.pools.cleanVegetable.release(cleanVeg);
         }
         
         // Create chopped vegetable pieces
         for (let i = 0; i < 3; i++) {
-            const choppedPiece = document.createElement('div');
+            const choppedPiece = this.pools.choppedVegetable.acquire();
             choppedPiece.textContent = '🔸'; // Small pieces
-            choppedPiece.className = 'chopped-vegetable';
             choppedPiece.style.position = 'absolute';
             choppedPiece.style.top = '350px';
             choppedPiece.style.left = (400 + vegetableIndex * 60 + i * 15) + 'px';
@@ -2093,7 +2031,7 @@ class MoonVegetableGame {
         this.platedFood = true;
         
         // Remove all chopped pieces and create plated food
-        document.querySelectorAll('.chopped-vegetable').forEach(piece => piece.remove());
+        this.pools.choppedVegetable.releaseAll();
         
         const platedMeal = document.createElement('div');
         platedMeal.textContent = '🍽️🥗';
@@ -2138,14 +2076,13 @@ class MoonVegetableGame {
         await this.speak('What a delicious meal! Everyone is eating together!', 'narrator');
         
         // Move characters to table
-        this.george.style.left = '200px';
-        this.george.style.bottom = '150px';
-        this.matilda.style.left = '350px';
-        this.matilda.style.bottom = '150px';
+        this.entities.move(this.george, 200, 150);
+        this.entities.move(this.matilda, 350, 150);
+        this.entities.flush();
         document.getElementById('moon-dog').style.left = '500px';
         document.getElementById('moon-dog').style.bottom = '150px';
         
-        await new Promise(resolve => setTimeout(resolve, 2000));
+        await this.scene.delay(2000);
         
         await this.speak('🐕‍🦺 Moon Dog: This is the most delicious meal I\'ve ever had! Thank you both!', 'moondog');
         await this.speak('👨‍🍳 George: We\'re so happy to cook for you, Moon Dog!', 'george');
@@ -2157,7 +2094,7 @@ class MoonVegetableGame {
     async startSleeping() {
         await this.speak('After the wonderful dinner, everyone is getting sleepy...', 'narrator');
         
-        this.gameArea.innerHTML = '';
+        this.enterScene('bedroom');
         this.createBedroom();
         
         await this.speak('Good night! Everyone is sleeping peacefully...', 'narrator');
@@ -2213,7 +2150,7 @@ class MoonVegetableGame {
     }
     
     async showSleepingScene() {
-        await new Promise(resolve => setTimeout(resolve, 3000));
+        await this.scene.delay(3000);
         
         await this.speak('The next morning...', 'narrator');
         this.startThreeDayStay();
@@ -2227,7 +2164,7 @@ class MoonVegetableGame {
     }
     
     async showInteractiveDay() {
-        this.gameArea.innerHTML = '';
+        this.enterScene('interactiveDay');
         this.createHouseInterior();
         this.createInteractiveCharacters();
         
@@ -2314,15 +2251,15 @@ class MoonVegetableGame {
             button.style.fontWeight = 'bold';
             button.style.transition = 'transform 0.2s';
             
-            button.addEventListener('mouseover', () => {
+            this.scene.listen(button, 'mouseover', () => {
                 button.style.transform = 'scale(1.05)';
             });
             
-            button.addEventListener('mouseout', () => {
+            this.scene.listen(button, 'mouseout', () => {
                 button.style.transform = 'scale(1)';
             });
             
-            button.addEventListener('click', () => {
+            this.scene.listen(button, 'click', () => {
                 this.selectActivity(activity);
             });
             
@@ -2370,50 +2307,6 @@ class MoonVegetableGame {
         }
     }
     
-    handleCookingControls(e) {
-        console.log('Cooking controls - Key pressed:', e.key, 'Game state:', this.gameState, 'Game running:', this.gameRunning);
-        
-        const currentCharacter = this.currentPlayer === 'george' ? this.george : this.matilda;
-        if (!currentCharacter) {
-            console.log('No current character found!', this.currentPlayer, this.george, this.matilda);
-            return;
-        }
-        
-        let newLeft = parseInt(currentCharacter.style.left) || 100;
-        let newBottom = parseInt(currentCharacter.style.bottom) || 120;
-        
-        console.log('Current character position:', newLeft, newBottom);
-        
-        const moveSpeed = 40; // Increased from 20 to make movement more visible
-        
-        switch(e.key) {
-            case 'ArrowLeft':
-                newLeft = Math.max(0, newLeft - moveSpeed);
-                break;
-            case 'ArrowRight':
-                newLeft = Math.min(750, newLeft + moveSpeed);
-                break;
-            case 'ArrowUp':
-                newBottom = Math.min(450, newBottom + moveSpeed);
-                break;
-            case 'ArrowDown':
-                newBottom = Math.max(120, newBottom - moveSpeed);
-                break;
-            case ' ':
-                e.preventDefault();
-                this.switchCharacter();
-                break;
-        }
-        
-        currentCharacter.style.left = newLeft + 'px';
-        currentCharacter.style.bottom = newBottom + 'px';
-        
-        console.log('Character moved to:', newLeft, newBottom);
-        
-        // Add to follow queue for the other character
-        this.addToFollowQueue(parseInt(currentCharacter.style.left), parseInt(currentCharacter.style.bottom));
-    }
-    
     async selectActivity(activity) {
         // Remove activity menu
         const menu = document.getElementById('activity-menu');
@@ -2442,51 +2335,12 @@ class MoonVegetableGame {
     }
     
     async playBreakfastActivity() {
-        this.gameArea.innerHTML = '';
-        this.createHouseInterior();
-        
-        // Create breakfast cooking scene
-        const title = document.createElement('div');
-        title.textContent = '🍳 Cooking Breakfast Together! 🥞';
-        title.style.position = 'absolute';
-        title.style.top = '50px';
-        title.style.left = '50%';
-        title.style.transform = 'translateX(-50%)';
-        title.style.fontSize = '2em';
-        title.style.color = '#FFD700';
-        title.style.textShadow = '2px 2px 4px rgba(0,0,0,0.8)';
-        title.style.fontFamily = 'Comic Sans MS, cursive';
-        title.style.zIndex = '25';
-        this.gameArea.appendChild(title);
-        
-        // Create breakfast items
-        const breakfastItems = ['🥞', '🥓', '🍳', '🥖', '🍌'];
-        breakfastItems.forEach((item, index) => {
-            const element = document.createElement('div');
-            element.textContent = item;
-            element.style.position = 'absolute';
-            element.style.top = '200px';
-            element.style.left = (200 + index * 80) + 'px';
-            element.style.fontSize = '3em';
-            element.style.zIndex = '15';
-            element.style.animation = 'float 2s ease-in-out infinite';
-            element.style.animationDelay = (index * 0.3) + 's';
-            this.gameArea.appendChild(element);
-        });
-        
-        this.createInteractiveCharacters();
-        
-        await this.speak('Everyone is helping to make a delicious breakfast! Pancakes, bacon, eggs, and fresh fruit!', 'narrator');
-        await new Promise(resolve => setTimeout(resolve, 3000));
-        await this.speak('🐕‍🦺 Moon Dog: This breakfast smells amazing! Thank you for cooking with me!', 'moondog');
-        await this.speak('👨‍🚀 George: Cooking together is so much fun!', 'george');
-        await this.speak('👩‍🚀 Matilda: The best part is sharing it with friends!', 'matilda');
-        
+        await this.runScene('playBreakfastActivity');
         await this.completeActivity();
     }
     
     async playVegetableActivity() {
-        this.gameArea.innerHTML = '';
+        this.enterScene('vegetableActivity');
         
         // Create moon garden scene
         const surface = document.createElement('div');
@@ -2537,8 +2391,7 @@ class MoonVegetableGame {
         
         this.createInteractiveCharacters();
         
-        await this.speak('Look at this amazing moon garden! So many fresh vegetables growing in the lunar soil!', 'narrator');
-        await new Promise(resolve => setTimeout(resolve, 3000));
+        await this.speak('Look at this amazing moon garden! So many fresh vegetables growing in the lunar soil!', 'narrator').then(lineMs => this.pauseAfterLine(3000, lineMs));
         await this.speak('🐕‍🦺 Moon Dog: My garden has grown so well thanks to your help! The vegetables are huge!', 'moondog');
         await this.speak('👩‍🚀 Matilda: These moon vegetables are the most colorful I\'ve ever seen!', 'matilda');
         await this.speak('👨‍🚀 George: Let\'s pick some for later! Fresh vegetables taste the best!', 'george');
@@ -2547,7 +2400,7 @@ class MoonVegetableGame {
     }
     
     async playPlaygroundActivity() {
-        this.gameArea.innerHTML = '';
+        this.enterScene('playgroundActivity');
         
         // Create playground scene
         const playground = document.createElement('div');
@@ -2593,8 +2446,7 @@ class MoonVegetableGame {
         
         this.createInteractiveCharacters();
         
-        await this.speak('Welcome to the amazing Moon Playground! Everything floats and bounces in the low gravity!', 'narrator');
-        await new Promise(resolve => setTimeout(resolve, 3000));
+        await this.speak('Welcome to the amazing Moon Playground! Everything floats and bounces in the low gravity!', 'narrator').then(lineMs => this.pauseAfterLine(3000, lineMs));
         await this.speak('👨‍🚀 George: Wow! I can jump so high here on the moon!', 'george');
         await this.speak('👩‍🚀 Matilda: The merry-go-round spins in slow motion! This is incredible!', 'matilda');
         await this.speak('🐕‍🦺 Moon Dog: This is my favorite place to play! The low gravity makes everything more fun!', 'moondog');
@@ -2606,7 +2458,7 @@ class MoonVegetableGame {
         await this.speak('Time to make dinner! This will be extra special!', 'narrator');
         
         // Reuse the cooking game but simplified
-        this.gameArea.innerHTML = '';
+        this.enterScene('dinnerActivity');
         this.createHouseInterior();
         
         const title = document.createElement('div');
@@ -2639,8 +2491,7 @@ class MoonVegetableGame {
         
         this.createInteractiveCharacters();
         
-        await this.speak('Everyone is working together to create a magnificent dinner feast!', 'narrator');
-        await new Promise(resolve => setTimeout(resolve, 3000));
+        await this.speak('Everyone is working together to create a magnificent dinner feast!', 'narrator').then(lineMs => this.pauseAfterLine(3000, lineMs));
         await this.speak('👩‍🚀 Matilda: This dinner looks fit for moon royalty!', 'matilda');
         await this.speak('👨‍🚀 George: The smells are making me so hungry!', 'george');
         await this.speak('🐕‍🦺 Moon Dog: I\'ve never had such a wonderful feast! You two are amazing chefs!', 'moondog');
@@ -2649,7 +2500,7 @@ class MoonVegetableGame {
     }
     
     async completeActivity() {
-        await new Promise(resolve => setTimeout(resolve, 2000));
+        await this.scene.delay(2000);
         
         // Check if it's dinner time for days 2 or 3
         if (this.currentActivity.type === 'dinner' && this.dayCounter >= 2) {
@@ -2663,7 +2514,7 @@ class MoonVegetableGame {
         await this.speak(`What a wonderful day ${this.dayCounter}! Now let\\'s stock the fridge and visit the fancy restaurant!`, 'narrator');
         
         // Show fridge stocking
-        this.gameArea.innerHTML = '';
+        this.enterScene('stockFridgeAndRestaurant');
         this.createHouseInterior();
         
         const title = document.createElement('div');
@@ -2707,122 +2558,39 @@ class MoonVegetableGame {
         
         this.createInteractiveCharacters();
         
-        await this.speak('Moon Dog\'s fridge is now fully stocked with delicious food!', 'narrator');
-        await new Promise(resolve => setTimeout(resolve, 3000));
+        await this.speak('Moon Dog\'s fridge is now fully stocked with delicious food!', 'narrator').then(lineMs => this.pauseAfterLine(3000, lineMs));
         
         await this.goToFancyRestaurant();
     }
     
     async goToFancyRestaurant() {
-        await this.speak('Now let\'s go to the fanciest restaurant on the moon!', 'narrator');
-        
-        this.gameArea.innerHTML = '';
-        
-        // Create fancy restaurant scene
-        const restaurant = document.createElement('div');
-        restaurant.style.width = '100%';
-        restaurant.style.height = '100%';
-        restaurant.style.background = 'linear-gradient(45deg, #8B0000 0%, #FFD700 50%, #8B0000 100%)';
-        restaurant.style.position = 'absolute';
-        this.gameArea.appendChild(restaurant);
-        
-        const title = document.createElement('div');
-        title.textContent = '🍽️ ✨ Fancy Moon Restaurant ✨ 🍽️';
-        title.style.position = 'absolute';
-        title.style.top = '30px';
-        title.style.left = '50%';
-        title.style.transform = 'translateX(-50%)';
-        title.style.fontSize = '2em';
-        title.style.color = '#FFD700';
-        title.style.textShadow = '3px 3px 6px rgba(0,0,0,0.8)';
-        title.style.fontFamily = 'Comic Sans MS, cursive';
-        title.style.zIndex = '25';
-        this.gameArea.appendChild(title);
-        
-        // Create fancy table setting
-        const table = document.createElement('div');
-        table.textContent = '🪑';
-        table.style.position = 'absolute';
-        table.style.bottom = '200px';
-        table.style.left = '300px';
-        table.style.fontSize = '6em';
-        table.style.zIndex = '10';
-        this.gameArea.appendChild(table);
-        
-        // Add fancy food
-        const fancyFoods = ['🥾', '🍞', '🥭', '🍷', '🍰'];
-        fancyFoods.forEach((food, index) => {
-            const element = document.createElement('div');
-            element.textContent = food;
-            element.style.position = 'absolute';
-            element.style.bottom = '280px';
-            element.style.left = (250 + index * 60) + 'px';
-            element.style.fontSize = '2.5em';
-            element.style.zIndex = '15';
-            element.style.animation = 'float 2s ease-in-out infinite';
-            element.style.animationDelay = (index * 0.3) + 's';
-            this.gameArea.appendChild(element);
-        });
-        
-        // Create dressed up characters
-        const fancyChars = [
-            { emoji: '🤵', left: '150px' }, // George in tuxedo
-            { emoji: '👰', left: '300px' }, // Matilda in dress
-            { emoji: '🐕‍🦺', left: '450px' }  // Moon Dog with bow tie
-        ];
-        
-        fancyChars.forEach(char => {
-            const element = document.createElement('div');
-            element.textContent = char.emoji;
-            element.style.position = 'absolute';
-            element.style.bottom = '120px';
-            element.style.left = char.left;
-            element.style.fontSize = '3em';
-            element.style.zIndex = '20';
-            element.style.animation = 'float 3s ease-in-out infinite';
-            this.gameArea.appendChild(element);
-        });
-        
-        await this.speak('Welcome to the most elegant restaurant on the moon! Everyone looks so fancy!', 'narrator');
-        await new Promise(resolve => setTimeout(resolve, 3000));
-        await this.speak('🤵 George: I feel so fancy in this tuxedo!', 'george');
-        await this.speak('👰 Matilda: This restaurant is absolutely beautiful!', 'matilda');
-        await this.speak('🐕‍🦺 Moon Dog: Thank you for bringing me to such a special place! This is the best day ever!', 'moondog');
-        
-        await new Promise(resolve => setTimeout(resolve, 4000));
-        
-        // After restaurant, end the day
-        await this.speak('What a perfect ending to a wonderful day!', 'narrator');
+        await this.runScene('goToFancyRestaurant');
         await this.continueDay();
     }
     
     async endDay() {
-        await this.speak(`What a wonderful day ${this.dayCounter}! You completed all 4 activities!`, 'narrator');
-        await new Promise(resolve => setTimeout(resolve, 2000));
+        await this.speak(`What a wonderful day ${this.dayCounter}! You completed all 4 activities!`, 'narrator').then(lineMs => this.pauseAfterLine(2000, lineMs));
         
         if (this.dayCounter < 3) {
             await this.speak(`Time to rest and get ready for day ${this.dayCounter + 1}!`, 'narrator');
             await this.showSleepingScene();
         } else {
-            await this.speak('What an amazing 3-day adventure! Time to say goodbye to Moon Dog and return to Earth...', 'narrator');
-            await new Promise(resolve => setTimeout(resolve, 2000));
+            await this.speak('What an amazing 3-day adventure! Time to say goodbye to Moon Dog and return to Earth...', 'narrator').then(lineMs => this.pauseAfterLine(2000, lineMs));
             this.startReturnJourney();
         }
     }
     
     async showSleepingScene() {
         // Show sleeping animation between days
-        this.gameArea.innerHTML = '';
+        this.enterScene('sleeping');
         this.createBedroom();
         
-        await this.speak('Everyone is sleeping peacefully after such a fun day...', 'narrator');
-        await new Promise(resolve => setTimeout(resolve, 3000));
+        await this.speak('Everyone is sleeping peacefully after such a fun day...', 'narrator').then(lineMs => this.pauseAfterLine(3000, lineMs));
         
         // Start next day
         this.dayCounter++;
         this.dailyActivitiesCompleted = []; // Reset activities for new day
-        await this.speak(`Good morning! Day ${this.dayCounter} begins!`, 'narrator');
-        await new Promise(resolve => setTimeout(resolve, 1500));
+        await this.speak(`Good morning! Day ${this.dayCounter} begins!`, 'narrator').then(lineMs => this.pauseAfterLine(1500, lineMs));
         this.showInteractiveDay();
     }
     
@@ -2840,7 +2608,7 @@ class MoonVegetableGame {
     }
     
     async showGoodbyeScene() {
-        this.gameArea.innerHTML = '';
+        this.enterScene('goodbye');
         this.createHouseInterior();
         
         // Create farewell scene
@@ -2890,253 +2658,47 @@ class MoonVegetableGame {
             this.gameArea.appendChild(heart);
         }
         
-        await this.speak('🐕‍🦺 Moon Dog: Thank you so much for the most wonderful 3 days of my life!', 'moondog');
-        await new Promise(resolve => setTimeout(resolve, 2000));
-        await this.speak('👨‍🚀 George: We had so much fun! Thank you for being such a great friend!', 'george');
-        await new Promise(resolve => setTimeout(resolve, 2000));
-        await this.speak('👩‍🚀 Matilda: We\'ll never forget our amazing moon adventure with you!', 'matilda');
-        await new Promise(resolve => setTimeout(resolve, 2000));
-        await this.speak('🐕‍🦺 Moon Dog: Come back and visit me again soon! I\'ll miss you both so much!', 'moondog');
-        await new Promise(resolve => setTimeout(resolve, 3000));
+        await this.speak('🐕‍🦺 Moon Dog: Thank you so much for the most wonderful 3 days of my life!', 'moondog').then(lineMs => this.pauseAfterLine(2000, lineMs));
+        await this.speak('👨‍🚀 George: We had so much fun! Thank you for being such a great friend!', 'george').then(lineMs => this.pauseAfterLine(2000, lineMs));
+        await this.speak('👩‍🚀 Matilda: We\'ll never forget our amazing moon adventure with you!', 'matilda').then(lineMs => this.pauseAfterLine(2000, lineMs));
+        await this.speak('🐕‍🦺 Moon Dog: Come back and visit me again soon! I\'ll miss you both so much!', 'moondog').then(lineMs => this.pauseAfterLine(3000, lineMs));
     }
     
     async returnSpaceFlight() {
-        this.gameArea.innerHTML = '';
+        this.enterScene('returnFlight');
         this.createSpaceBackground();
         
-        // Create spaceship for return journey
-        const spaceship = document.createElement('div');
-        spaceship.textContent = '🚀';
-        spaceship.style.position = 'absolute';
-        spaceship.style.left = '100px';
-        spaceship.style.top = '300px';
-        spaceship.style.fontSize = '4em';
-        spaceship.style.zIndex = '20';
-        spaceship.style.filter = 'drop-shadow(0 0 10px #ffaa00)';
-        this.gameArea.appendChild(spaceship);
-        
-        // Create Earth in the distance
-        const earth = document.createElement('div');
-        earth.textContent = '🌍';
-        earth.style.position = 'absolute';
-        earth.style.right = '50px';
-        earth.style.top = '100px';
-        earth.style.fontSize = '60px';
-        earth.style.zIndex = '10';
-        this.gameArea.appendChild(earth);
-        
-        // Create moon getting smaller behind them
-        const moon = document.createElement('div');
-        moon.textContent = '🌙';
-        moon.style.position = 'absolute';
-        moon.style.left = '50px';
-        moon.style.bottom = '50px';
-        moon.style.fontSize = '40px';
-        moon.style.zIndex = '5';
-        moon.style.opacity = '0.7';
-        this.gameArea.appendChild(moon);
+        // Spaceship for the return journey, Earth in the distance and the
+        // moon getting smaller behind them
+        let position = 100;
+        this.spaceRenderer.setShip(position, 300);
+        this.spaceRenderer.addBody('🌍', { right: 50, top: 100, size: 60, glow: false });
+        this.spaceRenderer.addBody('🌙', { left: 50, bottom: 50, size: 40, opacity: 0.7, glow: false });
+        this.drawSpaceScene('returnFlight');
         
         await this.speak('Now it\'s time to return to Earth! The spaceship is flying back home!', 'narrator');
         
-        // Animate spaceship moving toward Earth
-        let position = 100;
-        const moveInterval = setInterval(() => {
-            position += 15;
-            spaceship.style.left = position + 'px';
-            if (position > 600) {
-                clearInterval(moveInterval);
-            }
-        }, 100);
+        // Fly toward Earth at 150px a second until the ship is past 600px
+        this.drawSpaceScene('returnFlight', [{ name: 'returnShip', step: () => {
+            if (position > 600) return;
+            position += 2.5;
+            this.spaceRenderer.setShip(position, 300);
+        } }]);
         
-        await new Promise(resolve => setTimeout(resolve, 4000));
-        await this.speak('Look! Earth is getting bigger! We\'re almost home!', 'narrator');
-        await new Promise(resolve => setTimeout(resolve, 2000));
+        await this.scene.delay(4000);
+        await this.speak('Look! Earth is getting bigger! We\'re almost home!', 'narrator').then(lineMs => this.pauseAfterLine(2000, lineMs));
     }
     
     async dropOffGeorgeNYC() {
-        this.gameArea.innerHTML = '';
-        
-        // Create New York City scene
-        const cityBackground = document.createElement('div');
-        cityBackground.style.width = '100%';
-        cityBackground.style.height = '100%';
-        cityBackground.style.background = 'linear-gradient(to bottom, #87CEEB 0%, #F0E68C 100%)';
-        cityBackground.style.position = 'absolute';
-        this.gameArea.appendChild(cityBackground);
-        
-        const title = document.createElement('div');
-        title.textContent = '🏙️ New York City - George\'s Home! 🗽';
-        title.style.position = 'absolute';
-        title.style.top = '30px';
-        title.style.left = '50%';
-        title.style.transform = 'translateX(-50%)';
-        title.style.fontSize = '2em';
-        title.style.color = '#FF6B6B';
-        title.style.textShadow = '2px 2px 4px rgba(0,0,0,0.8)';
-        title.style.fontFamily = 'Comic Sans MS, cursive';
-        title.style.zIndex = '25';
-        this.gameArea.appendChild(title);
-        
-        // Create NYC skyline with emojis
-        const buildings = ['🏢', '🏬', '🏢', '🏭', '🏢', '🏬', '🏢'];
-        buildings.forEach((building, index) => {
-            const element = document.createElement('div');
-            element.textContent = building;
-            element.style.position = 'absolute';
-            element.style.bottom = '100px';
-            element.style.left = (80 + index * 90) + 'px';
-            element.style.fontSize = '4em';
-            element.style.zIndex = '10';
-            this.gameArea.appendChild(element);
-        });
-        
-        // Add Statue of Liberty
-        const liberty = document.createElement('div');
-        liberty.textContent = '🗽';
-        liberty.style.position = 'absolute';
-        liberty.style.bottom = '150px';
-        liberty.style.right = '100px';
-        liberty.style.fontSize = '5em';
-        liberty.style.zIndex = '15';
-        liberty.style.animation = 'float 3s ease-in-out infinite';
-        this.gameArea.appendChild(liberty);
-        
-        // Create characters
-        const george = document.createElement('div');
-        george.textContent = '👨‍🚀';
-        george.style.position = 'absolute';
-        george.style.bottom = '200px';
-        george.style.left = '250px';
-        george.style.fontSize = '3em';
-        george.style.zIndex = '20';
-        this.gameArea.appendChild(george);
-        
-        const matilda = document.createElement('div');
-        matilda.textContent = '👩‍🚀';
-        matilda.style.position = 'absolute';
-        matilda.style.bottom = '200px';
-        matilda.style.left = '400px';
-        matilda.style.fontSize = '3em';
-        matilda.style.zIndex = '20';
-        this.gameArea.appendChild(matilda);
-        
-        // Add taxi
-        const taxi = document.createElement('div');
-        taxi.textContent = '🚕';
-        taxi.style.position = 'absolute';
-        taxi.style.bottom = '150px';
-        taxi.style.left = '150px';
-        taxi.style.fontSize = '3em';
-        taxi.style.zIndex = '15';
-        this.gameArea.appendChild(taxi);
-        
-        await this.speak('Welcome to New York City! This is where George lives!', 'narrator');
-        await new Promise(resolve => setTimeout(resolve, 2000));
-        await this.speak('👨‍🚀 George: Wow! It feels so good to be back in New York! I can\'t wait to tell everyone about our moon adventure!', 'george');
-        await new Promise(resolve => setTimeout(resolve, 2500));
-        await this.speak('👩‍🚀 Matilda: I\'m going to miss you so much, George! This was the best adventure ever!', 'matilda');
-        await new Promise(resolve => setTimeout(resolve, 2000));
-        await this.speak('👨‍🚀 George: I\'ll miss you too, Matilda! Let\'s plan another adventure soon!', 'george');
-        await new Promise(resolve => setTimeout(resolve, 2500));
-        await this.speak('George waves goodbye as Matilda continues on to San Francisco...', 'narrator');
-        await new Promise(resolve => setTimeout(resolve, 2000));
+        await this.runScene('dropOffGeorgeNYC');
     }
     
     async matildaToSanFrancisco() {
-        this.gameArea.innerHTML = '';
-        
-        // Create San Francisco scene
-        const cityBackground = document.createElement('div');
-        cityBackground.style.width = '100%';
-        cityBackground.style.height = '100%';
-        cityBackground.style.background = 'linear-gradient(to bottom, #FF7F50 0%, #FFB6C1 100%)';
-        cityBackground.style.position = 'absolute';
-        this.gameArea.appendChild(cityBackground);
-        
-        const title = document.createElement('div');
-        title.textContent = '🌉 San Francisco - Matilda\'s Home! 🌁';
-        title.style.position = 'absolute';
-        title.style.top = '30px';
-        title.style.left = '50%';
-        title.style.transform = 'translateX(-50%)';
-        title.style.fontSize = '2em';
-        title.style.color = '#4ECDC4';
-        title.style.textShadow = '2px 2px 4px rgba(0,0,0,0.8)';
-        title.style.fontFamily = 'Comic Sans MS, cursive';
-        title.style.zIndex = '25';
-        this.gameArea.appendChild(title);
-        
-        // Create Golden Gate Bridge
-        const bridge = document.createElement('div');
-        bridge.textContent = '🌉';
-        bridge.style.position = 'absolute';
-        bridge.style.top = '120px';
-        bridge.style.left = '50%';
-        bridge.style.transform = 'translateX(-50%)';
-        bridge.style.fontSize = '6em';
-        bridge.style.zIndex = '15';
-        bridge.style.animation = 'float 4s ease-in-out infinite';
-        this.gameArea.appendChild(bridge);
-        
-        // Create SF buildings
-        const sfBuildings = ['🏢', '🏬', '🏘️', '🏢', '🏬'];
-        sfBuildings.forEach((building, index) => {
-            const element = document.createElement('div');
-            element.textContent = building;
-            element.style.position = 'absolute';
-            element.style.bottom = '150px';
-            element.style.left = (120 + index * 120) + 'px';
-            element.style.fontSize = '3.5em';
-            element.style.zIndex = '10';
-            this.gameArea.appendChild(element);
-        });
-        
-        // Create hills with houses
-        const hills = ['🏘️', '🏡', '🏘️'];
-        hills.forEach((hill, index) => {
-            const element = document.createElement('div');
-            element.textContent = hill;
-            element.style.position = 'absolute';
-            element.style.bottom = '250px';
-            element.style.left = (200 + index * 150) + 'px';
-            element.style.fontSize = '2.5em';
-            element.style.zIndex = '5';
-            element.style.opacity = '0.8';
-            this.gameArea.appendChild(element);
-        });
-        
-        // Create Matilda at home
-        const matilda = document.createElement('div');
-        matilda.textContent = '👩‍🚀';
-        matilda.style.position = 'absolute';
-        matilda.style.bottom = '200px';
-        matilda.style.left = '350px';
-        matilda.style.fontSize = '3em';
-        matilda.style.zIndex = '20';
-        this.gameArea.appendChild(matilda);
-        
-        // Add cable car
-        const cableCar = document.createElement('div');
-        cableCar.textContent = '🚋';
-        cableCar.style.position = 'absolute';
-        cableCar.style.bottom = '180px';
-        cableCar.style.left = '500px';
-        cableCar.style.fontSize = '2.5em';
-        cableCar.style.zIndex = '15';
-        this.gameArea.appendChild(cableCar);
-        
-        await this.speak('Welcome to beautiful San Francisco! This is Matilda\'s home!', 'narrator');
-        await new Promise(resolve => setTimeout(resolve, 2000));
-        await this.speak('👩‍🚀 Matilda: Home sweet home! I love San Francisco, but I\'ll always remember our incredible moon adventure!', 'matilda');
-        await new Promise(resolve => setTimeout(resolve, 2500));
-        await this.speak('👩‍🚀 Matilda: I can\'t wait to tell my family about Moon Dog, the vegetable garden, the playground, and all our fun activities!', 'matilda');
-        await new Promise(resolve => setTimeout(resolve, 3000));
-        await this.speak('👩‍🚀 Matilda: George, Moon Dog, and I will be friends forever! What an amazing adventure we had!', 'matilda');
-        await new Promise(resolve => setTimeout(resolve, 3000));
+        await this.runScene('matildaToSanFrancisco');
     }
     
     async finishGame() {
-        this.gameArea.innerHTML = '';
+        this.enterScene('finale');
         
         // Create final celebration scene
         const celebration = document.createElement('div');
@@ -3167,7 +2729,7 @@ class MoonVegetableGame {
         
         // Add celebration particles
         for (let i = 0; i < 30; i++) {
-            setTimeout(() => {
+            this.scene.setTimeout(() => {
                 const particle = document.createElement('div');
                 particle.textContent = ['🎉', '🎆', '✨', '🎈', '❤️'][Math.floor(Math.random() * 5)];
                 particle.style.position = 'absolute';
@@ -3178,7 +2740,7 @@ class MoonVegetableGame {
                 particle.style.animation = 'collect 4s ease-out forwards';
                 this.gameArea.appendChild(particle);
                 
-                setTimeout(() => {
+                this.scene.setTimeout(() => {
                     if (particle.parentNode) {
                         particle.remove();
                     }
@@ -3189,7 +2751,7 @@ class MoonVegetableGame {
         await this.speak('What an amazing adventure! George, Matilda and Moon Dog will be best friends forever!', 'narrator');
         
         // Show play again button
-        setTimeout(() => {
+        this.scene.setTimeout(() => {
             this.startBtn.textContent = 'Play Again!';
             this.startBtn.disabled = false;
             this.gameState = 'completed';
@@ -3197,7 +2759,16 @@ class MoonVegetableGame {
     }
 }
 
-// Initialize game when page loads
-document.addEventListener('DOMContentLoaded', () => {
+// Initialize game when page loads. The bundle loads this script without
+// blocking the parser, so the page may already be parsed by now.
+function startGame() {
     window.game = new MoonVegetableGame();
-});
\ No newline at end of file
+    // The title screen is interactive from here (benchmark_startup.py reads this)
+    performance.mark('game-ready');
+}
+
+if (document.readyState === 'loading') {
+    document.addEventListener('DOMContentLoaded', startGame);
+} else {
+    startGame();
+}
\ No newline at end of file
@@ -0,0 +1,193 @@
+// Canvas renderer for the space scenes
+// Draws the starfield, planets, asteroids and the spaceship on one canvas
+// instead of a div per object, so moving them doesn't touch styles or layout.
+// Star and asteroid state lives in typed arrays and is updated in place.
+
+// Emoji box size relative to its font size, as a div lays it out
+const SPRITE_BOX = 1.2;
+
+class SpaceFlightRenderer {
+    constructor(container, { width = 800, height = 600, starCount = 100 } = {}) {
+        this.width = width;
+        this.height = height;
+        this.pixelRatio = window.devicePixelRatio || 1;
+
+        this.canvas = document.createElement('canvas');
+        this.canvas.className = 'space-canvas';
+        this.canvas.width = Math.round(width * this.pixelRatio);
+        this.canvas.height = Math.round(height * this.pixelRatio);
+        this.canvas.style.width = width + 'px';
+        this.canvas.style.height = height + 'px';
+        container.appendChild(this.canvas);
+        this.context = this.canvas.getContext('2d');
+
+        this.sprites = new Map();
+        this.starSprite = this.sprite('✦', 15);
+
+        // Stars: top-left position, font size and twinkle phase (0-1); the
+        // first visibleStars are moved and drawn
+        this.starCount = starCount;
+        this.visibleStars = starCount;
+        this.starX = new Float32Array(starCount);
+        this.starY = new Float32Array(starCount);
+        this.starSize = new Float32Array(starCount);
+        this.starPhase = new Float32Array(starCount);
+        for (let i = 0; i < starCount; i++) {
+            this.starX[i] = Math.random() * width;
+            this.starY[i] = Math.random() * height;
+            this.starSize[i] = Math.random() * 10 + 5;
+            this.starPhase[i] = Math.random();
+        }
+
+        // Asteroids: top-left position and spin phase (0-1); live ones are packed at the front
+        this.asteroidSprite = this.sprite('☄️', 30);
+        this.asteroidCount = 0;
+        this.asteroidX = new Float32Array(8);
+        this.asteroidY = new Float32Array(8);
+        this.asteroidSpin = new Float32Array(8);
+
+        this.bodies = []; // planets, drawn over the stars in the order added
+        this.ship = null;
+    }
+
+    get attached() {
+        return this.canvas.isConnected;
+    }
+
+    // Glyph pre-rendered at the device's resolution, so a frame draws images, not text
+    sprite(glyph, size, shadow = null) {
+        const key = `${glyph}/${size}/${shadow ? shadow.color : ''}`;
+        if (this.sprites.has(key)) return this.sprites.get(key);
+
+        const blur = shadow ? shadow.blur : 0;
+        const box = size * SPRITE_BOX + blur * 2;
+        const canvas = document.createElement('canvas');
+        canvas.width = canvas.height = Math.ceil(box * this.pixelRatio);
+        const context = canvas.getContext('2d');
+        context.scale(this.pixelRatio, this.pixelRatio);
+        context.font = `${size}px sans-serif`;
+        context.textAlign = 'center';
+        context.textBaseline = 'middle';
+        context.fillStyle = 'white';
+        if (shadow) {
+            context.shadowColor = shadow.color;
+            context.shadowBlur = shadow.blur;
+        }
+        context.fillText(glyph, box / 2, box / 2);
+
+        const sprite = { image: canvas, size, box };
+        this.sprites.set(key, sprite);
+        return sprite;
+    }
+
+    // Position as CSS would give it: { left | right, top | bottom, size }
+    addBody(glyph, { left, right, top, bottom, size, opacity = 1, glow = true }) {
+        const box = size * SPRITE_BOX;
+        this.bodies.push({
+            sprite: this.sprite(glyph, size, glow ? { color: 'rgba(255,255,255,0.3)', blur: 15 } : null),
+            x: left !== undefined ? left : this.width - right - box,
+            y: top !== undefined ? top : this.height - bottom - box,
+            opacity
+        });
+    }
+
+    setShip(x, y) {
+        if (!this.ship) {
+            this.ship = { sprite: this.sprite('🚀', 64, { color: '#ffaa00', blur: 10 }), x, y };
+        }
+        this.ship.x = x;
+        this.ship.y = y;
+    }
+
+    // Draw only the first `count` stars (lower quality)
+    setStarCount(count) {
+        this.visibleStars = Math.min(Math.max(0, Math.round(count)), this.starCount);
+    }
+
+    // Move every star left, wrapping the ones that leave the screen to a new row
+    scrollStars(distance) {
+        const starX = this.starX;
+        for (let i = 0; i < this.visibleStars; i++) {
+            starX[i] -= distance;
+            if (starX[i] < -20) {
+                starX[i] = this.width + 20;
+                this.starY[i] = Math.random() * this.height;
+            }
+        }
+    }
+
+    spawnAsteroid(y) {
+        if (this.asteroidCount === this.asteroidX.length) {
+            const grow = array => {
+                const bigger = new Float32Array(array.length * 2);
+                bigger.set(array);
+                return bigger;
+            };
+            this.asteroidX = grow(this.asteroidX);
+            this.asteroidY = grow(this.asteroidY);
+            this.asteroidSpin = grow(this.asteroidSpin);
+        }
+        const i = this.asteroidCount++;
+        this.asteroidX[i] = this.width - this.asteroidSprite.size * SPRITE_BOX;
+        this.asteroidY[i] = y;
+        this.asteroidSpin[i] = Math.random();
+    }
+
+    // Move asteroids left, dropping the ones that are off screen
+    moveAsteroids(distance) {
+        const limit = -50 - this.asteroidSprite.size * SPRITE_BOX;
+        for (let i = this.asteroidCount - 1; i >= 0; i--) {
+            this.asteroidX[i] -= distance;
+            if (this.asteroidX[i] < limit) {
+                // Swap the last live asteroid into this slot
+                const last = --this.asteroidCount;
+                this.asteroidX[i] = this.asteroidX[last];
+                this.asteroidY[i] = this.asteroidY[last];
+                this.asteroidSpin[i] = this.asteroidSpin[last];
+            }
+        }
+    }
+
+    drawSprite(sprite, x, y) {
+        // x, y is the top-left of the glyph's box; the sprite adds shadow room around it
+        const offset = (sprite.box - sprite.size * SPRITE_BOX) / 2;
+        this.context.drawImage(sprite.image, x - offset, y - offset, sprite.box, sprite.box);
+    }
+
+    render(time) {
+        const context = this.context;
+        context.setTransform(this.pixelRatio, 0, 0, this.pixelRatio, 0, 0);
+        context.clearRect(0, 0, this.width, this.height);
+
+        // Stars twinkle between 0.3 and 1 opacity every 3s
+        const star = this.starSprite;
+        const cycle = time / 3000;
+        for (let i = 0; i < this.visibleStars; i++) {
+            const scale = this.starSize[i] / star.size;
+            context.globalAlpha = 0.65 - 0.35 * Math.cos(2 * Math.PI * (cycle + this.starPhase[i]));
+            context.drawImage(star.image, this.starX[i], this.starY[i], star.box * scale, star.box * scale);
+        }
+
+        for (const body of this.bodies) {
+            context.globalAlpha = body.opacity;
+            this.drawSprite(body.sprite, body.x, body.y);
+        }
+        context.globalAlpha = 1;
+
+        // Asteroids spin once every 4s
+        const asteroid = this.asteroidSprite;
+        const half = asteroid.box / 2;
+        const turn = time / 4000;
+        for (let i = 0; i < this.asteroidCount; i++) {
+            context.save();
+            context.translate(this.asteroidX[i] + half, this.asteroidY[i] + half);
+            context.rotate(2 * Math.PI * (turn + this.asteroidSpin[i]));
+            context.drawImage(asteroid.image, -half, -half, asteroid.box, asteroid.box);
+            context.restore();
+        }
+
+        if (this.ship) {
+            this.drawSprite(this.ship.sprite, this.ship.x, this.ship.y);
+        }
+    }
+}
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Split script.js into a core and lazily loaded scene chunks
+
+MoonVegetableGame is one class covering every scene of the game, but the
+title screen only needs a fraction of it. CHUNKS names each later scene by
+its entry methods - the methods the rest of the game calls to start it.
+A chunk holds every method reachable from its entries that nothing else
+reaches; methods two scenes share, and everything the constructor reaches
+directly, stay in the core. So the split follows the code, and a method
+that starts being shared moves back to the core by itself.
+
+The core keeps the class minus the chunk methods, and gets a stub for each
+entry method that loads its chunk and then calls the real method. A chunk
+is a script that adds its methods to MoonVegetableGame.prototype, replacing
+the stubs. Entering a chunk prefetches the next one in CHUNKS order, and
+the first is prefetched once the page has loaded, so the code for the next
+scene is usually there before the player gets to it.
+
+Stubs are async, so calls into a chunk have to be ones whose result isn't
+used right away - a statement, `await`, or an arrow function body. split()
+raises ValueError for anything else, as it does for a chunk method that is
+passed around without being called.
+
+A scene script's {"call": method} steps are calls too: runScene() makes
+them as `await this[method]()`, so they don't appear in the source. They
+count as calls made by each method that runs that scene
+(`this.runScene('name')`), and so are placed and checked like any other.
+
+Usage:
+    python3 split_script.py      # show how script.js would be split
+"""
+import json
+import re
+from dataclasses import dataclass
+
+from dialogue_catalog import METHOD_PATTERN
+from js_source import find_calls, find_closing
+from scene_scripts import load_scene, scene_names
+
+CLASS_NAME = 'MoonVegetableGame'
+CHUNK_DIR = 'chunks'
+
+# Scenes in the order the player reaches them: (name, entry methods)
+CHUNKS = [
+    ('flight', ['spawnAsteroids', 'spaceFlightLoop', 'handleSpaceFlightControls']),
+    ('moon', ['initMoonSurface']),
+    ('garden', ['startVegetableGame']),
+    ('kitchen', ['returnToHouseWithVegetables']),
+    ('days', ['startSleeping']),
+    ('ending', ['startReturnJourney']),
+]
+
+CALL_PATTERN = re.compile(r'this\.(\w+)\s*\(')
+REFERENCE_PATTERN = re.compile(r'this\.(\w+)\b(?!\s*\()')
+RUN_SCENE_PATTERN = re.compile(r'this\.runScene\(\s*([\'"])(\w+)\1\s*\)')
+
+# Loads chunks on demand and swaps the entry stubs for the real methods
+CHUNK_LOADER = """
+// Scene chunks - added by build_bundle.py (see split_script.py)
+(function () {
+    const chunks = %s;
+    const base = document.currentScript.src.replace(/[^/]*$/, '') + '%s/';
+    const sources = new Map();
+    const loads = new Map();
+    const timings = {};
+
+    function prefetch(name) {
+        if (!sources.has(name)) {
+            const started = performance.now();
+            sources.set(name, fetch(`${base}${name}.js`).then(response => {
+                if (!response.ok) throw new Error(`${response.status} loading ${name} chunk`);
+                return response.text();
+            }).then(source => {
+                timings[name] = { fetchMs: performance.now() - started };
+                return source;
+            }).catch(error => {
+                sources.delete(name);
+                throw error;
+            }));
+        }
+        return sources.get(name);
+    }
+
+    function load(name) {
+        if (!loads.has(name)) {
+            const started = performance.now();
+            loads.set(name, prefetch(name).then(source => {
+                const script = document.createElement('script');
+                script.textContent = `${source}\\n//# sourceURL=${base}${name}.js`;
+                document.head.appendChild(script);
+                timings[name].waitMs = performance.now() - started;
+                log.info(`📦 Loaded ${name} chunk (${timings[name].waitMs.toFixed(0)}ms)`);
+            }).catch(error => {
+                loads.delete(name);
+                throw error;
+            }));
+        }
+        return loads.get(name);
+    }
+
+    for (const [method, name] of Object.entries(chunks.entries)) {
+        const stub = async function (...args) {
+            // Fetch the next scene while this one plays
+            const next = chunks.order[chunks.order.indexOf(name) + 1];
+            await load(name);
+            if (next) prefetch(next).catch(error => log.warn(`⚠️ Prefetching ${next} chunk failed:`, error));
+            if (%s.prototype[method] === stub) {
+                throw new Error(`${name} chunk did not define ${method}()`);
+            }
+            return this[method](...args);
+        };
+        %s.prototype[method] = stub;
+    }
+
+    const prefetchFirst = () => {
+        prefetch(chunks.order[0]).catch(error => log.warn('⚠️ Prefetching first chunk failed:', error));
+    };
+    if (document.readyState === 'complete') {
+        prefetchFirst();
+    } else {
+        window.addEventListener('load', prefetchFirst);
+    }
+
+    window.sceneChunks = { order: chunks.order, load, prefetch, timings, loaded: () => [...loads.keys()] };
+})();
+"""
+
+
+@dataclass(slots=True)
+class Method:
+    name: str
+    start: int      # offset of its first leading comment line, or of the method line
+    end: int        # offset just past its closing line
+    body: str       # the method's own text (no leading comments)
+    calls: set
+    scene_calls: set    # methods the scenes it runs call (always awaited)
+
+
+def scene_calls(scenes_dir='scenes'):
+    """{scene name: methods its call steps run}"""
+    return {name: [step['call'] for step in load_scene(name, scenes_dir)['steps'] if 'call' in step]
+            for name in scene_names(scenes_dir)}
+
+
+def parse_methods(source, scenes=None):
+    """Every method of the class, in source order. scenes is scene_calls()
+    (read from scenes/ when not given)."""
+    if scenes is None:
+        scenes = scene_calls()
+    lines = source.split('\n')
+    offsets = [0]
+    for line in lines:
+        offsets.append(offsets[-1] + len(line) + 1)
+
+    methods = []
+    for index, line in enumerate(lines):
+        match = METHOD_PATTERN.match(line)
+        if not match:
+            continue
+        first = index
+        while first > 0 and lines[first - 1].startswith('    //'):
+            first -= 1
+        close = find_closing(source, offsets[index] + line.rindex('{'))
+        end = source.index('\n', close) + 1
+        body = source[offsets[index]:end]
+        run = {method for _, scene in RUN_SCENE_PATTERN.findall(body) for method in scenes.get(scene, ())}
+        methods.append(Method(match.group(1), offsets[first], end, body, set(CALL_PATTERN.findall(body)), run))
+    return methods
+
+
+def reachable(calls, roots, stop=()):
+    """Names reachable from roots through this.x() calls, not passing through stop"""
+    seen = set()
+    pending = [root for root in roots if root in calls]
+    while pending:
+        name = pending.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        pending += [callee for callee in calls[name] if callee in calls and callee not in stop]
+    return seen
+
+
+def call_graph(methods):
+    calls = {}
+    for method in methods:
+        calls.setdefault(method.name, set()).update(method.calls | method.scene_calls)
+    return calls
+
+
+def startup_methods(methods, chunks=CHUNKS):
+    """Names of the methods the constructor runs, short of entering a chunk"""
+    entries = {entry for _, chunk_entries in chunks for entry in chunk_entries}
+    return reachable(call_graph(methods), ['constructor'], stop=entries)
+
+
+def assign_chunks(methods, chunks=CHUNKS):
+    """{method name: chunk name} for every method that leaves the core"""
+    calls = call_graph(methods)
+    entries = {entry for _, chunk_entries in chunks for entry in chunk_entries}
+    missing = sorted(entries - set(calls))
+    if missing:
+        raise ValueError(f"Chunk entries not found in {CLASS_NAME}: {', '.join(missing)}")
+
+    core = startup_methods(methods, chunks)
+    reached = {name: reachable(calls, chunk_entries, stop=entries - set(chunk_entries))
+               for name, chunk_entries in chunks}
+
+    assignment = {}
+    for name, methods_reached in reached.items():
+        for method in methods_reached - core:
+            if not any(method in other for other_name, other in reached.items() if other_name != name):
+                assignment[method] = name
+    return assignment
+
+
+def check_boundaries(methods, assignment, entries):
+    """Raise ValueError for uses of chunk methods a lazy stub can't stand in for"""
+    problems = []
+    for method in methods:
+        home = assignment.get(method.name)
+        for name in set(REFERENCE_PATTERN.findall(method.body)):
+            if name in assignment and assignment[name] != home:
+                problems.append(f"{method.name}() passes {name} around; call it or keep it in the core")
+
+        for name in method.calls:
+            if name not in assignment or assignment[name] == home:
+                continue
+            if name not in entries:
+                problems.append(f"{method.name}() calls {name}() in the {assignment[name]} chunk, which isn't an entry")
+                continue
+            for start, _, previous in find_calls(method.body, f'this.{name}'):
+                before = method.body[:start].rstrip()
+                if not (previous is None or previous in '{};)' or before.endswith(('await', '=>', 'else'))):
+                    problems.append(f"{method.name}() uses the result of {name}(), which loads lazily")
+
+        for name in method.scene_calls - method.calls:
+            if name in assignment and assignment[name] != home and name not in entries:
+                problems.append(f"{method.name}() runs a scene that calls {name}() in the "
+                                f"{assignment[name]} chunk, which isn't an entry")
+    if problems:
+        raise ValueError('Can\'t split script.js:\n   - ' + '\n   - '.join(problems))
+
+
+def render_chunk(name, methods):
+    # Class method syntax is object literal method syntax once separated by commas
+    bodies = [method.body.rstrip('\n') for method in methods]
+    return (f"// {name} scene of {CLASS_NAME} - generated by build_bundle.py from script.js\n"
+            f"Object.assign({CLASS_NAME}.prototype, {{\n" + ',\n\n'.join(bodies) + "\n});\n")
+
+
+def split(source, chunks=CHUNKS, scenes=None):
+    """Return (core source, {chunk name: chunk source})"""
+    methods = parse_methods(source, scenes)
+    assignment = assign_chunks(methods, chunks)
+    entries = {entry: name for name, chunk_entries in chunks for entry in chunk_entries}
+    check_boundaries(methods, assignment, entries)
+
+    core = source
+    for method in reversed(methods):
+        if method.name in assignment:
+            end = method.end
+            # Take the blank separator line after the method with it
+            if core[end:end + 1] == '\n' or core[end:].startswith('    \n'):
+                end = core.index('\n', end) + 1
+            core = core[:method.start] + core[end:]
+
+    class_end = core.index('\n}\n') + 3
+    order = [name for name, _ in chunks]
+    loader = CHUNK_LOADER % (json.dumps({'order': order, 'entries': entries}), CHUNK_DIR, CLASS_NAME, CLASS_NAME)
+    core = core[:class_end] + loader + core[class_end:]
+
+    chunk_sources = {}
+    for name in order:
+        chunk_sources[name] = render_chunk(name, [method for method in methods if assignment.get(method.name) == name])
+    return core, chunk_sources
+
+
+def main():
+    with open('script.js', 'r', encoding='utf-8') as f:
+        source = f.read()
+
+    methods = parse_methods(source)
+    assignment = assign_chunks(methods)
+    core, chunk_sources = split(source)
+
+    print(f"🧩 script.js: {len(source.encode('utf-8')) / 1024:.1f} KB, {len(methods)} methods")
+    core_methods = sum(1 for method in methods if method.name not in assignment)
+    print(f"   {'core':<10} {core_methods:>4} methods {len(core.encode('utf-8')) / 1024:7.1f} KB")
+    for name, chunk_entries in CHUNKS:
+        count = sum(1 for method in methods if assignment.get(method.name) == name)
+        size = len(chunk_sources[name].encode('utf-8')) / 1024
+        print(f"   {name:<10} {count:>4} methods {size:7.1f} KB   entered by {', '.join(chunk_entries)}")
+
+
+if __name__ == '__main__':
+    main()
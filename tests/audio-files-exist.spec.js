@@ -115,4 +115,50 @@ test('all manifest audio files physically exist', async () => {
     }
     
     expect(missingPhysicalFiles.length).toBe(0);
-});
\ No newline at end of file
+});
+test('timing table covers every manifest clip', async () => {
+    const audioDir = path.join(__dirname, '..', 'audio');
+    const manifest = JSON.parse(fs.readFileSync(path.join(audioDir, 'manifest.json'), 'utf8'));
+    const timing = JSON.parse(fs.readFileSync(path.join(audioDir, 'timing.json'), 'utf8'));
+    
+    const badRows = [];
+    for (const file of manifest.files) {
+        const row = timing.clips[file.filename];
+        if (!row) {
+            badRows.push(`${file.filename}: missing`);
+            continue;
+        }
+        
+        // [duration_ms, word_start_ms, ...] with one start per spoken word
+        const [durationMs, ...wordStarts] = row;
+        const words = cleanTextForSpeech(file.clean_text).split(/\s+/).filter(Boolean);
+        const ordered = wordStarts.every((start, i) => i === 0 || start >= wordStarts[i - 1]);
+        
+        if (durationMs <= 0 || wordStarts.length !== words.length || !ordered ||
+            wordStarts[wordStarts.length - 1] >= durationMs) {
+            badRows.push(`${file.filename}: ${JSON.stringify(row)}`);
+        }
+    }
+    
+    if (badRows.length > 0) {
+        console.log('\n❌ Bad timing rows:');
+        badRows.forEach(row => console.log(`  - ${row}`));
+    }
+    
+    expect(badRows.length).toBe(0);
+});
+
+test('manifest uses the current schema version', async () => {
+    const manifestPath = path.join(__dirname, '..', 'audio', 'manifest.json');
+    const manifest = JSON.parse(fs.readFileSync(manifestPath, 'utf8'));
+    
+    // Keep in sync with SCHEMA_VERSION in audio_manifest.py
+    expect(manifest.version).toBe(3);
+    expect(manifest.generated_at).toMatch(/^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$/);
+    expect(manifest.total_files).toBe(manifest.files.length);
+    
+    for (const file of manifest.files) {
+        expect(manifest.voice_mappings[file.character], `voice for ${file.filename}`).toBeDefined();
+        expect(file.clean_text, `clean_text of ${file.filename}`).toBe(cleanTextForSpeech(file.clean_text));
+    }
+});
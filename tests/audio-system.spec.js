@@ -0,0 +1,217 @@
+const { test, expect } = require('@playwright/test');
+
+test.describe('Audio system', () => {
+  test('picks the smallest variant the browser can play', async ({ page }) => {
+    await page.goto('/');
+
+    const picked = await page.evaluate(() => {
+      const audio = new window.MobileAudioSystem();
+      audio.clipVariants.set('./audio/narrator_12345678.mp3', [
+        { filename: 'narrator_12345678.24k.ogg', type: 'audio/ogg; codecs="opus"', kbps: 24, bytes: 8000 },
+        { filename: 'narrator_12345678.48k.m4a', type: 'audio/mp4; codecs="mp4a.40.2"', kbps: 48, bytes: 17000 },
+        { filename: 'narrator_12345678.mp3', type: 'audio/mpeg', kbps: 128, bytes: 42000 }
+      ]);
+
+      // Pretend this browser has no Opus support
+      audio.playableTypes.set('audio/ogg; codecs="opus"', false);
+      audio.playableTypes.set('audio/mp4; codecs="mp4a.40.2"', true);
+
+      const paths = audioPath => audio.loadAttempts(audioPath).map(attempt => attempt.path);
+      return {
+        tiers: audio.playableTiers('./audio/narrator_12345678.mp3').map(tier => tier.filename),
+        attempts: paths('./audio/narrator_12345678.mp3'),
+        noVariants: paths('./audio/george_87654321.mp3')
+      };
+    });
+
+    expect(picked.tiers).toEqual(['narrator_12345678.48k.m4a']);
+    expect(picked.attempts).toEqual(['./audio/narrator_12345678.48k.m4a', './audio/narrator_12345678.mp3']);
+    expect(picked.noVariants).toEqual(['./audio/george_87654321.mp3']);
+  });
+
+  test('steps down the bitrate ladder on a slow network', async ({ page }) => {
+    await page.goto('/');
+
+    const picked = await page.evaluate(() => {
+      const audio = new window.MobileAudioSystem();
+      audio.clipVariants.set('./audio/narrator_12345678.mp3', [
+        { filename: 'narrator_12345678.12k.ogg', type: 'audio/ogg; codecs="opus"', kbps: 12, bytes: 4000 },
+        { filename: 'narrator_12345678.24k.ogg', type: 'audio/ogg; codecs="opus"', kbps: 24, bytes: 8000 },
+        { filename: 'narrator_12345678.48k.ogg', type: 'audio/ogg; codecs="opus"', kbps: 48, bytes: 16000 },
+        { filename: 'narrator_12345678.mp3', type: 'audio/mpeg', kbps: 128, bytes: 42000 }
+      ]);
+      audio.playableTypes.set('audio/ogg; codecs="opus"', true);
+
+      const tiers = audio.playableTiers('./audio/narrator_12345678.mp3');
+      const paths = () => audio.loadAttempts('./audio/narrator_12345678.mp3').map(attempt => attempt.path);
+      const choices = {};
+      audio.throughputKbps = 5000;
+      choices.fast = { tier: audio.pickTier(tiers).kbps, attempts: paths() };
+
+      // Two slow downloads: 8000 bytes in 2 seconds is 32 kbps
+      audio.throughputKbps = null;
+      audio.recordThroughput(8000, 2000);
+      audio.recordThroughput(8000, 2000);
+      choices.slow = { tier: audio.pickTier(tiers).kbps, attempts: paths() };
+      return choices;
+    });
+
+    // A chosen tier that loads too slowly falls back to the lowest, then the mp3
+    expect(picked.fast.tier).toBe(48);
+    expect(picked.fast.attempts).toEqual(['./audio/narrator_12345678.48k.ogg',
+      './audio/narrator_12345678.12k.ogg', './audio/narrator_12345678.mp3']);
+    expect(picked.slow.tier).toBe(12);
+    expect(picked.slow.attempts).toEqual(['./audio/narrator_12345678.12k.ogg', './audio/narrator_12345678.mp3']);
+  });
+
+  test('decodes each clip once on one shared AudioContext', async ({ page }) => {
+    await page.goto('/');
+
+    const result = await page.evaluate(async () => {
+      const audio = new window.MobileAudioSystem();
+      const manifest = await (await fetch('./audio/manifest.json')).json();
+      const path = `./audio/${manifest.files[0].filename}`;
+
+      await audio.unlockAudio();
+      const firstContext = audio.audioContext;
+      audio.audioUnlocked = false;
+      await audio.unlockAudio();
+
+      const [first, second] = await Promise.all([audio.loadBuffer(path), audio.loadBuffer(path)]);
+      return {
+        engine: audio.playbackEngine,
+        sameContext: firstContext === audio.audioContext,
+        sameBuffer: first === second,
+        duration: first.duration
+      };
+    });
+
+    expect(result.engine).toBe('webaudio');
+    expect(result.sameContext).toBe(true);
+    expect(result.sameBuffer).toBe(true);
+    expect(result.duration).toBeGreaterThan(0);
+  });
+
+  test('the game makes one audio system and plays its sounds on that one AudioContext', async ({ page }) => {
+    await page.addInitScript(() => {
+      window.audioContextsCreated = 0;
+      const AudioContextClass = window.AudioContext;
+      window.AudioContext = class extends AudioContextClass {
+        constructor(...args) {
+          super(...args);
+          window.audioContextsCreated++;
+        }
+      };
+    });
+    await page.goto('/');
+    await page.waitForFunction(() => window.game !== undefined);
+
+    const result = await page.evaluate(async () => {
+      const game = window.game;
+      await game.mobileAudio.unlockAudio();
+      game.playPickupSound();
+      return { created: window.audioContextsCreated, ownContext: 'audioContext' in game };
+    });
+
+    expect(result.created).toBe(1);
+    expect(result.ownContext).toBe(false);
+  });
+
+  test('evicts least recently used clips over budget but keeps pinned scenes', async ({ page }) => {
+    await page.goto('/');
+
+    const result = await page.evaluate(() => {
+      const audio = new window.MobileAudioSystem();
+      const cache = audio.activeCache();
+      cache.maxBytes = 400;
+
+      audio.sceneClips = [['./audio/a.mp3', './audio/b.mp3'], ['./audio/c.mp3'], ['./audio/d.mp3']];
+      audio.sceneClips.forEach((paths, scene) => paths.forEach(path => audio.clipScenes.set(path, scene)));
+
+      for (const name of ['a', 'b', 'c', 'd']) {
+        cache.set(`./audio/${name}.mp3`, name, 100);
+      }
+      audio.enterScene('./audio/b.mp3'); // pins scene 0 and scene 1
+      cache.get('./audio/a.mp3');
+      cache.get('./audio/x.mp3');
+      cache.set('./audio/e.mp3', 'e', 100);
+
+      return { keys: [...cache.entries.keys()], stats: audio.getCacheStats() };
+    });
+
+    // d is the only unpinned clip older than e
+    expect(result.keys).toEqual(['./audio/b.mp3', './audio/c.mp3', './audio/a.mp3', './audio/e.mp3']);
+    expect(result.stats).toMatchObject({ hits: 1, misses: 1, evictions: 1, entries: 4, bytes: 400, pinned: 3 });
+  });
+
+  test('prefetches the next lines and cancels them on a scene change', async ({ page }) => {
+    await page.goto('/');
+
+    const result = await page.evaluate(() => {
+      const audio = new window.MobileAudioSystem();
+      const requested = [];
+      const aborted = [];
+      // Clip downloads that never finish unless cancelled
+      window.fetch = (path, { signal } = {}) => new Promise((resolve, reject) => {
+        requested.push(path);
+        signal.addEventListener('abort', () => {
+          aborted.push(path);
+          reject(new Error('aborted'));
+        });
+      });
+
+      audio.playbackEngine = 'webaudio';
+      audio.prefetchDepth = 2;
+      audio.sceneClips = [['s0a', 's0b', 's0c', 's0d'], ['s1a', 's1b'], ['s2a']];
+      audio.sceneClips.forEach((paths, scene) => paths.forEach(path => audio.clipScenes.set(path, scene)));
+
+      audio.enterScene('s0a');
+      audio.prefetchAfter('s0a');
+      const lookahead = [...requested];
+
+      audio.enterScene('s1a');
+      return { lookahead, aborted, pending: [...audio.prefetching.keys()] };
+    });
+
+    expect(result.lookahead).toEqual(['s0b', 's0c']);
+    expect(result.aborted.sort()).toEqual(['s0b', 's0c']);
+    expect(result.pending).toEqual([]);
+  });
+
+  test('reads the audio index embedded in the page instead of fetching it', async ({ page }) => {
+    await page.goto('/');
+
+    const loaded = await page.evaluate(async () => {
+      const manifest = {
+        version: 3, total_files: 1, voice_mappings: {},
+        files: [{ id: '12345678', character: 'narrator', filename: 'narrator_12345678.mp3',
+                  text: 'Hello', clean_text: 'Hello', variants: [] }]
+      };
+      const embedded = document.createElement('script');
+      embedded.type = 'application/json';
+      embedded.id = 'audio-index';
+      embedded.textContent = JSON.stringify({ './audio/manifest.json': manifest });
+      document.body.appendChild(embedded);
+
+      const fetched = [];
+      const realFetch = window.fetch;
+      window.fetch = (url, options) => {
+        fetched.push(String(url));
+        return realFetch(url, options);
+      };
+
+      const audio = new window.MobileAudioSystem();
+      while (!audio.audioManifest) {
+        await new Promise(resolve => setTimeout(resolve, 10));
+      }
+      window.fetch = realFetch;
+      embedded.remove();
+      return { clip: audio.getClipPath('12345678'), fetched };
+    });
+
+    expect(loaded.clip).toBe('./audio/narrator_12345678.mp3');
+    expect(loaded.fetched).not.toContain('./audio/manifest.json');
+    // Not embedded here, so still fetched
+    expect(loaded.fetched).toContain('./audio/timing.json');
+  });
+});
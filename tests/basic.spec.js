@@ -25,4 +25,11 @@ test.describe('Basic Game Functionality', () => {
     const startButton = page.locator('#startBtn');
     await expect(startButton).toHaveText('Start Space Journey!');
   });
+
+  test('space scene should be drawn on a single canvas', async ({ page }) => {
+    await page.goto('/');
+    
+    await expect(page.locator('#gameArea canvas.space-canvas')).toHaveCount(1);
+    await expect(page.locator('.space-star, .asteroid, #spaceship')).toHaveCount(0);
+  });
 });
\ No newline at end of file
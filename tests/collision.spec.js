@@ -0,0 +1,91 @@
+const { test, expect } = require('@playwright/test');
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+function loadCollision() {
+    const context = {};
+    vm.runInNewContext(fs.readFileSync(path.join(__dirname, '..', 'collision.js'), 'utf8') +
+        '\nthis.withinRadius = withinRadius; this.InteractionZones = InteractionZones; this.SpatialGrid = SpatialGrid;', context);
+    return context;
+}
+
+// Same sequence every run, so the benchmark's counts don't change
+function seededRandom(seed) {
+    let state = seed;
+    return () => {
+        state = (state * 1664525 + 1013904223) % 4294967296;
+        return state / 4294967296;
+    };
+}
+
+test('interaction zones match the old distance checks', async () => {
+    const { withinRadius, InteractionZones } = loadCollision();
+    const zones = new InteractionZones();
+    zones.add('sink', 100, 400, 80);
+
+    expect(zones.contains('sink', 100, 400)).toBe(true);
+    expect(zones.contains('sink', 179, 400)).toBe(true);
+    // The old check was distance < 80, so the edge is outside
+    expect(zones.contains('sink', 180, 400)).toBe(false);
+    expect(zones.contains('sink', 160, 460)).toBe(false);
+    expect(zones.contains('table', 100, 400)).toBe(false);
+
+    const random = seededRandom(7);
+    for (let i = 0; i < 1000; i++) {
+        const [ax, ay, bx, by] = [random() * 800, random() * 600, random() * 800, random() * 600];
+        expect(withinRadius(ax, ay, bx, by, 100)).toBe(Math.sqrt(Math.pow(ax - bx, 2) + Math.pow(ay - by, 2)) < 100);
+    }
+
+    zones.clear();
+    expect(zones.contains('sink', 100, 400)).toBe(false);
+});
+
+test('spatial grid finds what a full scan finds with far fewer checks', async () => {
+    const { withinRadius, SpatialGrid } = loadCollision();
+    const random = seededRandom(42);
+    const grid = new SpatialGrid(64);
+    const items = [];
+    for (let i = 0; i < 500; i++) {
+        const item = { x: random() * 800, y: random() * 600 };
+        items.push(item);
+        grid.insert(item, item.x, item.y);
+    }
+
+    let scanChecks = 0;
+    for (let i = 0; i < 1000; i++) {
+        const x = random() * 800;
+        const y = random() * 600;
+        const scanned = items.filter(item => {
+            scanChecks++;
+            return withinRadius(x, y, item.x, item.y, 50);
+        });
+        expect(grid.query(x, y, 50).sort((a, b) => a.x - b.x)).toEqual(scanned.sort((a, b) => a.x - b.x));
+    }
+
+    // Deterministic benchmark: distance checks, not time
+    console.log(`collision checks for 1000 pickups among 500 items: full scan ${scanChecks}, grid ${grid.checks}`);
+    expect(scanChecks).toBe(500000);
+    expect(grid.checks).toBeLessThan(scanChecks / 10);
+});
+
+test('spatial grid forgets removed items', async () => {
+    const { SpatialGrid } = loadCollision();
+    const grid = new SpatialGrid(64);
+    const carrot = {};
+    const corn = {};
+
+    grid.insert(carrot, 100, 120);
+    grid.insert(corn, 110, 120);
+    grid.remove(carrot);
+    expect(grid.query(100, 120, 50)).toEqual([corn]);
+    expect(grid.size).toBe(1);
+
+    // Removing while walking the query's result doesn't skip anything
+    grid.insert(carrot, 100, 120);
+    const reached = grid.query(100, 120, 50);
+    reached.forEach(item => grid.remove(item));
+    expect(reached).toHaveLength(2);
+    expect(grid.size).toBe(0);
+    expect(grid.cells.size).toBe(0);
+});
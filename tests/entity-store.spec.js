@@ -0,0 +1,61 @@
+const { test, expect } = require('@playwright/test');
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+function loadEntityStore() {
+    const context = {};
+    vm.runInNewContext(fs.readFileSync(path.join(__dirname, '..', 'entity-store.js'), 'utf8') +
+        '\nthis.EntityStore = EntityStore;', context);
+    return context.EntityStore;
+}
+
+function fakeElement() {
+    return { style: {} };
+}
+
+test('entity store places once and writes moves as one transform per frame', async () => {
+    const EntityStore = loadEntityStore();
+    const store = new EntityStore();
+    const george = fakeElement();
+    const matilda = fakeElement();
+
+    store.add(george, 100, 120);
+    store.add(matilda, 200, 120);
+    expect(george.style).toEqual({ left: '100px', bottom: '120px', transform: '' });
+
+    // Several moves in one frame only write the last position
+    store.move(george, 115, 120);
+    store.move(george, 130, 135);
+    store.move(matilda, 200, 120);
+    store.flush();
+
+    expect(store.get(george)).toMatchObject({ left: 130, bottom: 135 });
+    expect(george.style.left).toBe('100px');
+    expect(george.style.transform).toBe('translate3d(30px, -15px, 0)');
+    expect(matilda.style.transform).toBe('');
+    expect(store.writes).toBe(1);
+
+    // Nothing moved, nothing written
+    store.flush();
+    expect(store.writes).toBe(1);
+});
+
+test('entity store forgets removed elements', async () => {
+    const EntityStore = loadEntityStore();
+    const store = new EntityStore();
+    const vegetable = fakeElement();
+
+    store.add(vegetable, 300, 120);
+    store.move(vegetable, 310, 120);
+    store.delete(vegetable);
+    store.flush();
+
+    expect(store.get(vegetable)).toBeUndefined();
+    expect(vegetable.style.transform).toBe('');
+    expect(store.writes).toBe(0);
+
+    store.add(fakeElement(), 0, 0);
+    store.clear();
+    expect(store.entities.size).toBe(0);
+});
@@ -0,0 +1,146 @@
+const { test, expect } = require('@playwright/test');
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+// game-clock.js with requestAnimationFrame driven by hand: frames.run(time)
+function loadGameClock() {
+    const pending = new Map();
+    let nextId = 1;
+    const frames = {
+        get pending() { return pending.size; },
+        run(time) {
+            const callbacks = [...pending.values()];
+            pending.clear();
+            callbacks.forEach(callback => callback(time));
+        }
+    };
+    const context = {
+        performance: { now: () => 0 },
+        requestAnimationFrame: callback => { pending.set(nextId, callback); return nextId++; },
+        cancelAnimationFrame: id => pending.delete(id)
+    };
+    vm.runInNewContext(fs.readFileSync(path.join(__dirname, '..', 'game-clock.js'), 'utf8') +
+        '\nthis.GameClock = GameClock; this.FrameScheduler = FrameScheduler;', context);
+    return { GameClock: context.GameClock, FrameScheduler: context.FrameScheduler, frames };
+}
+
+// Steps simulated over `durationMs` of frames arriving every `frameMs`
+function stepsOver(clock, durationMs, frameMs, dropEvery = 0) {
+    let steps = clock.advance(0);
+    const frames = Math.round(durationMs / frameMs);
+    for (let frame = 1; frame <= frames; frame++) {
+        if (dropEvery && frame % dropEvery === 0) continue;
+        steps += clock.advance(frame * frameMs);
+    }
+    return steps;
+}
+
+test('game clock runs the same steps at any refresh rate', async () => {
+    const { GameClock } = loadGameClock();
+    const expected = 3000 / (1000 / 60);
+
+    for (const hz of [30, 60, 120, 144]) {
+        const steps = stepsOver(new GameClock(), 3000, 1000 / hz);
+        expect(Math.abs(steps - expected), `${hz} Hz`).toBeLessThanOrEqual(1);
+    }
+
+    // Dropping every third frame doesn't slow the game down
+    const janky = stepsOver(new GameClock(), 3000, 1000 / 60, 3);
+    expect(Math.abs(janky - expected)).toBeLessThanOrEqual(2);
+});
+
+test('game clock skips long pauses instead of replaying them', async () => {
+    const { GameClock } = loadGameClock();
+    const clock = new GameClock();
+
+    expect(clock.advance(1000)).toBe(0);
+    expect(clock.advance(1000 + 10 * 1000)).toBe(clock.maxStepsPerFrame);
+    expect(clock.alpha).toBeGreaterThanOrEqual(0);
+    expect(clock.alpha).toBeLessThan(1);
+});
+
+test('frame scheduler keeps exactly one loop across scene changes', async () => {
+    const { GameClock, FrameScheduler, frames } = loadGameClock();
+    const scheduler = new FrameScheduler(new GameClock());
+    const calls = [];
+
+    scheduler.run('first', [{ name: 'a', step: () => calls.push('first') }]);
+    scheduler.run('second', [{ name: 'b', step: () => calls.push('second'), frame: () => calls.push('draw') }]);
+    scheduler.run('second', [{ name: 'b', step: () => calls.push('second'), frame: () => calls.push('draw') }]);
+    expect(frames.pending).toBe(1);
+
+    for (let frame = 0; frame <= 3; frame++) frames.run(frame * 17);
+    expect(calls).not.toContain('first');
+    expect(calls.filter(call => call === 'second')).toHaveLength(3);
+    expect(calls.filter(call => call === 'draw')).toHaveLength(4);
+    expect(frames.pending).toBe(1);
+
+    const timings = scheduler.getTimings();
+    expect(timings.scene).toBe('second');
+    expect(timings.systems['second:b'].calls).toBe(7);
+    expect(timings.systems['first:a']).toBeUndefined();
+});
+
+test('frame scheduler stops a scene when it ends itself', async () => {
+    const { GameClock, FrameScheduler, frames } = loadGameClock();
+    const scheduler = new FrameScheduler(new GameClock());
+    let progress = 0;
+    let later = 0;
+
+    scheduler.run('flight', [
+        { name: 'progress', step: () => progress++ },
+        { name: 'later', step: () => later++ }
+    ], () => progress < 3);
+
+    for (let frame = 0; frame <= 10; frame++) frames.run(frame * 17);
+    expect(progress).toBe(3);
+    // The scene ended mid-step, so nothing after it ran
+    expect(later).toBe(2);
+    expect(scheduler.running).toBe(false);
+    expect(frames.pending).toBe(0);
+});
+
+test('frame scheduler sleeps while idle and wakes for one step', async () => {
+    const { GameClock, FrameScheduler, frames } = loadGameClock();
+    const scheduler = new FrameScheduler(new GameClock());
+    let moving = true;
+    let steps = 0;
+
+    scheduler.run('garden', [{ name: 'input', step: () => steps++, idle: () => !moving }]);
+    for (let frame = 0; frame <= 3; frame++) frames.run(frame * 17);
+    expect(frames.pending).toBe(1);
+
+    // Nothing moved: the first frame with a step is the last one asked for
+    moving = false;
+    frames.run(4 * 17);
+    expect(frames.pending).toBe(0);
+    expect(scheduler.getTimings()).toMatchObject({ frames: 5, sleeping: true });
+
+    // A press wakes it, and its first frame already runs a step
+    const before = steps;
+    moving = true;
+    scheduler.wake();
+    frames.run(60000);
+    expect(steps).toBe(before + 1);
+    expect(scheduler.getTimings()).toMatchObject({ wakes: 1, sleeping: false });
+});
+
+test('frame scheduler asks for no frames while suspended', async () => {
+    const { GameClock, FrameScheduler, frames } = loadGameClock();
+    const scheduler = new FrameScheduler(new GameClock());
+    let steps = 0;
+
+    scheduler.run('flight', [{ name: 'flight', step: () => steps++ }]);
+    frames.run(0);
+    scheduler.suspend();
+    expect(frames.pending).toBe(0);
+    scheduler.wake();
+    expect(frames.pending).toBe(0);
+
+    // Back from a long time hidden without replaying it
+    scheduler.resume();
+    frames.run(60000);
+    frames.run(60017);
+    expect(steps).toBe(1);
+});
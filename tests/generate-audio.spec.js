@@ -0,0 +1,74 @@
+const { test, expect } = require('@playwright/test');
+const { execFileSync } = require('child_process');
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+
+const ROOT = path.join(__dirname, '..');
+
+function entry(id, character, text, variants = []) {
+    return { id, character, filename: `${character}_${id}.wav`, text, clean_text: text, variants };
+}
+
+test('a plan run adds its clips to the manifest and timing table instead of replacing them', async () => {
+    const audioDir = fs.mkdtempSync(path.join(os.tmpdir(), 'generate-audio-'));
+    const kept = entry('aaaaaaaa', 'george', 'Hello there', [
+        { filename: 'george_aaaaaaaa.webm', type: 'audio/webm; codecs=opus', kbps: 24, bytes: 1200 }
+    ]);
+    const replaced = entry('bbbbbbbb', 'matilda', 'Old words', kept.variants.map(variant =>
+        ({ ...variant, filename: 'matilda_bbbbbbbb.webm' })));
+    fs.writeFileSync(path.join(audioDir, 'manifest.json'), JSON.stringify({
+        version: 3, generated_at: '2024-01-01T00:00:00Z', total_files: 2,
+        voice_mappings: { george: 'g', matilda: 'm' }, files: [kept, replaced]
+    }));
+    fs.writeFileSync(path.join(audioDir, 'timing.json'), JSON.stringify({
+        version: 1, clips: { 'george_aaaaaaaa.wav': [900, 0, 400], 'matilda_bbbbbbbb.wav': [800, 0, 300] }
+    }));
+
+    // Two planned lines: one new clip, and a new voicing of an existing one
+    const plan = path.join(audioDir, 'plan.json');
+    fs.writeFileSync(plan, JSON.stringify({ jobs: [
+        { id: 'cccccccc', character: 'narrator', text: 'The moon', clean_text: 'The moon' },
+        { id: 'bbbbbbbb', character: 'matilda', text: 'New words here', clean_text: 'New words here' }
+    ] }));
+
+    execFileSync('python3', ['generate_audio.py', '--backend', 'tone', '--output-dir', audioDir, '--plan', plan],
+        { cwd: ROOT, stdio: 'pipe' });
+
+    const manifest = JSON.parse(fs.readFileSync(path.join(audioDir, 'manifest.json'), 'utf8'));
+    const timing = JSON.parse(fs.readFileSync(path.join(audioDir, 'timing.json'), 'utf8'));
+    fs.rmSync(audioDir, { recursive: true });
+
+    expect(manifest.total_files).toBe(3);
+    expect(manifest.files.map(file => file.filename)).toEqual(
+        ['george_aaaaaaaa.wav', 'matilda_bbbbbbbb.wav', 'narrator_cccccccc.wav']);
+    expect(manifest.files[0]).toEqual(kept);
+    expect(manifest.files[1].text).toBe('New words here');
+    expect(manifest.files[1].variants).toEqual(replaced.variants);
+    expect(Object.keys(manifest.voice_mappings)).toEqual(expect.arrayContaining(['george', 'matilda', 'narrator']));
+
+    expect(Object.keys(timing.clips).sort()).toEqual(
+        ['george_aaaaaaaa.wav', 'matilda_bbbbbbbb.wav', 'narrator_cccccccc.wav']);
+    expect(timing.clips['george_aaaaaaaa.wav']).toEqual([900, 0, 400]);
+    expect(timing.clips['matilda_bbbbbbbb.wav']).toHaveLength(4);
+});
+
+test('a tone backend run writes a manifest that passes validation', async () => {
+    // Voices every line of dialogue_data.json, which takes a couple of seconds
+    test.setTimeout(30000);
+    const audioDir = fs.mkdtempSync(path.join(os.tmpdir(), 'generate-audio-'));
+
+    execFileSync('python3', ['generate_audio.py', '--backend', 'tone', '--output-dir', audioDir],
+        { cwd: ROOT, stdio: 'pipe' });
+    let validation;
+    try {
+        validation = execFileSync('python3', ['audio_manifest.py', 'validate', path.join(audioDir, 'manifest.json')],
+            { cwd: ROOT, encoding: 'utf8' });
+    } catch (error) {
+        validation = error.stdout;
+    } finally {
+        fs.rmSync(audioDir, { recursive: true });
+    }
+
+    expect(validation).toContain('✅');
+});
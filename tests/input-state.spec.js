@@ -0,0 +1,65 @@
+const { test, expect } = require('@playwright/test');
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+function loadInputState() {
+    const context = { performance: { now: () => 0 } };
+    vm.runInNewContext(fs.readFileSync(path.join(__dirname, '..', 'input-state.js'), 'utf8') +
+        '\nthis.InputState = InputState;', context);
+    return context.InputState;
+}
+
+// Distance moved over `steps` fixed 60 Hz steps
+function travel(input, steps, speed) {
+    let x = 0;
+    let y = 0;
+    for (let step = 0; step < steps; step++) {
+        const { dx, dy } = input.update(1 / 60, speed);
+        x += dx;
+        y += dy;
+    }
+    return { x, y };
+}
+
+test('held direction accelerates to speed and eases off on release', async () => {
+    const InputState = loadInputState();
+    const input = new InputState({ acceleration: 3000 });
+
+    input.press(input.directionFor('ArrowRight'));
+    // Moving from the first step, not after a repeat delay
+    expect(input.update(1 / 60, 300).dx).toBeGreaterThan(0);
+    travel(input, 59, 300);
+    expect(input.velocityX).toBe(300);
+
+    // A second of holding covers about a second at full speed
+    const held = travel(input, 60, 300);
+    expect(held.x).toBeCloseTo(300, 5);
+    expect(held.y).toBe(0);
+
+    input.release('right');
+    const coasting = travel(input, 60, 300);
+    expect(coasting.x).toBeGreaterThan(0);
+    expect(coasting.x).toBeLessThan(20);
+    expect(input.moving).toBe(false);
+});
+
+test('opposite directions cancel and diagonals are not faster', async () => {
+    const InputState = loadInputState();
+    const input = new InputState();
+
+    input.press('left');
+    input.press('right');
+    expect(travel(input, 30, 300)).toEqual({ x: 0, y: 0 });
+
+    input.releaseAll();
+    input.press('up');
+    input.press('right');
+    travel(input, 60, 300);
+    expect(Math.hypot(input.velocityX, input.velocityY)).toBeCloseTo(300, 5);
+    expect(input.velocityY).toBeGreaterThan(0);
+
+    input.stop();
+    expect(input.velocityX).toBe(0);
+    expect(input.directionFor(' ')).toBeNull();
+});
@@ -0,0 +1,13 @@
+const { test, expect } = require('@playwright/test');
+
+test.describe('Logging', () => {
+  test('debug output is off unless the page is opened with ?debug=1', async ({ page }) => {
+    await page.goto('/');
+    expect(await page.evaluate(() => window.log.level)).toBe('info');
+    expect(await page.evaluate(() => window.log.enabled('debug'))).toBe(false);
+
+    await page.goto('/?debug=1');
+    expect(await page.evaluate(() => window.log.level)).toBe('debug');
+    expect(await page.evaluate(() => window.log.enabled('debug'))).toBe(true);
+  });
+});
@@ -0,0 +1,48 @@
+const { test, expect } = require('@playwright/test');
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+function loadNodePool() {
+    const context = {};
+    vm.runInNewContext(fs.readFileSync(path.join(__dirname, '..', 'node-pool.js'), 'utf8') +
+        '\nthis.NodePool = NodePool;', context);
+    return context.NodePool;
+}
+
+function fakeNode() {
+    return { attached: true, className: 'vegetable', remove() { this.attached = false; } };
+}
+
+test('node pool stops creating nodes once it has warmed up', async () => {
+    const NodePool = loadNodePool();
+    const pool = new NodePool('vegetable', fakeNode, node => { node.className = 'vegetable'; });
+    const onScreen = [];
+
+    // A garden round: a vegetable spawns each tick and the oldest goes after three
+    for (let tick = 0; tick < 100; tick++) {
+        onScreen.push(pool.acquire());
+        if (onScreen.length > 3) pool.release(onScreen.shift());
+    }
+
+    expect(pool.stats()).toEqual({ name: 'vegetable', inUse: 3, free: 1, created: 4, reused: 96, peakInUse: 4 });
+});
+
+test('node pool resets released nodes and ignores ones it did not hand out', async () => {
+    const NodePool = loadNodePool();
+    const pool = new NodePool('vegetable', fakeNode, node => { node.className = 'vegetable'; });
+    const vegetable = pool.acquire();
+    vegetable.className = 'vegetable collected';
+
+    pool.release(vegetable);
+    pool.release(vegetable);
+    pool.release(fakeNode());
+    expect(vegetable.attached).toBe(false);
+    expect(vegetable.className).toBe('vegetable');
+    expect(pool.stats().free).toBe(1);
+
+    expect(pool.acquire()).toBe(vegetable);
+    pool.acquire();
+    pool.releaseAll();
+    expect(pool.stats()).toMatchObject({ inUse: 0, free: 2, created: 2 });
+});
@@ -0,0 +1,108 @@
+const { test, expect } = require('@playwright/test');
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+function loadQuality() {
+    const context = { log: { info() {} } };
+    vm.runInNewContext(fs.readFileSync(path.join(__dirname, '..', 'quality.js'), 'utf8') +
+        '\nthis.QualityController = QualityController;', context);
+    return context.QualityController;
+}
+
+// `windows` windows of 60 frames, `slow` of them `slowMs` each and the rest `frameMs`
+function play(quality, windows, slow, frameMs = 16, slowMs = 40) {
+    for (let window = 0; window < windows; window++) {
+        for (let frame = 0; frame < 60; frame++) quality.sample(frame < slow ? slowMs : frameMs);
+    }
+}
+
+// A controller that has measured a 60 Hz display from its first window
+function at60Hz(QualityController, options) {
+    const quality = new QualityController(options);
+    play(quality, 1, 0);
+    return quality;
+}
+
+test('quality steps down on slow frames and back up only after calm windows', async () => {
+    const QualityController = loadQuality();
+    const tiers = [];
+    const quality = at60Hz(QualityController, { onChange: settings => tiers.push(settings.name) });
+    expect(quality.tier).toBe('high');
+    expect(quality.slowFrameMs).toBeCloseTo(1000 / 60 * 1.4);
+
+    play(quality, 1, 20);
+    expect(quality.tier).toBe('medium');
+    play(quality, 5, 30);
+    expect(quality.tier).toBe('low');
+    expect(quality.settings).toMatchObject({ transitions: false, spawnScale: 2 });
+
+    // Borderline windows neither go down further nor count as calm
+    play(quality, 2, 0);
+    play(quality, 1, 5);
+    play(quality, 2, 0);
+    expect(quality.tier).toBe('low');
+    play(quality, 1, 0);
+    expect(quality.tier).toBe('medium');
+    expect(tiers).toEqual(['medium', 'low', 'medium']);
+});
+
+test('quality waits longer before retrying a step up that had to be undone', async () => {
+    const QualityController = loadQuality();
+    const quality = at60Hz(QualityController);
+
+    play(quality, 1, 20);
+    play(quality, 3, 0);
+    expect(quality.tier).toBe('high');
+    play(quality, 1, 20);
+    expect(quality.tier).toBe('medium');
+
+    play(quality, 5, 0);
+    expect(quality.tier).toBe('medium');
+    play(quality, 1, 0);
+    expect(quality.tier).toBe('high');
+});
+
+test('a steady 30 Hz display stays on high quality', async () => {
+    const QualityController = loadQuality();
+    const quality = new QualityController();
+
+    // 33ms frames with a little jitter, for as long as 20 windows
+    for (let frame = 0; frame < 1200; frame++) quality.sample(frame % 2 ? 31.5 : 35);
+    expect(quality.tier).toBe('high');
+    expect(quality.slowFrameMs).toBeCloseTo(1000 / 30 * 1.4);
+
+    // Dropping to 15 fps there is slow
+    play(quality, 1, 20, 33, 67);
+    expect(quality.tier).toBe('medium');
+});
+
+test('a phone that is slow from its first frame still steps down', async () => {
+    const QualityController = loadQuality();
+
+    // A 60 Hz phone that never manages better than 20 fps
+    const steady = new QualityController();
+    for (let frame = 0; frame < 600; frame++) steady.sample(50);
+    expect(steady.tier).toBe('low');
+
+    // And one whose frames wander between 45 and 55ms
+    const janky = new QualityController();
+    for (let frame = 0; frame < 600; frame++) janky.sample(45 + (frame * 7) % 11);
+    expect(janky.tier).not.toBe('high');
+    expect(janky.report().changes.length).toBeGreaterThan(0);
+});
+
+test('quality report has the tier and a frame-time histogram', async () => {
+    const QualityController = loadQuality();
+    const quality = new QualityController();
+
+    // A frame after a pause reports 0 and isn't counted
+    [0, 8, 16, 16, 20, 30, 40, 60, 200].forEach(frameMs => quality.sample(frameMs));
+    const report = quality.report();
+
+    expect(report.tier).toBe('high');
+    expect(report.frames).toBe(8);
+    expect(report.histogram.map(bucket => bucket.count)).toEqual([1, 2, 1, 1, 1, 1, 1]);
+    expect(report.histogram[0].upToMs).toBe(8.5);
+    expect(report.changes).toEqual([]);
+});
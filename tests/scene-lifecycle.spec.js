@@ -0,0 +1,132 @@
+const { test, expect } = require('@playwright/test');
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+const root = path.join(__dirname, '..');
+
+function loadLifecycle() {
+    const context = { setTimeout, clearTimeout, setInterval, clearInterval, performance, log: { debug() {} } };
+    context.requestAnimationFrame = callback => setTimeout(() => callback(performance.now()), 16);
+    context.cancelAnimationFrame = id => clearTimeout(id);
+    vm.runInNewContext(['game-clock.js', 'scene-lifecycle.js']
+        .map(name => fs.readFileSync(path.join(root, name), 'utf8')).join('\n') +
+        '\nthis.GameClock = GameClock; this.FrameScheduler = FrameScheduler; this.SceneLifecycle = SceneLifecycle;', context);
+    return context;
+}
+
+function fakeTarget() {
+    const listeners = new Set();
+    return {
+        listeners,
+        addEventListener: (type, handler) => listeners.add(handler),
+        removeEventListener: (type, handler) => listeners.delete(handler)
+    };
+}
+
+test('entering a scene cancels what the last one left running', async () => {
+    const { GameClock, FrameScheduler, SceneLifecycle } = loadLifecycle();
+    const scheduler = new FrameScheduler(new GameClock());
+    const lifecycle = new SceneLifecycle(scheduler);
+    let fired = 0;
+
+    const garden = lifecycle.enter('garden');
+    // A spawner that reschedules itself forever, like spawnVegetables
+    const spawn = () => garden.setTimeout(() => { fired++; spawn(); }, 5);
+    spawn();
+    garden.setInterval(() => fired++, 5);
+    garden.requestAnimationFrame(() => fired++);
+    const button = fakeTarget();
+    garden.listen(button, 'click', () => fired++);
+    scheduler.run('garden', [{ name: 'follow', step: () => {} }]);
+
+    expect(garden.pending()).toEqual({ timeouts: 1, intervals: 1, frames: 1, listeners: 1 });
+
+    lifecycle.enter('kitchen');
+    const firedAtExit = fired;
+    await new Promise(resolve => setTimeout(resolve, 50));
+
+    expect(fired).toBe(firedAtExit);
+    expect(button.listeners.size).toBe(0);
+    expect(scheduler.running).toBe(false);
+    // A stale callback can't register more work on the ended scene
+    expect(garden.setTimeout(() => fired++, 1)).toBeNull();
+
+    const report = lifecycle.leakReport();
+    expect(report.scene).toBe('kitchen');
+    expect(report.pending).toEqual({ timeouts: 0, intervals: 0, frames: 0, listeners: 0 });
+    expect(report.cancelledOnExit).toMatchObject({ timeouts: 1, intervals: 1, frames: 1, listeners: 1 });
+    expect(report.recent.map(entry => entry.scene)).toEqual(['garden']);
+});
+
+test('script.js clears the game area only by entering a scene', async () => {
+    const script = fs.readFileSync(path.join(root, 'script.js'), 'utf8');
+    const clears = script.match(/this\.gameArea\.innerHTML = ''/g) || [];
+
+    // The one left is enterScene() itself
+    expect(clears).toHaveLength(1);
+    expect(script).toMatch(/enterScene\(name\) \{\s*this\.scene = this\.lifecycle\.enter\(name\);\s*this\.gameArea\.innerHTML = '';/);
+});
+
+test('a suspended scene holds its timers until it resumes', async () => {
+    const { GameClock, FrameScheduler, SceneLifecycle } = loadLifecycle();
+    const scheduler = new FrameScheduler(new GameClock());
+    const lifecycle = new SceneLifecycle(scheduler);
+    const fired = [];
+
+    const garden = lifecycle.enter('garden');
+    garden.setTimeout(() => fired.push('timeout'), 30);
+    garden.setInterval(() => fired.push('interval'), 10);
+    lifecycle.suspend();
+    // Scheduled while hidden: held too
+    garden.setTimeout(() => fired.push('later'), 5);
+    await new Promise(resolve => setTimeout(resolve, 60));
+    expect(fired).toEqual([]);
+    expect(garden.pending()).toMatchObject({ timeouts: 2, intervals: 1 });
+
+    // A scene entered while hidden starts held
+    const kitchen = lifecycle.enter('kitchen');
+    kitchen.setTimeout(() => fired.push('kitchen'), 5);
+    await new Promise(resolve => setTimeout(resolve, 20));
+    expect(fired).toEqual([]);
+
+    lifecycle.resume();
+    await new Promise(resolve => setTimeout(resolve, 20));
+    expect(fired).toEqual(['kitchen']);
+    lifecycle.enter('bedroom');
+});
+
+test('a scene script awaiting a delay stops when its scene ends', async () => {
+    const { GameClock, FrameScheduler, SceneLifecycle } = loadLifecycle();
+    const scheduler = new FrameScheduler(new GameClock());
+    const lifecycle = new SceneLifecycle(scheduler);
+    const steps = [];
+
+    const garden = lifecycle.enter('garden');
+    const script = async (scene) => {
+        await scene.delay(5);
+        steps.push('first');
+        await scene.delay(30);
+        steps.push('second');
+    };
+    script(garden);
+    await new Promise(resolve => setTimeout(resolve, 15));
+    expect(steps).toEqual(['first']);
+    expect(garden.pending().timeouts).toBe(1);
+
+    lifecycle.enter('kitchen');
+    await new Promise(resolve => setTimeout(resolve, 40));
+    expect(steps).toEqual(['first']);
+    expect(lifecycle.leakReport().cancelledOnExit.timeouts).toBe(1);
+
+    // Held while the page is hidden, like any other scene timer
+    const kitchen = lifecycle.scope;
+    kitchen.delay(5).then(() => steps.push('kitchen'));
+    lifecycle.suspend();
+    await new Promise(resolve => setTimeout(resolve, 20));
+    expect(steps).toEqual(['first']);
+    lifecycle.resume();
+    await new Promise(resolve => setTimeout(resolve, 20));
+    expect(steps).toEqual(['first', 'kitchen']);
+    lifecycle.enter('bedroom');
+});
@@ -0,0 +1,52 @@
+const { test, expect } = require('@playwright/test');
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+const root = path.join(__dirname, '..');
+
+function loadTimelines() {
+    const window = {};
+    vm.runInNewContext(fs.readFileSync(path.join(root, 'scene-timelines.js'), 'utf8'), { window });
+    return window.SCENE_TIMELINES;
+}
+
+test('every scene script is compiled into scene-timelines.js', async () => {
+    const timelines = loadTimelines();
+    const scenes = fs.readdirSync(path.join(root, 'scenes'))
+        .filter(name => name.endsWith('.json') && name !== 'styles.json')
+        .map(name => name.replace(/\.json$/, ''));
+
+    expect(Object.keys(timelines).sort()).toEqual(scenes.sort());
+
+    // Each scene must be called from the game
+    const script = fs.readFileSync(path.join(root, 'script.js'), 'utf8');
+    for (const name of scenes) {
+        expect(script, `script.js should run scene ${name}`).toContain(`this.runScene('${name}')`);
+    }
+});
+
+test('compiled scene lines play clips from the manifest', async () => {
+    const timelines = loadTimelines();
+    const manifest = JSON.parse(fs.readFileSync(path.join(root, 'audio', 'manifest.json'), 'utf8'));
+    const clips = new Map(manifest.files.map(file => [file.id, file]));
+
+    for (const [name, scene] of Object.entries(timelines)) {
+        const says = scene.timeline.filter(([op]) => op === 'say');
+        expect(says.length, `${name} should speak`).toBe(scene.lines.length);
+
+        for (const [, text, character, clipId] of says) {
+            expect(clips.has(clipId), `${name}: no clip for "${text}"`).toBe(true);
+            expect(clips.get(clipId).character).toBe(character);
+        }
+
+        for (const [op, start, end] of scene.timeline) {
+            if (op !== 'show') continue;
+            expect(start).toBeLessThanOrEqual(end);
+            expect(end).toBeLessThanOrEqual(scene.elements.length);
+        }
+        for (const [, style] of scene.elements) {
+            expect(scene.styles[style]).toBeDefined();
+        }
+    }
+});
@@ -0,0 +1,77 @@
+const { test, expect } = require('@playwright/test');
+const { execFileSync } = require('child_process');
+const path = require('path');
+
+// A small game class with two chunked scenes, each run through runScene()
+function gameSource(extraMethods = '') {
+    return `class MoonVegetableGame {
+    constructor() {
+        this.showTitle();
+    }
+
+    showTitle() {
+    }
+
+    async runScene(name) {
+        await this[name]();
+    }
+
+    async startGarden() {
+        await this.runScene('garden');
+    }
+
+    async startKitchen() {
+        await this.runScene('kitchen');
+    }
+
+    plantSeeds() {
+    }
+
+    washDishes() {
+    }
+${extraMethods}}
+`;
+}
+
+const CHUNKS = [['garden', ['startGarden']], ['kitchen', ['startKitchen']]];
+
+// Splits source with the given scene scripts; { assignment } or { error }
+function split(scenes, source) {
+    const script = `
+import json, sys
+from split_script import assign_chunks, parse_methods, split
+source, chunks, scenes = json.loads(sys.stdin.read())
+try:
+    split(source, chunks, scenes)
+    print(json.dumps({'assignment': assign_chunks(parse_methods(source, scenes), chunks)}))
+except ValueError as error:
+    print(json.dumps({'error': str(error)}))
+`;
+    const output = execFileSync('python3', ['-c', script], {
+        cwd: path.join(__dirname, '..'),
+        input: JSON.stringify([source, CHUNKS, scenes])
+    });
+    return JSON.parse(output);
+}
+
+test('methods only a scene script calls go to the chunk that runs the scene', async () => {
+    const result = split({ garden: ['plantSeeds'], kitchen: ['washDishes'] }, gameSource());
+
+    expect(result.error).toBeUndefined();
+    expect(result.assignment).toEqual({
+        startGarden: 'garden', plantSeeds: 'garden',
+        startKitchen: 'kitchen', washDishes: 'kitchen'
+    });
+});
+
+test('a scene run from the core cannot call a method in a lazy chunk', async () => {
+    // A replay button in the core runs the garden scene again
+    const replay = `
+    replayGarden() {
+        this.runScene('garden');
+    }
+`;
+    const result = split({ garden: ['plantSeeds'], kitchen: ['washDishes'] }, gameSource(replay));
+
+    expect(result.error).toContain("replayGarden() runs a scene that calls plantSeeds() in the garden chunk");
+});
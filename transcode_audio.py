@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Transcode every clip into smaller codec variants
+
+The ElevenLabs clips are 128 kbps MP3, far more than short speech needs.
+This writes Opus (WebM and Ogg containers) and AAC versions of each clip next
+to the original, in parallel, and lists them as `variants` in the manifest.
+Each codec gets a small bitrate ladder (low / medium / high tier). The game
+uses the codec with the smallest files the browser can play and picks the
+tier from its measured download speed (see MobileAudioSystem.pickVariant
+in audio-system.js); the original file stays as the fallback.
+
+Needs ffmpeg with libopus. Outputs newer than their source are skipped, so
+re-running after generating a few new lines only transcodes those.
+"""
+import argparse
+import os
+import shutil
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from audio_clips import clip_timing
+from audio_manifest import ClipVariant, load, save
+
+# codec name -> container extension, MIME type for canPlayType, ffmpeg args,
+# bitrate ladder in kbps (low, medium, high tier)
+CODECS = {
+    'opus-webm': ('webm', 'audio/webm; codecs="opus"', ['-c:a', 'libopus', '-application', 'voip'], (12, 24, 48)),
+    'opus-ogg': ('ogg', 'audio/ogg; codecs="opus"', ['-c:a', 'libopus', '-application', 'voip'], (12, 24, 48)),
+    'aac': ('m4a', 'audio/mp4; codecs="mp4a.40.2"', ['-c:a', 'aac'], (32, 48, 96)),
+}
+
+TIER_NAMES = ('low', 'medium', 'high')
+
+SOURCE_TYPES = {
+    'mp3': 'audio/mpeg',
+    'wav': 'audio/wav',
+}
+
+
+def variant_filename(source_filename, extension, kbps):
+    """narrator_1234abcd.mp3 -> narrator_1234abcd.24k.webm"""
+    stem = source_filename.rsplit('.', 1)[0]
+    return f"{stem}.{kbps}k.{extension}"
+
+
+def transcode_clip(source, target, codec_args, kbps, force=False):
+    """Encode one variant; returns True if ffmpeg ran, False if it was up to date"""
+    if not force and target.exists() and target.stat().st_mtime >= source.stat().st_mtime:
+        return False
+
+    subprocess.run(['ffmpeg', '-loglevel', 'error', '-y', '-i', str(source), '-vn', '-ac', '1',
+                    *codec_args, '-b:a', f'{kbps}k', str(target)], check=True)
+    return True
+
+
+def source_variant(path, clean_text):
+    """The original clip, described as a variant"""
+    duration_ms = clip_timing(path, clean_text)['duration_ms']
+    size = path.stat().st_size
+    kbps = round(size * 8 / duration_ms) if duration_ms else 0
+    return ClipVariant(path.name, SOURCE_TYPES.get(path.suffix[1:], 'audio/mpeg'), kbps, size)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Transcode clips into Opus/AAC variants listed in the manifest')
+    parser.add_argument('--audio-dir', default='audio')
+    parser.add_argument('--codecs', default=','.join(CODECS),
+                        help=f"comma-separated subset of: {', '.join(CODECS)}")
+    parser.add_argument('--tiers', default=','.join(TIER_NAMES),
+                        help='comma-separated subset of the ladder: low, medium, high')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 4,
+                        help='parallel ffmpeg processes')
+    parser.add_argument('--force', action='store_true', help='re-encode even if a variant is up to date')
+    args = parser.parse_args()
+
+    if not shutil.which('ffmpeg'):
+        print("❌ ffmpeg not found. Install it (with libopus) to build codec variants.")
+        return
+
+    codecs = [name.strip() for name in args.codecs.split(',') if name.strip()]
+    unknown = [name for name in codecs if name not in CODECS]
+    if unknown:
+        print(f"❌ Unknown codec(s): {', '.join(unknown)}")
+        return
+
+    tiers = [TIER_NAMES.index(name.strip()) for name in args.tiers.split(',') if name.strip() in TIER_NAMES]
+    if not tiers:
+        print(f"❌ --tiers needs at least one of: {', '.join(TIER_NAMES)}")
+        return
+
+    audio_dir = Path(args.audio_dir)
+    manifest_path = audio_dir / 'manifest.json'
+    manifest = load(manifest_path)
+
+    # One set of variants per clip file, even when several entries share it
+    sources = {}
+    for entry in manifest.files:
+        path = audio_dir / entry.filename
+        if path.exists():
+            sources.setdefault(entry.filename, (path, entry.clean_text))
+
+    # (codec name, kbps) for every variant to build
+    ladder = [(name, CODECS[name][3][tier]) for name in codecs for tier in tiers]
+
+    jobs = []
+    for filename, (path, _) in sources.items():
+        for name, kbps in ladder:
+            extension, _, codec_args, _ = CODECS[name]
+            jobs.append((path, audio_dir / variant_filename(filename, extension, kbps), codec_args, kbps))
+
+    print(f"🎚️ Transcoding {len(sources)} clips into {len(ladder)} variants "
+          f"({len(codecs)} codecs x {len(tiers)} tiers) with {args.workers} workers...")
+    started = time.perf_counter()
+    failed = 0
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        futures = [pool.submit(transcode_clip, *job, force=args.force) for job in jobs]
+        encoded = 0
+        for (source, target, _, _), future in zip(jobs, futures):
+            try:
+                encoded += future.result()
+            except subprocess.CalledProcessError as e:
+                print(f"❌ Failed to encode {target.name}: {e}")
+                failed += 1
+    elapsed = time.perf_counter() - started
+
+    variants_by_file = {}
+    for filename, (path, clean_text) in sources.items():
+        variants = [source_variant(path, clean_text)]
+        for name, kbps in ladder:
+            extension, mime_type, _, _ = CODECS[name]
+            target = audio_dir / variant_filename(filename, extension, kbps)
+            if target.exists():
+                variants.append(ClipVariant(target.name, mime_type, kbps, target.stat().st_size))
+        variants_by_file[filename] = sorted(variants, key=lambda variant: variant.bytes)
+
+    for entry in manifest.files:
+        entry.variants = variants_by_file.get(entry.filename, [])
+    save(manifest, manifest_path)
+
+    original_bytes = sum(path.stat().st_size for path, _ in sources.values())
+    smallest_bytes = sum(variants[0].bytes for variants in variants_by_file.values())
+    print(f"\n🎉 Transcoding complete!")
+    print(f"   ✅ Encoded: {encoded} ({len(jobs) - encoded - failed} already up to date)")
+    print(f"   ❌ Failed: {failed}")
+    print(f"   ⏱️  {elapsed:.2f}s")
+    if original_bytes:
+        print(f"   📦 Smallest variants: {smallest_bytes / 1024:.0f} KB vs {original_bytes / 1024:.0f} KB original "
+              f"({100 - smallest_bytes * 100 // original_bytes}% smaller)")
+    print(f"📋 Manifest updated: {manifest_path}")
+
+
+if __name__ == '__main__':
+    main()
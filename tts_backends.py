@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Text-to-speech backends for the audio pipeline
+
+Every backend turns (text, character) into encoded audio bytes:
+
+- ElevenLabsBackend - the real voices, needs network and an API key
+- EspeakBackend     - local espeak-ng, works offline
+- ToneBackend       - deterministic tone bursts, one per word; no
+                      dependencies at all, so the whole generate -> manifest
+                      pipeline can run on an air-gapped CI box
+
+Pick one with get_backend('elevenlabs' | 'espeak' | 'tone').
+
+Backends can also return raw 16-bit mono PCM (synthesize_pcm) for several
+lines joined with pauses (join_lines), which is what batch generation uses
+to voice a whole exchange in one request and split it afterwards.
+"""
+import array
+import base64
+import hashlib
+import io
+import json
+import math
+import os
+import re
+import shutil
+import struct
+import subprocess
+import wave
+from abc import ABC, abstractmethod
+
+ELEVENLABS_URL = "https://api.elevenlabs.io/v1/text-to-speech"
+ELEVENLABS_MODEL_ID = "eleven_monolingual_v1"
+ELEVENLABS_PCM_FORMAT = "pcm_22050"
+
+# Pause markup between joined lines; ElevenLabs and espeak-ng (SSML mode)
+# both honour it, and ToneBackend renders it as silence
+BREAK_PATTERN = re.compile(r'<break\s+time="(\d+(?:\.\d+)?)(ms|s)"\s*/>')
+
+# Voice mappings for different characters
+VOICE_IDS = {
+    'narrator': 'pNInz6obpgDQGcFmaJgB',  # Adam - clear, friendly narrator voice
+    'george': 'VR6AewLTigWG4xSOukaG',    # Josh - young, energetic male voice
+    'matilda': 'jsCqWAovK2LkecY7zXl4',   # Jessica - young, cheerful female voice
+    'moondog': 'cgSgspJ2msm6clMCkdW9'    # Brian - warm, friendly character voice
+}
+
+
+class TTSError(Exception):
+    """Raised when a backend can't produce audio for a line"""
+
+
+def get_api_key():
+    """Get ElevenLabs API key from the environment, falling back to ~/.zshrc"""
+    api_key = os.environ.get('ELEVENLABS_API_KEY')
+    if api_key:
+        return api_key
+
+    zshrc_path = os.path.expanduser('~/.zshrc')
+    try:
+        with open(zshrc_path, 'r') as f:
+            content = f.read()
+    except FileNotFoundError:
+        return None
+
+    match = re.search(r'export ELEVENLABS_API_KEY="([^"]+)"', content)
+    if match:
+        return match.group(1)
+
+    match = re.search(r'ELEVENLABS_API_KEY=([^\s\n]+)', content)
+    if match:
+        return match.group(1).strip('"\'')
+
+    return None
+
+
+def pcm_to_wav(samples, sample_rate):
+    """Encode 16-bit mono PCM bytes as a WAV file"""
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(samples)
+    return buffer.getvalue()
+
+
+def wav_to_pcm(data):
+    """Decode WAV bytes to (16-bit mono PCM, sample_rate)"""
+    with wave.open(io.BytesIO(data), 'rb') as wav_file:
+        if wav_file.getsampwidth() != 2:
+            raise TTSError("Only 16-bit WAV is supported")
+        channels = wav_file.getnchannels()
+        sample_rate = wav_file.getframerate()
+        frames = wav_file.readframes(wav_file.getnframes())
+
+    if channels == 1:
+        return frames, sample_rate
+
+    samples = array.array('h', frames)
+    mono = array.array('h', (sum(samples[i:i + channels]) // channels
+                             for i in range(0, len(samples), channels)))
+    return mono.tobytes(), sample_rate
+
+
+class TTSBackend(ABC):
+    """Base class - subclasses implement voice_mappings(), synthesize() and
+    synthesize_pcm(); subclasses missing these methods raise TypeError when
+    constructed"""
+
+    name = 'base'
+    extension = 'mp3'
+    requires_network = False
+
+    @abstractmethod
+    def voice_mappings(self):
+        """Character -> voice identifier, recorded in the manifest"""
+
+    @abstractmethod
+    def synthesize(self, text, character):
+        """Return encoded audio bytes for text spoken by character"""
+
+    @abstractmethod
+    def synthesize_pcm(self, text, character):
+        """Return (16-bit mono PCM, sample_rate) for text spoken by character"""
+
+    def synthesize_with_timestamps(self, text, character):
+        """Return (audio bytes, word start times in ms or None).
+
+        None means the engine has no alignment data; the pipeline then
+        aligns words from the audio itself (audio_clips.clip_timing).
+        """
+        return self.synthesize(text, character), None
+
+    def join_lines(self, lines, pause_ms):
+        """Join several lines into one request, separated by pause_ms of silence"""
+        return f' <break time="{pause_ms / 1000:.1f}s" /> '.join(lines)
+
+
+class ElevenLabsBackend(TTSBackend):
+    """ElevenLabs text-to-speech API"""
+
+    name = 'elevenlabs'
+    extension = 'mp3'
+    requires_network = True
+
+    def __init__(self, api_key=None, voice_ids=None, model_id=ELEVENLABS_MODEL_ID, timeout=30):
+        self.api_key = api_key or get_api_key()
+        self.voice_ids = voice_ids or VOICE_IDS
+        self.model_id = model_id
+        self.timeout = timeout
+
+    def voice_mappings(self):
+        return dict(self.voice_ids)
+
+    def request(self, text, character, accept, params=None, endpoint=''):
+        """POST one text-to-speech request and return the response body"""
+        import requests
+
+        if not self.api_key:
+            raise TTSError("ELEVENLABS_API_KEY environment variable not set")
+
+        voice_id = self.voice_ids.get(character)
+        if not voice_id:
+            raise TTSError(f"No voice ID configured for character: {character}")
+
+        headers = {
+            "Accept": accept,
+            "Content-Type": "application/json",
+            "xi-api-key": self.api_key
+        }
+        data = {
+            "text": text,
+            "model_id": self.model_id,
+            "voice_settings": {
+                "stability": 0.5,
+                "similarity_boost": 0.5,
+                "style": 0.0,
+                "use_speaker_boost": True
+            }
+        }
+
+        response = requests.post(f"{ELEVENLABS_URL}/{voice_id}{endpoint}", json=data, headers=headers,
+                                 params=params, timeout=self.timeout)
+        if response.status_code != 200:
+            raise TTSError(f"{response.status_code} - {response.text}")
+        return response.content
+
+    def synthesize(self, text, character):
+        return self.request(text, character, "audio/mpeg")
+
+    def synthesize_pcm(self, text, character):
+        pcm = self.request(text, character, "audio/pcm", params={"output_format": ELEVENLABS_PCM_FORMAT})
+        return pcm, int(ELEVENLABS_PCM_FORMAT.split('_')[1])
+
+    def synthesize_with_timestamps(self, text, character):
+        body = json.loads(self.request(text, character, "application/json", endpoint="/with-timestamps"))
+        alignment = body.get('alignment') or {}
+        starts = alignment.get('character_start_times_seconds') or []
+
+        # A word starts at every non-space character that follows a space
+        word_starts = []
+        previous = ' '
+        for char, start in zip(alignment.get('characters') or [], starts):
+            if not char.isspace() and previous.isspace():
+                word_starts.append(round(start * 1000))
+            previous = char
+
+        if len(word_starts) != len(text.split()):
+            word_starts = None
+        return base64.b64decode(body['audio_base64']), word_starts
+
+
+class EspeakBackend(TTSBackend):
+    """Local espeak-ng engine - robotic, but real speech and fully offline"""
+
+    name = 'espeak'
+    extension = 'wav'
+
+    VOICES = {
+        'narrator': ('en-us+m3', 150),
+        'george': ('en-us+m1', 165),
+        'matilda': ('en-us+f3', 165),
+        'moondog': ('en-us+m7', 155),
+    }
+
+    def __init__(self, binary=None):
+        self.binary = binary or shutil.which('espeak-ng') or shutil.which('espeak')
+
+    def voice_mappings(self):
+        return {character: voice for character, (voice, _) in self.VOICES.items()}
+
+    def synthesize(self, text, character, ssml=False):
+        if not self.binary:
+            raise TTSError("espeak-ng is not installed")
+
+        voice, speed = self.VOICES.get(character, self.VOICES['narrator'])
+        command = [self.binary, '--stdout', '-v', voice, '-s', str(speed)]
+        if ssml:
+            command += ['-m', f'<speak>{text}</speak>']
+        else:
+            command.append(text)
+        result = subprocess.run(command, capture_output=True, check=False)
+        if result.returncode != 0 or not result.stdout:
+            raise TTSError(result.stderr.decode(errors='replace').strip() or "espeak-ng produced no audio")
+        return result.stdout
+
+    def synthesize_pcm(self, text, character):
+        return wav_to_pcm(self.synthesize(text, character, ssml=bool(BREAK_PATTERN.search(text))))
+
+
+class ToneBackend(TTSBackend):
+    """Deterministic stand-in voice: one tone burst per word.
+
+    Output depends only on (text, character), so repeated runs produce
+    byte-identical files. Word lengths and pauses roughly follow real speech
+    (longer words -> longer bursts, punctuation -> longer gaps), which keeps
+    durations and silence-based splitting realistic in tests.
+    """
+
+    name = 'tone'
+    extension = 'wav'
+
+    SAMPLE_RATE = 22050
+    BASE_PITCH = {'narrator': 140.0, 'george': 180.0, 'matilda': 260.0, 'moondog': 210.0}
+    MS_PER_LETTER = 55
+    WORD_GAP_MS = 70
+    PAUSE_MS = 250
+
+    def voice_mappings(self):
+        return {character: f"tone-{int(pitch)}hz" for character, pitch in self.BASE_PITCH.items()}
+
+    def word_pitch(self, word, character):
+        """Stable pitch per word, around the character's base pitch"""
+        digest = hashlib.md5(f"{word}_{character}".encode()).digest()
+        return self.BASE_PITCH.get(character, 150.0) * (0.85 + digest[0] / 255 * 0.3)
+
+    def render(self, text, character):
+        """Return raw 16-bit mono PCM for text"""
+        rate = self.SAMPLE_RATE
+        frames = bytearray()
+
+        def silence(ms):
+            frames.extend(b'\x00\x00' * int(rate * ms / 1000))
+
+        words = []
+        for index, part in enumerate(BREAK_PATTERN.split(text)):
+            # split() yields text, seconds, unit, text, ... around each break
+            if index % 3 == 0:
+                words.extend(part.split())
+            elif index % 3 == 1:
+                words.append(float(part))
+            else:
+                words[-1] *= 1000 if part == 's' else 1
+
+        for word in words:
+            if isinstance(word, float):
+                silence(word)
+                continue
+            letters = sum(1 for ch in word if ch.isalnum())
+            if not letters:
+                continue
+            pitch = self.word_pitch(word, character)
+            count = int(rate * (80 + letters * self.MS_PER_LETTER) / 1000)
+            fade = max(1, min(count // 4, int(rate * 0.01)))
+            for i in range(count):
+                envelope = min(1.0, i / fade, (count - i) / fade)
+                sample = int(12000 * envelope * math.sin(2 * math.pi * pitch * i / rate))
+                frames.extend(struct.pack('<h', sample))
+            silence(self.PAUSE_MS if word[-1] in '.!?,;:' else self.WORD_GAP_MS)
+
+        return bytes(frames)
+
+    def synthesize(self, text, character):
+        samples = self.render(text, character)
+        if not samples:
+            raise TTSError("Nothing to say")
+        return pcm_to_wav(samples, self.SAMPLE_RATE)
+
+    def synthesize_pcm(self, text, character):
+        return self.render(text, character), self.SAMPLE_RATE
+
+
+BACKENDS = {
+    'elevenlabs': ElevenLabsBackend,
+    'espeak': EspeakBackend,
+    'tone': ToneBackend,
+}
+
+
+def get_backend(name, **kwargs):
+    """Create a backend by name"""
+    try:
+        backend_class = BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown TTS backend '{name}' (choose from {', '.join(BACKENDS)})")
+    return backend_class(**kwargs)